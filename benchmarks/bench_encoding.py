@@ -0,0 +1,57 @@
+"""Size and throughput of envelope encodings: pretty JSON vs deterministic CBOR.
+
+    python benchmarks/bench_encoding.py --count 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from octp.core import cbor
+from octp.core.envelope import OCTPEnvelope
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "valid_envelope.json"
+
+
+def rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    envelope = OCTPEnvelope.model_validate_json(FIXTURE.read_bytes())
+    data = envelope.model_dump(mode="json")
+    pretty = envelope.model_dump_json(indent=2).encode()
+    compact = envelope.model_dump_json().encode()
+    binary = cbor.dumps(data)
+    assert OCTPEnvelope.model_validate(cbor.loads(binary)) == envelope
+
+    print("size (bytes)")
+    print(f"  json pretty  : {len(pretty):>6}")
+    print(f"  json compact : {len(compact):>6}")
+    print(f"  cbor         : {len(binary):>6}")
+
+    n = args.count
+    rows = [
+        ("encode json pretty", lambda: envelope.model_dump_json(indent=2)),
+        ("encode cbor", lambda: cbor.dumps(envelope.model_dump(mode="json"))),
+        ("cbor only (dict)", lambda: cbor.dumps(data)),
+        ("decode json", lambda: OCTPEnvelope.model_validate_json(pretty)),
+        ("decode cbor", lambda: OCTPEnvelope.model_validate(cbor.loads(binary))),
+        ("cbor only (dict)", lambda: cbor.loads(binary)),
+    ]
+    print(f"\nthroughput (envelopes/s, n={n})")
+    for label, fn in rows:
+        print(f"  {label:<20}: {rate(fn, n):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
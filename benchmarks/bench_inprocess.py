@@ -0,0 +1,62 @@
+"""Repeated mypy/bandit runs: subprocess per call vs. persistent workers.
+
+python benchmarks/bench_inprocess.py --repeat 5 --path src/octp
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import time
+
+from octp.verification.inprocess import (
+    ToolPool,
+    is_importable,
+    run_bandit,
+    run_mypy,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--path", default="src/octp")
+    args = parser.parse_args()
+
+    tools = [
+        ("mypy", run_mypy, ["--", args.path], ["mypy", "--", args.path]),
+        (
+            "bandit",
+            run_bandit,
+            [args.path],
+            ["bandit", "-r", "-q", "-ll", "--", args.path],
+        ),
+    ]
+    pool = ToolPool()
+    try:
+        for name, driver, driver_args, command in tools:
+            if not is_importable(name):
+                print(f"{name:<7} not installed, skipped")
+                continue
+            pool.call(driver, ".", driver_args)  # start and warm the worker
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                pool.call(driver, ".", driver_args)
+            warm = (time.perf_counter() - start) / args.repeat
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                subprocess.run(command, capture_output=True)
+            cold = (time.perf_counter() - start) / args.repeat
+
+            print(
+                f"{name:<7} subprocess {cold * 1000:7.0f} ms/run   "
+                f"in-process {warm * 1000:7.0f} ms/run   ({cold / warm:.1f}x)"
+            )
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Policy evaluation throughput over pre-parsed envelopes.
+
+    python benchmarks/bench_policy.py --count 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from octp.core.envelope import OCTPEnvelope
+from octp.core.policy import Policy
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "valid_envelope.json"
+
+STRICT = {
+    "policy": {
+        "minimum_review_level": "moderate_review",
+        "block_on_failed_tests": True,
+        "allow_unreviewed_ai": False,
+    },
+    "identity": {"require_signed_envelope": True},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500_000)
+    args = parser.parse_args()
+
+    data = json.loads(FIXTURE.read_text())
+    levels = ["none", "glance", "moderate_review", "substantial_modification"]
+    variants = []
+    for level in levels:
+        data["provenance"]["human_review_level"] = level
+        variants.append(OCTPEnvelope.model_validate(data))
+    envelopes = [variants[i % len(variants)] for i in range(args.count)]
+
+    policy = Policy.from_config(STRICT).compile()
+    start = time.perf_counter()
+    results = policy.evaluate_many(envelopes)
+    elapsed = time.perf_counter() - start
+    rejected = sum(1 for r in results if r)
+    print(f"evaluated {args.count:,} envelopes in {elapsed:.2f}s")
+    print(f"  {args.count / elapsed:,.0f} envelopes/s, {rejected:,} rejected")
+
+
+if __name__ == "__main__":
+    main()
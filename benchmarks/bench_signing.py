@@ -0,0 +1,48 @@
+"""Sign and verify throughput of ES256 versus EdDSA (Ed25519) keys.
+
+    python benchmarks/bench_signing.py --count 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+
+from octp.identity.keymanager import (
+    ALGORITHMS,
+    generate_private_key,
+    sign_with_key,
+    verify_with_key,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5_000)
+    args = parser.parse_args()
+
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(args.count)]
+    for algorithm in ALGORITHMS:
+        private_key = generate_private_key(algorithm)
+        public_key = private_key.public_key()
+
+        start = time.perf_counter()
+        signatures = [sign_with_key(h, private_key) for h in hashes]
+        sign_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ok = all(
+            verify_with_key(h, s, public_key, algorithm)
+            for h, s in zip(hashes, signatures)
+        )
+        verify_elapsed = time.perf_counter() - start
+        assert ok, f"{algorithm} signatures failed to verify"
+
+        print(f"{algorithm:6} {len(signatures[0]):3} byte signatures (base64)")
+        print(f"  sign   {args.count / sign_elapsed:>10,.0f}/s")
+        print(f"  verify {args.count / verify_elapsed:>10,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
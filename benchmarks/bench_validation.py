@@ -0,0 +1,73 @@
+"""Envelope validation throughput: json.loads + model_validate vs the bytes path.
+
+    python benchmarks/bench_validation.py --count 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from octp.core.envelope import OCTPEnvelope
+from octp.core.validator import validate_envelope_array, validate_many
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "valid_envelope.json"
+
+
+def make_blobs(count: int) -> list[bytes]:
+    data = json.loads(FIXTURE.read_text())
+    blobs = []
+    for i in range(count):
+        data["contribution_id"] = f"00000000-0000-0000-0000-{i:012d}"
+        blobs.append(json.dumps(data, indent=2).encode())
+    return blobs
+
+
+def timed(label: str, fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34}: {elapsed:6.2f}s  {count / elapsed:>10,.0f}/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    blobs = make_blobs(args.count)
+    array = b"[" + b",".join(blobs) + b"]"
+
+    # Streaming: each envelope is dropped once validated
+    def decode_twice() -> None:
+        for blob in blobs:
+            OCTPEnvelope.model_validate(json.loads(blob))
+
+    def bytes_path() -> None:
+        for result in validate_many(blobs):
+            assert result.valid
+
+    def decode_twice_retained() -> None:
+        envelopes = [OCTPEnvelope.model_validate(json.loads(b)) for b in blobs]
+        assert len(envelopes) == args.count
+
+    # Batch: every envelope is kept, as a batch verifier would
+    def batch_path() -> None:
+        assert all(r.valid for r in validate_envelope_array(array))
+
+    print(f"validating {args.count:,} envelopes, streaming")
+    baseline = timed("json.loads + model_validate", decode_twice, args.count)
+    single = timed("validate_many", bytes_path, args.count)
+    print(f"  speedup: {baseline / single:.2f}x")
+
+    print(f"\nvalidating {args.count:,} envelopes, all kept in memory")
+    baseline = timed("json.loads + model_validate", decode_twice_retained, args.count)
+    batch = timed("validate_envelope_array", batch_path, args.count)
+    print(f"  speedup: {baseline / batch:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Load test for the OCTP verification server (`octp serve`).
+
+Starts a local server in-process unless --port or --socket points at one
+that is already running, then hammers POST /verify (or /verify/batch)
+from several keep-alive connections and reports throughput and latency.
+
+    python benchmarks/load_test_server.py --clients 8 --requests 2000
+    python benchmarks/load_test_server.py --socket /tmp/octp.sock --batch 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import http.client
+import json
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from octp.core.envelope import OCTPEnvelope
+from octp.identity.keyring import KeyRing
+from octp.integrity.hasher import hash_payload
+from octp.server.verify import VerifyService, create_verify_server
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "valid_envelope.json"
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str) -> None:
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def signed_envelope() -> tuple[dict, KeyRing]:
+    """The test fixture, re-signed with a throwaway key."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    envelope = OCTPEnvelope.model_validate_json(FIXTURE.read_bytes())
+    payload_hash = hash_payload(envelope.to_signable_dict())
+    signature = key.sign(payload_hash.encode(), ec.ECDSA(hashes.SHA256()))
+    assert envelope.integrity is not None
+    envelope.integrity.payload_hash = payload_hash
+    envelope.integrity.developer_signature = base64.b64encode(signature).decode()
+
+    keyring = KeyRing()
+    keyring.add(
+        envelope.provenance.developer_id,
+        key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode(),
+    )
+    return envelope.model_dump(mode="json"), keyring
+
+
+def client(connect, path: str, body: bytes, count: int, latencies: list) -> None:
+    conn = connect()
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            conn.request("POST", path, body=body)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, help="Port of a running server")
+    parser.add_argument("--socket", help="Unix socket of (or for) the server")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000, help="Per client")
+    parser.add_argument("--batch", type=int, default=0, help="Envelopes per batch")
+    args = parser.parse_args()
+
+    envelope, keyring = signed_envelope()
+    server = None
+    socket_path = args.socket
+    port = args.port
+    if port is None and (socket_path is None or not Path(socket_path).exists()):
+        if socket_path is None:
+            socket_path = str(Path(tempfile.mkdtemp()) / "octp.sock")
+        server = create_verify_server(
+            VerifyService(keyring), socket_path=Path(socket_path)
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def connect() -> http.client.HTTPConnection:
+        if port is not None:
+            return http.client.HTTPConnection("127.0.0.1", port)
+        return UnixHTTPConnection(socket_path)
+
+    if args.batch:
+        path, body = "/verify/batch", json.dumps([envelope] * args.batch).encode()
+    else:
+        path, body = "/verify", json.dumps(envelope).encode()
+
+    latencies: list[float] = []
+    threads = [
+        threading.Thread(
+            target=client, args=(connect, path, body, args.requests, latencies)
+        )
+        for _ in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    requests = len(latencies)
+    envelopes = requests * max(args.batch, 1)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"requests   : {requests} over {args.clients} keep-alive connections")
+    print(f"throughput : {requests / elapsed:,.0f} req/s")
+    print(f"             {envelopes / elapsed:,.0f} envelopes/s")
+    print(f"latency    : p50 {quantiles[49] * 1000:.2f} ms")
+    print(f"             p99 {quantiles[98] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from octp.core import cbor
+from octp.core.envelope import AnalysisResult, ProvenanceMethod, ReviewLevel
+from octp.output.archive import MAGIC, ArchiveReader
+from octp.output.encoding import is_cbor
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+# Enum columns store the member's position in these tuples
+METHODS = tuple(m.value for m in ProvenanceMethod)
+REVIEW_LEVELS = tuple(level.value for level in ReviewLevel)
+ANALYSIS_RESULTS = tuple(r.value for r in AnalysisResult)
+
+_METHOD_CODES = {v: i for i, v in enumerate(METHODS)}
+_REVIEW_CODES = {v: i for i, v in enumerate(REVIEW_LEVELS)}
+_ANALYSIS_CODES = {v: i for i, v in enumerate(ANALYSIS_RESULTS)}
+
+# tests_passed is tri-state
+TESTS_NOT_RUN, TESTS_FAILED, TESTS_PASSED = -1, 0, 1
+
+
+class StringDictionary:
+    """Interns repeated strings (repositories, developers) as small ints."""
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class EnvelopeColumns:
+    """Envelope fields relevant to analytics, stored column-wise.
+
+    Strings are dictionary-encoded, enums are small ints and timestamps
+    are int64 epoch seconds, so a million envelopes take a few tens of
+    megabytes. Columns are ``array.array``; ``column()`` returns a NumPy
+    view when NumPy is installed.
+    """
+
+    def __init__(self) -> None:
+        self.repositories = StringDictionary()
+        self.developers = StringDictionary()
+        self.repository = array("I")
+        self.developer = array("I")
+        self.method = array("B")
+        self.review_level = array("B")
+        self.tests_passed = array("b")
+        self.static_analysis = array("B")
+        self.dependency_check = array("B")
+        self.timestamp = array("q")
+        self.skipped = 0  # documents that were not envelopes
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(self, doc: dict[str, Any]) -> None:
+        """Append one envelope given as its JSON-mode dict."""
+        provenance = doc["provenance"]
+        verification = doc["verification"]
+        # Convert everything before appending so a bad document leaves no
+        # partial row behind
+        row = (
+            self.repositories.code(doc["repository"]),
+            self.developers.code(provenance["developer_id"]),
+            _METHOD_CODES[provenance["method"]],
+            _REVIEW_CODES[provenance["human_review_level"]],
+            {None: TESTS_NOT_RUN, False: TESTS_FAILED, True: TESTS_PASSED}[
+                verification.get("tests_passed")
+            ],
+            _ANALYSIS_CODES[verification["static_analysis"]],
+            _ANALYSIS_CODES[verification["dependency_check"]],
+            int(datetime.fromisoformat(doc["timestamp"]).timestamp()),
+        )
+        self.repository.append(row[0])
+        self.developer.append(row[1])
+        self.method.append(row[2])
+        self.review_level.append(row[3])
+        self.tests_passed.append(row[4])
+        self.static_analysis.append(row[5])
+        self.dependency_check.append(row[6])
+        self.timestamp.append(row[7])
+
+    def extend(self, documents: Iterable[bytes]) -> None:
+        """Append raw JSON or CBOR envelope documents, skipping non-envelopes."""
+        for data in documents:
+            try:
+                doc = cbor.loads(data) if is_cbor(data) else json.loads(data)
+                self.append(doc)
+            except (ValueError, KeyError, TypeError):
+                self.skipped += 1
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[Path]) -> EnvelopeColumns:
+        columns = cls()
+        columns.extend(iter_documents(paths))
+        return columns
+
+    def column(self, name: str) -> Any:
+        """A column as a NumPy array if available, else the ``array.array``."""
+        values = getattr(self, name)
+        return np.frombuffer(values, dtype=values.typecode) if np else values
+
+
+def iter_documents(paths: Iterable[Path]) -> Iterator[bytes]:
+    """Raw envelope documents from files, directories and archives."""
+    for path in paths:
+        if path.is_dir():
+            for pattern in ("*.json", "*.cbor", "*.octp"):
+                yield from iter_documents(sorted(path.rglob(pattern)))
+            continue
+        with open(path, "rb") as f:
+            is_archive = f.read(len(MAGIC)) == MAGIC
+        if is_archive:
+            with ArchiveReader(path) as reader:
+                yield from reader.records()
+        else:
+            yield path.read_bytes()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Any, Sequence
+
+from octp.analytics.columns import (
+    METHODS,
+    REVIEW_LEVELS,
+    TESTS_NOT_RUN,
+    TESTS_PASSED,
+    EnvelopeColumns,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+WEEK_SECONDS = 7 * 24 * 3600
+# 1970-01-01 was a Thursday; weeks start on Monday 1970-01-05
+_MONDAY_OFFSET = 4 * 24 * 3600
+
+GROUP_KEYS = ("repository", "developer", "week")
+
+
+def group_counts(
+    keys: Sequence[Sequence[int]], mask: Sequence[bool] | Any = None
+) -> dict[tuple[int, ...], int]:
+    """Count rows per distinct combination of integer key columns.
+
+    With NumPy the key columns are stacked and counted with a sort-based
+    ``np.unique``, so memory grows with the rows rather than with the
+    product of the keys' ranges; otherwise rows are counted with a Counter.
+    """
+    if not keys or not len(keys[0]):
+        return {}
+    if np is not None:
+        stacked = np.column_stack([np.asarray(k, dtype=np.int64) for k in keys])
+        if mask is not None:
+            stacked = stacked[np.asarray(mask, dtype=bool)]
+        if not len(stacked):
+            return {}
+        groups, counts = np.unique(stacked, axis=0, return_counts=True)
+        return {
+            tuple(int(v) for v in group): int(count)
+            for group, count in zip(groups, counts)
+        }
+    rows = zip(*keys)
+    if mask is not None:
+        rows = (row for row, keep in zip(rows, mask) if keep)
+    return dict(Counter(rows))
+
+
+def week_codes(columns: EnvelopeColumns) -> Any:
+    """Week number of each envelope (weeks since Monday 1970-01-05)."""
+    ts = columns.column("timestamp")
+    if np is not None:
+        return (ts - _MONDAY_OFFSET) // WEEK_SECONDS
+    return [(t - _MONDAY_OFFSET) // WEEK_SECONDS for t in ts]
+
+
+def week_start(code: int) -> date:
+    seconds = code * WEEK_SECONDS + _MONDAY_OFFSET
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).date()
+
+
+def _group_column(columns: EnvelopeColumns, by: str) -> Any:
+    if by == "week":
+        return week_codes(columns)
+    if by in ("repository", "developer"):
+        return columns.column(by)
+    raise ValueError(f"Unknown grouping: {by}. Available: {', '.join(GROUP_KEYS)}")
+
+
+def _label(columns: EnvelopeColumns, by: str, code: int) -> str:
+    if by == "week":
+        return week_start(code).isoformat()
+    dictionary = columns.repositories if by == "repository" else columns.developers
+    return dictionary.values[code]
+
+
+def method_share(
+    columns: EnvelopeColumns,
+    method: str = "ai_generated_unreviewed",
+    by: Sequence[str] = ("repository", "week"),
+) -> list[tuple[tuple[str, ...], int, int, float]]:
+    """Share of envelopes declaring ``method`` per group.
+
+    Returns ``(group labels, matching, total, share)`` rows sorted by group.
+    """
+    keys = [_group_column(columns, b) for b in by]
+    target = METHODS.index(method)
+    method_col = columns.column("method")
+    if np is not None:
+        is_method = method_col == target
+    else:
+        is_method = [m == target for m in method_col]
+    totals = group_counts(keys)
+    matching = group_counts(keys, mask=is_method)
+    rows = []
+    for group, total in sorted(totals.items()):
+        hits = matching.get(group, 0)
+        labels = tuple(_label(columns, b, code) for b, code in zip(by, group))
+        rows.append((labels, hits, total, hits / total))
+    return rows
+
+
+def review_levels(
+    columns: EnvelopeColumns, by: str = "developer"
+) -> dict[str, dict[str, int]]:
+    """Distribution of declared review levels per group."""
+    counts = group_counts([_group_column(columns, by), columns.column("review_level")])
+    result: dict[str, dict[str, int]] = {}
+    for (group, level), count in sorted(counts.items()):
+        labels = result.setdefault(_label(columns, by, group), {})
+        labels[REVIEW_LEVELS[level]] = count
+    return result
+
+
+def pass_rate(
+    columns: EnvelopeColumns, by: str = "repository"
+) -> list[tuple[str, int, int, float]]:
+    """Test pass rate per group, over envelopes whose tests actually ran.
+
+    Returns ``(group, passed, run, rate)`` rows sorted by group.
+    """
+    key = _group_column(columns, by)
+    tests = columns.column("tests_passed")
+    if np is not None:
+        ran, passed = tests != TESTS_NOT_RUN, tests == TESTS_PASSED
+    else:
+        ran = [t != TESTS_NOT_RUN for t in tests]
+        passed = [t == TESTS_PASSED for t in tests]
+    run_counts = group_counts([key], mask=ran)
+    pass_counts = group_counts([key], mask=passed)
+    rows = []
+    for (group,), run in sorted(run_counts.items()):
+        hits = pass_counts.get((group,), 0)
+        rows.append((_label(columns, by, group), hits, run, hits / run))
+    return rows
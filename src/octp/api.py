@@ -0,0 +1,422 @@
+"""Programmatic interface to octp for embedding in other services.
+
+Every entry point is a coroutine that returns typed results and never
+writes to the console. Blocking work (git, tool subprocesses, hashing,
+signature checks) runs off the event loop, so a service can sign and
+verify from its own loop without spawning ``octp`` per call::
+
+    from octp import api
+
+    result = await api.sign("path/to/repo", provenance, output=None)
+    checked = await api.verify_many(blobs, keyring=keyring)
+
+The ``octp`` command line is a thin layer over these functions. The
+blocking halves of ``sign``, ``prepare_repo`` and ``sign_checked``, are
+exposed for callers that run the checks themselves, as ``octp sign
+--workspace`` does with one pool shared by every repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Union
+
+import git
+
+from octp.core.builder import build_envelope
+from octp.core.config import load_config
+from octp.core.envelope import OCTPEnvelope
+from octp.core.policy import CompiledPolicy, Violation
+from octp.core.validator import (
+    ValidationIssue,
+    ValidationResult,
+    check_integrity,
+    validate_envelope_bytes,
+)
+from octp.git.notes import add_note
+from octp.git.reader import RepoInfo, read_repo, state_dir
+from octp.identity.keymanager import ensure_keypair
+from octp.identity.keyring import KeyRing
+from octp.identity.resolver import resolve_developer_id
+from octp.log.client import LogClient
+from octp.metrics import METRICS, exporter_from_config
+from octp.output.encoding import FORMATS, encode_envelope, envelope_digest
+from octp.output.writer import write_envelope
+from octp.verification.artifacts import ARTIFACTS_DIR, ArtifactStore, gc_limits
+from octp.verification.base import CheckResult
+from octp.verification.cache import cache_from_config
+from octp.verification.registry import DEFAULT_PROFILE, start_all
+
+__all__ = [
+    "PreparedRepo",
+    "SignResult",
+    "VerifyResult",
+    "prepare_repo",
+    "run_checks",
+    "sign",
+    "sign_checked",
+    "verify",
+    "verify_many",
+]
+
+# Path to an envelope file, its raw JSON/CBOR bytes, or a parsed envelope
+EnvelopeSource = Union[str, Path, bytes, OCTPEnvelope]
+# Provenance declaration, or something that produces one once checks start
+ProvenanceSource = Union[
+    dict[str, Any],
+    Callable[[], Union[dict[str, Any], Awaitable[dict[str, Any]]]],
+]
+OnResult = Callable[[str, CheckResult], None]
+
+# Envelopes verified per worker-thread call in verify_many
+VERIFY_CHUNK = 256
+
+
+@dataclass
+class SignResult:
+    envelope: OCTPEnvelope
+    repo: RepoInfo
+    developer_id: str
+    results: dict[str, CheckResult]
+    output: Path | None = None  # where the envelope was written, if anywhere
+    warnings: list[str] = field(default_factory=list)  # degraded, not failed
+    log_index: int | None = None  # entry in the [log] transparency log
+    noted: bool = False  # attached to the commit as a git note
+
+
+@dataclass
+class PreparedRepo:
+    """A repository read and configured for signing (see prepare_repo)."""
+
+    repo: RepoInfo
+    developer_id: str
+    config: dict[str, Any]
+    check_kwargs: dict[str, Any]  # run_all arguments for its checks
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass
+class VerifyResult:
+    valid: bool  # parsed, hash intact and signature not contradicted
+    reason: str = ""
+    envelope: OCTPEnvelope | None = None
+    signature_verified: bool | None = None  # None = no public key available
+    errors: list[ValidationIssue] = field(default_factory=list)  # parse errors
+    violations: list[Violation] = field(default_factory=list)  # policy rules
+
+    @property
+    def accepted(self) -> bool:
+        """Valid and, when a policy was given, compliant."""
+        return self.valid and not self.violations
+
+
+def _check_kwargs(
+    root: Path,
+    config: dict[str, Any],
+    developer_id: str,
+    use_cache: bool,
+    warnings: list[str],
+) -> dict[str, Any]:
+    """run_all arguments derived from the repository's config."""
+    runners = config.get("runners", {})
+    cache = None
+    if use_cache:
+        try:
+            cache = cache_from_config(config, state_dir(root), developer_id)
+        except (OSError, ValueError) as e:
+            warnings.append(f"Result cache disabled: {e}")
+    return {
+        "cache": cache,
+        "in_process": bool(runners.get("in_process", False)),
+        "options": runners,
+        "artifacts": ArtifactStore(state_dir(root) / ARTIFACTS_DIR),
+    }
+
+
+def _load_config(root: Path, warnings: list[str]) -> dict[str, Any]:
+    try:
+        return load_config(repo_root=root)
+    except ValueError as e:
+        warnings.append(f"Ignoring config: {e}")
+        return {}
+
+
+def prepare_repo(repo_root: str | Path, use_cache: bool = True) -> PreparedRepo:
+    """Read a repository and its config ahead of running its checks.
+
+    Blocking. Raises RuntimeError outside a git repository; problems with
+    the config or the cache become warnings.
+    """
+    repo_info = read_repo(Path(repo_root))
+    developer_id = resolve_developer_id(repo_info.root)
+    warnings: list[str] = []
+    config = _load_config(repo_info.root, warnings)
+    kwargs = _check_kwargs(repo_info.root, config, developer_id, use_cache, warnings)
+    return PreparedRepo(repo_info, developer_id, config, kwargs, warnings)
+
+
+def sign_checked(
+    prepared: PreparedRepo,
+    provenance_data: dict[str, Any],
+    results: dict[str, CheckResult],
+    *,
+    output: str | Path | None = None,
+    format: str = "json",
+    notes: bool = False,
+) -> SignResult:
+    """Build and sign the envelope for finished checks, then publish it.
+
+    Blocking; ``sign`` runs it off the event loop and ``octp sign
+    --workspace`` calls it for each repository. The envelope is written
+    to ``output`` and attached as a note as asked, appended to the
+    ``[log]`` and old reports are cleaned up; failures of the last three
+    are warnings.
+    """
+    repo_info, config = prepared.repo, prepared.config
+    warnings = list(prepared.warnings)
+    envelope = build_envelope(
+        repo_info=repo_info,
+        developer_id=prepared.developer_id,
+        provenance_data=provenance_data,
+        check_results=results,
+    )
+    path = log_index = None
+    noted = False
+    if output is not None:
+        path = Path(output)
+        write_envelope(envelope, path, format)
+    if notes:
+        try:
+            add_note(
+                encode_envelope(envelope, format),
+                commit=repo_info.commit_hash,
+                path=repo_info.root,
+            )
+            noted = True
+        except git.GitCommandError as e:
+            warnings.append(f"Could not attach the envelope as a note: {e}")
+    log_url = config.get("log", {}).get("url")
+    if log_url:
+        try:
+            log_index = LogClient(log_url).append(envelope_digest(envelope))
+        except (OSError, KeyError, ValueError) as e:
+            warnings.append(f"Transparency log append failed: {e}")
+    try:
+        prepared.check_kwargs["artifacts"].gc(*gc_limits(config))
+    except (OSError, ValueError) as e:
+        warnings.append(f"Report cleanup skipped: {e}")
+    return SignResult(
+        envelope,
+        repo_info,
+        prepared.developer_id,
+        results,
+        path,
+        warnings,
+        log_index,
+        noted,
+    )
+
+
+async def run_checks(
+    repo_root: str | Path = ".",
+    profile: str = DEFAULT_PROFILE,
+    *,
+    runner_names: list[str] | None = None,
+    use_cache: bool = True,
+    on_result: OnResult | None = None,
+) -> dict[str, CheckResult]:
+    """Run a profile's checks on a repository, as ``octp sign`` would.
+
+    Raises RuntimeError outside a git repository and ValueError for an
+    unknown profile.
+    """
+    prepared = await asyncio.to_thread(prepare_repo, repo_root, use_cache)
+    future = start_all(
+        prepared.repo.root,
+        profile=profile,
+        runner_names=runner_names,
+        on_result=on_result,
+        **prepared.check_kwargs,
+    )
+    return await asyncio.wrap_future(future)
+
+
+async def sign(
+    repo_root: str | Path = ".",
+    provenance: ProvenanceSource | None = None,
+    *,
+    profile: str = DEFAULT_PROFILE,
+    output: str | Path | None = None,
+    format: str = "json",
+    notes: bool = False,
+    use_cache: bool = True,
+    on_start: Callable[[RepoInfo, str], None] | None = None,
+    on_result: OnResult | None = None,
+) -> SignResult:
+    """Run checks and build a signed envelope for the repository's HEAD.
+
+    Args:
+        repo_root: Any path inside the repository
+        provenance: The provenance declaration (see ``octp sign``), or a
+            function returning one. It is called once checks are running,
+            so it can take its time: a plain function runs on the event
+            loop's thread (the CLI prompts on the terminal this way), an
+            async one is awaited.
+        profile: Runner profile
+        output: Also write the envelope here, relative to the current
+            directory; not written when None
+        format: ``json`` or ``cbor`` for ``output`` and ``notes``
+        notes: Also attach the envelope to HEAD as a git note
+        use_cache: Reuse and record results in the configured caches
+        on_start: Called with the repository and developer id before any
+            check starts
+        on_result: Called from a worker thread with each check's result
+
+    With ``[log] url`` configured, the envelope's digest is appended to
+    that transparency log and its index returned in ``log_index``. With
+    ``[metrics]`` configured, ``octp.metrics.METRICS`` is exported.
+
+    Raises RuntimeError outside a git repository and ValueError for bad
+    arguments. Degraded features (e.g. an unusable cache) are reported in
+    ``SignResult.warnings`` instead.
+    """
+    if provenance is None:
+        raise ValueError("A provenance declaration is required")
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format: {format}. Available: {', '.join(FORMATS)}")
+
+    await asyncio.to_thread(ensure_keypair)
+    prepared = await asyncio.to_thread(prepare_repo, repo_root, use_cache)
+    if on_start is not None:
+        on_start(prepared.repo, prepared.developer_id)
+
+    # A daemon thread rather than the loop's executor: an interrupted caller
+    # must not wait for checks it no longer needs
+    checks = start_all(
+        prepared.repo.root,
+        profile=profile,
+        on_result=on_result,
+        **prepared.check_kwargs,
+    )
+
+    try:
+        if callable(provenance):
+            provenance_data = provenance()
+            if inspect.isawaitable(provenance_data):
+                provenance_data = await provenance_data
+        else:
+            provenance_data = provenance
+        results = await asyncio.wrap_future(checks)
+    except BaseException:
+        checks.cancel()
+        raise
+
+    result = await asyncio.to_thread(
+        sign_checked,
+        prepared,
+        provenance_data,
+        results,
+        output=output,
+        format=format,
+        notes=notes,
+    )
+    exporter = exporter_from_config(prepared.config)
+    if exporter is not None:
+        try:
+            await asyncio.to_thread(exporter.export, METRICS)
+        except (OSError, ValueError) as e:
+            result.warnings.append(f"Metrics export failed: {e}")
+    return result
+
+
+def _verify_one(
+    source: EnvelopeSource,
+    keyring: KeyRing | None,
+    policy: CompiledPolicy | None,
+) -> VerifyResult:
+    if isinstance(source, OCTPEnvelope):
+        parsed = ValidationResult(source)
+    else:
+        if isinstance(source, (str, Path)):
+            try:
+                source = Path(source).read_bytes()
+            except OSError as e:
+                return VerifyResult(False, f"Could not read envelope: {e}")
+        parsed = validate_envelope_bytes(source)
+    if parsed.envelope is None:
+        return VerifyResult(
+            False,
+            f"Could not parse envelope: {parsed.summary()}",
+            errors=parsed.errors,
+        )
+    envelope = parsed.envelope
+    integrity = check_integrity(envelope, keyring)
+    result = VerifyResult(
+        integrity.valid,
+        integrity.reason,
+        envelope,
+        integrity.signature_verified,
+    )
+    if integrity.valid and policy is not None:
+        result.violations = policy.evaluate(envelope)
+    return result
+
+
+def _count(result: VerifyResult) -> VerifyResult:
+    outcome = (
+        "invalid"
+        if not result.valid
+        else "violations"
+        if result.violations
+        else "accepted"
+    )
+    METRICS.inc("octp_verify_envelopes_total", result=outcome)
+    return result
+
+
+async def verify(
+    source: EnvelopeSource,
+    keyring: KeyRing | None = None,
+    policy: CompiledPolicy | None = None,
+) -> VerifyResult:
+    """Check an envelope's payload hash and, with a keyring, its signature.
+
+    With a compiled policy, rule violations are reported too. Problems
+    with the envelope are part of the result, never raised.
+    """
+    start = time.perf_counter()
+    result = await asyncio.to_thread(_verify_one, source, keyring, policy)
+    METRICS.observe("octp_verify_duration_seconds", time.perf_counter() - start)
+    return _count(result)
+
+
+async def verify_many(
+    sources: Iterable[EnvelopeSource],
+    keyring: KeyRing | None = None,
+    policy: CompiledPolicy | None = None,
+    concurrency: int = 4,
+) -> list[VerifyResult]:
+    """Verify many envelopes; results keep the input order.
+
+    Envelopes are verified in chunks on up to ``concurrency`` threads,
+    so the event loop stays responsive during large batches.
+    """
+    start = time.perf_counter()
+    items = list(sources)
+    chunks = [items[i : i + VERIFY_CHUNK] for i in range(0, len(items), VERIFY_CHUNK)]
+    limit = asyncio.Semaphore(max(concurrency, 1))
+
+    def verify_chunk(chunk: list[EnvelopeSource]) -> list[VerifyResult]:
+        return [_count(_verify_one(source, keyring, policy)) for source in chunk]
+
+    async def run(chunk: list[EnvelopeSource]) -> list[VerifyResult]:
+        async with limit:
+            return await asyncio.to_thread(verify_chunk, chunk)
+
+    done = await asyncio.gather(*(run(chunk) for chunk in chunks))
+    METRICS.observe("octp_verify_duration_seconds", time.perf_counter() - start)
+    return [result for chunk_results in done for result in chunk_results]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.output.archive import ArchiveError, ArchiveReader, ArchiveWriter
+from octp.output.encoding import FORMATS, decode_envelope, encode_envelope
+
+console = Console()
+
+archive_app = typer.Typer(
+    help="Pack envelopes into an indexed archive and read them back",
+    no_args_is_help=True,
+)
+
+
+def _envelope_files(paths: list[Path]) -> list[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.json")))
+            files.extend(sorted(path.rglob("*.cbor")))
+        else:
+            files.append(path)
+    return files
+
+
+@archive_app.command("pack")
+def pack_command(
+    archive: Path = typer.Argument(..., help="Archive file to create or append to"),
+    paths: list[Path] = typer.Argument(
+        ..., help="Envelope files or directories containing them"
+    ),
+    no_compress: bool = typer.Option(
+        False, "--no-compress", help="Store blocks uncompressed"
+    ),
+):
+    """Append envelopes to an archive."""
+
+    added = skipped = invalid = 0
+    try:
+        with ArchiveWriter(archive, compress=not no_compress) as writer:
+            for path in _envelope_files(paths):
+                try:
+                    envelope = decode_envelope(path.read_bytes())
+                except Exception:
+                    invalid += 1
+                    continue
+                if writer.add(envelope):
+                    added += 1
+                else:
+                    skipped += 1
+    except ArchiveError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓[/green] Added {added} envelopes to {archive}")
+    if skipped:
+        console.print(f"  [dim]{skipped} already archived[/dim]")
+    if invalid:
+        console.print(f"  [yellow]{invalid} files were not valid envelopes[/yellow]")
+
+
+@archive_app.command("get")
+def get_command(
+    archive: Path = typer.Argument(..., help="Archive file"),
+    key: str = typer.Argument(..., help="contribution_id or commit hash (prefix)"),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write the envelope here instead of stdout"
+    ),
+    format: str = typer.Option("json", "--format", "-f", help="json or cbor"),
+):
+    """Print or extract envelopes by contribution_id or commit hash."""
+
+    if format not in FORMATS:
+        console.print(f"[red]Error:[/red] Unknown format: {format}")
+        raise typer.Exit(1)
+    try:
+        with ArchiveReader(archive) as reader:
+            envelope = reader.get(key)
+            envelopes = [envelope] if envelope else reader.find_commit(key)
+    except (ArchiveError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if not envelopes:
+        console.print(f"[red]Error:[/red] No envelope found for {key}")
+        raise typer.Exit(1)
+
+    if output:
+        if len(envelopes) > 1:
+            console.print(
+                f"[red]Error:[/red] {len(envelopes)} envelopes match {key} — "
+                "use a contribution_id"
+            )
+            raise typer.Exit(1)
+        output.write_bytes(encode_envelope(envelopes[0], format))
+        console.print(f"[green]✓[/green] Wrote {output}")
+        return
+
+    for envelope in envelopes:
+        print(encode_envelope(envelope, "json").decode())
+
+
+@archive_app.command("list")
+def list_command(
+    archive: Path = typer.Argument(..., help="Archive file"),
+):
+    """List archived envelopes without decoding them."""
+
+    try:
+        with ArchiveReader(archive) as reader:
+            for entry in reader.entries():
+                print(f"{entry.contribution_id}  {entry.commit_hash}")
+    except (ArchiveError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.core.config import load_config
+from octp.git.reader import state_dir
+from octp.output.encoding import decode_envelope
+from octp.verification.artifacts import (
+    ARTIFACTS_DIR,
+    ArtifactStore,
+    gc_limits,
+    is_digest,
+)
+
+console = Console()
+
+artifacts_app = typer.Typer(
+    help="Read and clean up stored full tool reports",
+    no_args_is_help=True,
+)
+
+
+def _store() -> ArtifactStore:
+    return ArtifactStore(state_dir() / ARTIFACTS_DIR)
+
+
+@artifacts_app.command("show")
+def show_command(
+    target: str = typer.Argument(
+        ..., help="Runner name from the envelope (e.g. ruff) or a report digest"
+    ),
+    envelope_path: Path = typer.Option(
+        Path(".octp-envelope.json"),
+        "--envelope",
+        "-e",
+        help="Envelope to look the runner's report up in",
+    ),
+):
+    """Print a full tool report."""
+
+    digest = target.removeprefix("sha256:")
+    try:
+        if not is_digest(digest):
+            envelope = decode_envelope(envelope_path.read_bytes())
+            reports = envelope.verification.reports or {}
+            if target not in reports:
+                raise ValueError(f"{envelope_path} has no report for {target!r}")
+            digest = reports[target]
+        report = _store().get(digest)
+    except KeyError:
+        console.print(
+            f"[red]Error:[/red] Report {digest[:12]} is not stored here "
+            "(recorded elsewhere or garbage-collected)"
+        )
+        raise typer.Exit(1)
+    except (OSError, RuntimeError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    sys.stdout.write(report)
+
+
+@artifacts_app.command("gc")
+def gc_command(
+    max_age_days: Optional[float] = typer.Option(
+        None, "--max-age-days", help="Drop reports unused for this long (0 = keep)"
+    ),
+    max_size_mb: Optional[float] = typer.Option(
+        None, "--max-size-mb", help="Then drop the oldest down to this size (0 = any)"
+    ),
+):
+    """Delete old reports. Limits default to the [artifacts] config section."""
+
+    try:
+        store = _store()
+        max_age, max_bytes = gc_limits(load_config())
+        if max_age_days is not None:
+            max_age = max_age_days * 86400 if max_age_days > 0 else None
+        if max_size_mb is not None:
+            max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb > 0 else None
+        removed, freed = store.gc(max_age, max_bytes)
+    except (OSError, RuntimeError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"Removed {removed} reports ({freed / 1024:,.0f} KiB).")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.core.audit import (
+    ArchiveSource,
+    DirectorySource,
+    EnvelopeSource,
+    NotesSource,
+    audit,
+    iter_commits,
+)
+from octp.core.policy import Policy
+from octp.git.notes import NOTES_REF
+from octp.git.reader import open_repo
+from octp.identity.keyring import KeyRing
+
+# The report goes to stdout; status and summary go to stderr
+console = Console(stderr=True)
+
+
+def audit_command(
+    rev_range: str = typer.Argument(
+        ..., help="Revision range, e.g. main or v1.0..main"
+    ),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only commits newer than this date (git --since)"
+    ),
+    notes_ref: str = typer.Option(NOTES_REF, "--notes-ref", help="Notes ref to read"),
+    no_notes: bool = typer.Option(False, "--no-notes", help="Do not read git notes"),
+    archives: Optional[list[Path]] = typer.Option(
+        None, "--archive", help="Envelope archive to search (repeatable)"
+    ),
+    directories: Optional[list[Path]] = typer.Option(
+        None, "--dir", help="Directory of envelope files to search (repeatable)"
+    ),
+    public_keys: Optional[list[str]] = typer.Option(
+        None,
+        "--public-key",
+        "-k",
+        help="Trusted key as developer_id=path.pem (repeatable)",
+    ),
+    policy_path: Optional[Path] = typer.Option(
+        None, "--policy", help="Also enforce the [policy] rules of this .octp.toml"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-j", help="Verification processes (default: CPU count)"
+    ),
+    failures_only: bool = typer.Option(
+        False, "--failures-only", help="Only report commits that fail"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Emit JSON lines"),
+):
+    """Audit a commit range — report commits without a valid envelope."""
+
+    try:
+        repo_root = Path(open_repo().working_dir)
+        keyring = KeyRing.from_specs(public_keys) if public_keys else None
+        policy = Policy.load(policy_path) if policy_path else None
+        sources: list[EnvelopeSource] = []
+        if not no_notes:
+            sources.append(NotesSource(repo_root, notes_ref))
+        sources.extend(ArchiveSource(path) for path in archives or [])
+        sources.extend(DirectorySource(path) for path in directories or [])
+        start = time.perf_counter()
+        commits = iter_commits(rev_range, repo_root, since=since)
+    except (RuntimeError, OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    counts = {"valid": 0, "missing": 0, "invalid": 0, "policy_violation": 0}
+    results = audit(
+        commits, sources, keyring=keyring, workers=workers, policy=policy
+    )
+    for result in results:
+        counts[result.status] += 1
+        if failures_only and result.status == "valid":
+            continue
+        if as_json:
+            print(json.dumps(asdict(result)))
+        else:
+            line = f"{result.status:<16} {result.commit[:12]}"
+            print(f"{line}  {result.reason}" if result.reason else line)
+    elapsed = time.perf_counter() - start
+
+    total = sum(counts.values())
+    console.print(
+        f"\n{total} commits in {elapsed:.1f}s — "
+        f"[green]{counts['valid']} valid[/green], "
+        f"[yellow]{counts['missing']} missing[/yellow], "
+        f"[red]{counts['invalid']} invalid[/red], "
+        f"[red]{counts['policy_violation']} policy violations[/red]",
+    )
+    # Without a policy, or when the policy requires envelopes, missing fails
+    missing_fails = policy is None or policy.require_envelope
+    if (
+        (missing_fails and counts["missing"])
+        or counts["invalid"]
+        or counts["policy_violation"]
+    ):
+        raise typer.Exit(1)
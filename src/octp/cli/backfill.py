@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.cli.metrics import export_metrics
+from octp.cli.sign import get_default_provenance
+from octp.core.builder import build_envelope
+from octp.core.config import load_config
+from octp.git.notes import NOTES_REF, NotesReader, add_note
+from octp.git.reader import RepoInfo, read_repo, state_dir
+from octp.git.worktrees import WORKTREES_DIR
+from octp.identity.keymanager import ensure_keypair
+from octp.identity.resolver import resolve_developer_id
+from octp.log.client import LogClient
+from octp.output.encoding import FORMATS, encode_envelope, envelope_digest
+from octp.output.formatter import print_header
+from octp.provenance.template import load_template
+from octp.verification.artifacts import ARTIFACTS_DIR, ArtifactStore, gc_limits
+from octp.verification.backfill import backfill, list_commits
+from octp.verification.base import CheckResult
+from octp.verification.cache import cache_from_config
+
+console = Console()
+
+
+def backfill_command(
+    revs: list[str] = typer.Argument(
+        ...,
+        help="Commits to sign, as git rev-list arguments (e.g. v1.0..v2.0)",
+    ),
+    provenance_path: Optional[Path] = typer.Option(
+        None,
+        "--provenance",
+        "-P",
+        help="Provenance template (TOML or JSON) declared for every commit",
+    ),
+    yes: bool = typer.Option(
+        False, "--yes", "-y", help="Use the default provenance instead of a template"
+    ),
+    profile: str = typer.Option(
+        "full", "--profile", "-p", help="Runner profile for every commit"
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 4,
+        "--jobs",
+        "-j",
+        help="Checks running at once, across commits (also the worktree count)",
+    ),
+    format: str = typer.Option(
+        "json", "--format", "-f", help="Envelope encoding: json or cbor"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-sign commits that already have an envelope"
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse check results recorded for an identical tree",
+    ),
+):
+    """Sign past commits, storing each envelope as a git note.
+
+    Commits that already have an envelope note are skipped, so an
+    interrupted backfill resumes where it stopped.
+    """
+
+    print_header()
+
+    if format not in FORMATS:
+        console.print(
+            f"[red]Error:[/red] Unknown format: {format}. "
+            f"Available: {', '.join(FORMATS)}"
+        )
+        raise typer.Exit(1)
+    if jobs < 1:
+        console.print("[red]Error:[/red] --jobs must be at least 1")
+        raise typer.Exit(1)
+    if provenance_path is None and not yes:
+        console.print(
+            "[red]Error:[/red] Declare the provenance of these commits with "
+            "--provenance FILE, or pass --yes to use the defaults"
+        )
+        raise typer.Exit(1)
+
+    try:
+        provenance_data = (
+            load_template(provenance_path)
+            if provenance_path is not None
+            else get_default_provenance()
+        )
+        repo_info = read_repo()
+        commits = list_commits(repo_info.root, revs)
+    except (RuntimeError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    try:
+        config = load_config(repo_root=repo_info.root)
+    except ValueError as e:
+        console.print(f"[yellow]Warning:[/yellow] Ignoring config: {e}")
+        config = {}
+
+    with NotesReader(repo_info.root) as notes:
+        signed_before = set(notes.index)
+    pending = [c for c in commits if force or c not in signed_before]
+
+    console.print(f"\n  Repository : [cyan]{repo_info.repository}[/cyan]")
+    console.print(
+        f"  Commits    : [cyan]{len(pending)}[/cyan] to sign"
+        f" ({len(commits) - len(pending)} already signed)"
+    )
+    console.print(f"  Profile    : [cyan]{profile}[/cyan] ({jobs} jobs)")
+    if not pending:
+        console.print("\n[green]✓[/green] Nothing to do")
+        return
+
+    ensure_keypair()
+    developer_id = resolve_developer_id(repo_info.root)
+    console.print(f"  Developer  : [cyan]{developer_id}[/cyan]\n")
+
+    cache = None
+    if use_cache:
+        try:
+            cache = cache_from_config(
+                config, state_dir(repo_info.root), developer_id=developer_id
+            )
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Warning:[/yellow] Result cache disabled: {e}")
+    runners = config.get("runners", {})
+    artifacts = ArtifactStore(state_dir(repo_info.root) / ARTIFACTS_DIR)
+    log_url = config.get("log", {}).get("url")
+    notes_lock = threading.Lock()
+
+    def on_checked(info: RepoInfo, results: dict[str, CheckResult]) -> None:
+        envelope = build_envelope(
+            repo_info=info,
+            developer_id=developer_id,
+            provenance_data=provenance_data,
+            check_results=results,
+        )
+        with notes_lock:  # concurrent updates of the notes ref would race
+            add_note(
+                encode_envelope(envelope, format),
+                commit=info.commit_hash,
+                path=repo_info.root,
+            )
+        if log_url:
+            try:
+                LogClient(log_url).append(envelope_digest(envelope))
+            except (OSError, KeyError, ValueError) as e:
+                console.print(f"[yellow]Warning:[/yellow] Log append failed: {e}")
+
+    done = 0
+    done_lock = threading.Lock()
+
+    def on_commit(commit: str, outcome: dict[str, CheckResult] | Exception) -> None:
+        nonlocal done
+        with done_lock:
+            done += 1
+            prefix = f"  [{done}/{len(pending)}] {commit[:12]}"
+        if isinstance(outcome, Exception):
+            console.print(f"{prefix} [red]✗[/red] {outcome}")
+            return
+        passed = sum(result.passed for result in outcome.values())
+        colour = "green" if passed == len(outcome) else "yellow"
+        console.print(
+            f"{prefix} [{colour}]✓[/{colour}] signed, "
+            f"{passed}/{len(outcome)} checks passed"
+        )
+
+    stop = threading.Event()
+    outcomes: dict[str, dict[str, CheckResult] | Exception] = {}
+    errors: list[Exception] = []
+
+    def run() -> None:
+        try:
+            outcomes.update(
+                backfill(
+                    repo_info.root,
+                    pending,
+                    jobs,
+                    on_checked,
+                    run_kwargs={
+                        "profile": profile,
+                        "cache": cache,
+                        "in_process": bool(runners.get("in_process", False)),
+                        # Commits already run in parallel; shards would oversubscribe
+                        "options": {**runners, "shards": 1},
+                        "artifacts": artifacts,
+                    },
+                    on_commit=on_commit,
+                    stop=stop,
+                )
+            )
+        except Exception as e:  # e.g. the worktrees could not be created
+            errors.append(e)
+
+    # On a daemon thread so Ctrl-C reaches this one; the commits already
+    # running are finished and noted before the process exits
+    worker = threading.Thread(target=run, name="octp-backfill", daemon=True)
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(0.2)
+    except KeyboardInterrupt:
+        stop.set()
+        console.print(
+            "\n[yellow]Interrupted.[/yellow] Finishing the commits in progress; "
+            "run the same command again to resume."
+        )
+        worker.join()
+        export_metrics(config)
+        raise typer.Exit(130)
+    if errors:
+        console.print(f"[red]Error:[/red] {errors[0]}")
+        raise typer.Exit(1)
+
+    try:
+        artifacts.gc(*gc_limits(config))
+    except (OSError, ValueError) as e:
+        console.print(f"[yellow]Warning:[/yellow] Report cleanup skipped: {e}")
+    export_metrics(config)
+
+    failed = {c: o for c, o in outcomes.items() if isinstance(o, Exception)}
+    console.print(
+        f"\n[green]✓[/green] Signed {len(outcomes) - len(failed)} of "
+        f"{len(pending)} commits under {NOTES_REF}"
+    )
+    console.print(
+        f"[dim]Worktrees are kept in {state_dir(repo_info.root) / WORKTREES_DIR} "
+        "for the next run[/dim]"
+    )
+    if failed:
+        raise typer.Exit(1)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.git.reader import state_dir
+from octp.server.cache import CacheStore, create_cache_server
+from octp.verification.cache import CACHE_DIR, LocalCache
+
+console = Console()
+
+cache_app = typer.Typer(
+    help="Manage the verification result cache",
+    no_args_is_help=True,
+)
+
+
+@cache_app.command("clear")
+def clear_command():
+    """Delete this repository's locally cached results."""
+
+    try:
+        cache = LocalCache(state_dir() / CACHE_DIR)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"Removed {cache.clear()} cached results.")
+
+
+@cache_app.command("serve")
+def serve_command(
+    directory: Path = typer.Option(
+        Path("octp-cache"), "--dir", help="Directory to store entries in"
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to bind"),
+    port: int = typer.Option(8766, "--port", help="TCP port to listen on"),
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Listen on a Unix socket instead of TCP"
+    ),
+):
+    """Run a reference shared cache server for a team or CI."""
+
+    server = create_cache_server(
+        CacheStore(directory), host=host, port=port, socket_path=socket_path
+    )
+    where = socket_path if socket_path else f"http://{host}:{port}"
+    console.print(f"Serving OCTP result cache on [cyan]{where}[/cyan]")
+    console.print(f"  Storage   : [cyan]{directory}[/cyan]")
+    console.print("  Endpoints : GET/PUT /v1/results/<key>, GET /healthz")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\nShutting down.")
+    finally:
+        server.server_close()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import typer
+from rich.console import Console
+
+from octp.identity.keymanager import (
+    ALGORITHMS,
+    EDDSA,
+    KEYS_DIR,
+    PUBLIC_KEY_FILE,
+    ensure_keypair,
+    migrate_keypair,
+    signature_algorithm,
+)
+
+console = Console()
+
+keys_app = typer.Typer(
+    help=f"Manage your signing key in {KEYS_DIR}",
+    no_args_is_help=True,
+)
+
+
+@keys_app.command("show")
+def show_command():
+    """Print the signing algorithm and public key."""
+
+    ensure_keypair()
+    try:
+        algorithm = signature_algorithm()
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"Algorithm  : [cyan]{algorithm}[/cyan]")
+    console.print(f"Public key : {PUBLIC_KEY_FILE}\n")
+    console.print(PUBLIC_KEY_FILE.read_text(), end="")
+
+
+@keys_app.command("migrate")
+def migrate_command(
+    algorithm: str = typer.Option(
+        EDDSA, "--algorithm", help=f"New key type: {', '.join(ALGORITHMS)}"
+    ),
+):
+    """Replace your signing key with one for another algorithm."""
+
+    try:
+        retired = migrate_keypair(algorithm)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] New {algorithm} key in {KEYS_DIR}")
+    if retired is not None:
+        console.print(f"  Old key moved to {retired}")
+        console.print(
+            "\nPublish the new public key alongside the old one; verifiers "
+            "holding both keep accepting envelopes signed before the switch."
+        )
+    console.print(f"\n{PUBLIC_KEY_FILE.read_text()}", end="")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.core.config import load_config
+from octp.log.client import LogClient
+from octp.log.store import TransparencyLog
+from octp.output.encoding import decode_envelope, envelope_digest
+from octp.server.log import create_log_server
+from octp.verification.artifacts import is_digest
+
+console = Console()
+
+log_app = typer.Typer(
+    help="Append envelopes to and prove them in a transparency log",
+    no_args_is_help=True,
+)
+
+URL_HELP = "Log server URL (default: [log] url from .octp.toml)"
+
+
+def _client(url: str | None) -> LogClient:
+    if url is None:
+        try:
+            url = load_config().get("log", {}).get("url")
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+    if not url:
+        console.print("[red]Error:[/red] No log URL: pass --url or set [log] url")
+        raise typer.Exit(1)
+    return LogClient(url)
+
+
+def _digest(envelope: str) -> str:
+    """Digest of an envelope file, or the argument if it already is one."""
+    path = Path(envelope)
+    if not path.exists() and is_digest(envelope):
+        return envelope
+    try:
+        return envelope_digest(decode_envelope(path.read_bytes()))
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] Could not read envelope: {e}")
+        raise typer.Exit(1)
+
+
+@log_app.command("serve")
+def serve_command(
+    directory: Path = typer.Option(
+        Path("octp-log"), "--dir", help="Directory to store the log in"
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to bind"),
+    port: int = typer.Option(8767, "--port", help="TCP port to listen on"),
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Listen on a Unix socket instead of TCP"
+    ),
+):
+    """Run a file-backed transparency log server."""
+
+    log = TransparencyLog(directory)
+    server = create_log_server(log, host=host, port=port, socket_path=socket_path)
+    where = socket_path if socket_path else f"http://{host}:{port}"
+    console.print(f"Serving OCTP transparency log on [cyan]{where}[/cyan]")
+    console.print(f"  Storage   : [cyan]{directory}[/cyan] ({log.size} entries)")
+    console.print(
+        "  Endpoints : POST /v1/log/entries, GET /v1/log/head, "
+        "GET /v1/log/inclusion, GET /v1/log/consistency"
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\nShutting down.")
+    finally:
+        server.server_close()
+        log.close()
+
+
+@log_app.command("append")
+def append_command(
+    envelope: str = typer.Argument(..., help="Envelope file or its digest"),
+    url: Optional[str] = typer.Option(None, "--url", help=URL_HELP),
+):
+    """Append an envelope's digest to the log."""
+
+    digest = _digest(envelope)
+    try:
+        index = _client(url).append(digest)
+    except (OSError, KeyError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"Logged [cyan]{digest[:16]}…[/cyan] as entry [cyan]{index}[/cyan]")
+
+
+@log_app.command("prove")
+def prove_command(
+    envelope: str = typer.Argument(..., help="Envelope file or its digest"),
+    url: Optional[str] = typer.Option(None, "--url", help=URL_HELP),
+):
+    """Check that an envelope is in the log, and that the log only grew."""
+
+    digest = _digest(envelope)
+    try:
+        proof = _client(url).prove(digest)
+    except KeyError:
+        console.print(f"[red]✗[/red] {digest} is not in the log")
+        raise typer.Exit(1)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] Entry {proof.index} of {proof.head.size}")
+    console.print(f"  Digest : {digest}")
+    console.print(f"  Root   : {proof.head.root}")
+    console.print(f"  Proof  : {len(proof.path)} hashes")
+
+
+@log_app.command("head")
+def head_command(
+    url: Optional[str] = typer.Option(None, "--url", help=URL_HELP),
+):
+    """Print the log's current tree head, checked against the last one seen."""
+
+    try:
+        head = _client(url).head()
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"  Size : [cyan]{head.size}[/cyan]")
+    console.print(f"  Root : [cyan]{head.root}[/cyan]")
@@ -1,8 +1,21 @@
 import typer
 
+from octp.cli.archive import archive_app
+from octp.cli.artifacts import artifacts_app
+from octp.cli.audit import audit_command
+from octp.cli.backfill import backfill_command
+from octp.cli.cache import cache_app
 from octp.cli.init import init_command
+from octp.cli.keys import keys_app
+from octp.cli.log import log_app
+from octp.cli.metrics import metrics_app
+from octp.cli.notes import notes_app
+from octp.cli.rules import rules_app
+from octp.cli.serve import serve_command
 from octp.cli.sign import sign_command
+from octp.cli.stats import stats_command
 from octp.cli.verify import verify_command
+from octp.cli.watch import watch_command
 
 app = typer.Typer(
     name="octp",
@@ -13,6 +26,19 @@ app = typer.Typer(
 app.command(name="sign")(sign_command)
 app.command(name="verify")(verify_command)
 app.command(name="init")(init_command)
+app.command(name="serve")(serve_command)
+app.command(name="audit")(audit_command)
+app.command(name="stats")(stats_command)
+app.command(name="watch")(watch_command)
+app.command(name="backfill")(backfill_command)
+app.add_typer(archive_app, name="archive")
+app.add_typer(notes_app, name="notes")
+app.add_typer(cache_app, name="cache")
+app.add_typer(rules_app, name="rules")
+app.add_typer(keys_app, name="keys")
+app.add_typer(artifacts_app, name="artifacts")
+app.add_typer(log_app, name="log")
+app.add_typer(metrics_app, name="metrics")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+import typer
+from rich.console import Console
+
+from octp.core.config import load_config
+from octp.metrics import METRICS, exporter_from_config
+from octp.server.metrics import PUSH_PATH, PushStore, create_metrics_server
+
+console = Console()
+
+metrics_app = typer.Typer(
+    help="Inspect and collect Prometheus metrics about octp runs",
+    no_args_is_help=True,
+)
+
+
+def export_metrics(config: dict[str, Any]) -> None:
+    """Export this run's metrics as ``[metrics]`` asks; failures only warn."""
+    exporter = exporter_from_config(config)
+    if exporter is None:
+        return
+    try:
+        exporter.export(METRICS)
+    except (OSError, ValueError) as e:
+        console.print(f"[yellow]Warning:[/yellow] Metrics export failed: {e}")
+
+
+@metrics_app.command("serve")
+def serve_command(
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to bind"),
+    port: int = typer.Option(9091, "--port", help="TCP port to listen on"),
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Listen on a Unix socket instead of TCP"
+    ),
+):
+    """Run a local push endpoint for [metrics] push_url that Prometheus scrapes."""
+
+    server = create_metrics_server(
+        PushStore(), host=host, port=port, socket_path=socket_path
+    )
+    where = socket_path if socket_path else f"http://{host}:{port}"
+    console.print(f"Collecting OCTP metrics on [cyan]{where}[/cyan]")
+    console.print(f"  Endpoints : PUT {PUSH_PATH}<job>/instance/<host>, GET /metrics")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\nShutting down.")
+    finally:
+        server.server_close()
+
+
+@metrics_app.command("show")
+def show_command():
+    """Print the metrics accumulated on this machine."""
+
+    try:
+        exporter = exporter_from_config(load_config())
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if exporter is None:
+        console.print(
+            "[red]Error:[/red] Metrics are not exported: set [metrics] textfile "
+            "or push_url"
+        )
+        raise typer.Exit(1)
+    try:
+        text = exporter.textfile.read_text()
+    except FileNotFoundError:
+        console.print(f"[dim]No runs recorded yet in {exporter.textfile}[/dim]")
+        return
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Could not read {exporter.textfile}: {e}")
+        raise typer.Exit(1)
+    print(text, end="")
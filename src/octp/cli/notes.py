@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.git.notes import NOTES_REF, NotesReader, add_note
+from octp.output.encoding import decode_envelope, encode_envelope
+
+console = Console()
+
+notes_app = typer.Typer(
+    help=f"Store and read envelopes as git notes ({NOTES_REF})",
+    no_args_is_help=True,
+)
+
+
+@notes_app.command("add")
+def add_command(
+    envelope_path: Path = typer.Argument(..., help="Envelope file to attach"),
+    commit: Optional[str] = typer.Option(
+        None, "--commit", "-c", help="Commit to attach to (default: envelope's)"
+    ),
+    ref: str = typer.Option(NOTES_REF, "--ref", help="Notes ref"),
+):
+    """Attach an existing envelope file to its commit."""
+
+    try:
+        data = envelope_path.read_bytes()
+        envelope = decode_envelope(data)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] Could not read envelope: {e}")
+        raise typer.Exit(1)
+
+    target = commit or envelope.commit_hash
+    try:
+        add_note(data, commit=target, ref=ref)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] Attached envelope to {target[:12]} under {ref}")
+
+
+@notes_app.command("show")
+def show_command(
+    rev: str = typer.Argument("HEAD", help="Commit or revision"),
+    ref: str = typer.Option(NOTES_REF, "--ref", help="Notes ref"),
+):
+    """Print the envelope attached to a commit."""
+
+    try:
+        with NotesReader(ref=ref) as reader:
+            commit = reader.repo.rev_parse(rev).hexsha
+            data = reader.get(commit)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if data is None:
+        console.print(f"[red]Error:[/red] No envelope note on {commit[:12]}")
+        raise typer.Exit(1)
+    print(encode_envelope(decode_envelope(data), "json").decode())
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from octp.verification.semgrep_rules import (
+    RULES_DIR,
+    fetch_rules,
+    import_rules,
+    list_packs,
+)
+
+console = Console()
+
+rules_app = typer.Typer(
+    help=f"Manage pinned semgrep rule packs in {RULES_DIR}",
+    no_args_is_help=True,
+)
+
+
+def _print_pin(digest: str) -> None:
+    console.print(f"[green]✓[/green] Stored rule pack [cyan]{digest}[/cyan]")
+    console.print("\nPin it in .octp.toml:\n")
+    console.print(f'  [runners]\n  semgrep_rules = "{digest}"')
+
+
+@rules_app.command("fetch")
+def fetch_command(
+    configs: list[str] = typer.Argument(
+        ..., help="Registry configs to download, e.g. p/python p/secrets"
+    ),
+):
+    """Download registry rules once and store them as a pinned pack."""
+
+    try:
+        digest = fetch_rules(configs)
+    except (RuntimeError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    _print_pin(digest)
+
+
+@rules_app.command("import")
+def import_command(
+    source: Path = typer.Argument(..., help="Rule YAML file or directory"),
+):
+    """Store local rules (e.g. shipped into an offline CI job) as a pack."""
+
+    try:
+        digest = import_rules(source)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    _print_pin(digest)
+
+
+@rules_app.command("list")
+def list_command():
+    """List stored rule packs."""
+
+    packs = list_packs()
+    if not packs:
+        console.print("No rule packs stored.")
+        return
+    for digest, count in packs:
+        console.print(f"  {digest}  {count} rule file(s)")
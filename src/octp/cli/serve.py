@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from octp.core.policy import Policy
+from octp.identity.keyring import KeyRing
+from octp.server.verify import VerifyService, create_verify_server
+
+console = Console()
+
+
+def serve_command(
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to bind"),
+    port: int = typer.Option(8765, "--port", help="TCP port to listen on"),
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Listen on a Unix socket instead of TCP"
+    ),
+    public_keys: Optional[list[str]] = typer.Option(
+        None,
+        "--public-key",
+        "-k",
+        help="Trusted key as developer_id=path.pem (repeatable)",
+    ),
+    policy_path: Optional[Path] = typer.Option(
+        None, "--policy", help="Report [policy] violations from this .octp.toml"
+    ),
+):
+    """Serve envelope verification over HTTP for CI bots."""
+
+    try:
+        keyring = KeyRing.from_specs(public_keys or [])
+        policy = Policy.load(policy_path).compile() if policy_path else None
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    server = create_verify_server(
+        VerifyService(keyring, policy), host=host, port=port, socket_path=socket_path
+    )
+    where = socket_path if socket_path else f"http://{host}:{port}"
+    console.print(f"Serving OCTP verification on [cyan]{where}[/cyan]")
+    console.print(f"  Trusted keys : [cyan]{len(keyring)}[/cyan]")
+    console.print(
+        "  Endpoints    : POST /verify, POST /verify/batch, GET /healthz, GET /metrics"
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\nShutting down.")
+    finally:
+        server.server_close()
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import sys
+import threading
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 import typer
 from rich.console import Console
 
-from octp.core.builder import build_envelope
-from octp.git.reader import read_repo
+from octp import api
+from octp.cli.metrics import export_metrics
+from octp.core.config import load_config
+from octp.git.notes import NOTES_REF
+from octp.git.reader import RepoInfo
 from octp.identity.keymanager import ensure_keypair
-from octp.identity.resolver import resolve_developer_id
+from octp.output.encoding import FORMATS
 from octp.output.formatter import (
     print_envelope_summary,
     print_header,
@@ -17,12 +24,14 @@ from octp.output.formatter import (
     print_verification_results,
 )
 from octp.provenance.collector import collect_interactively
-from octp.verification.registry import run_all
+from octp.verification.base import CheckResult
+from octp.verification.registry import CheckProgress
+from octp.verification.workspace import discover_repos, run_workspace
 
 console = Console()
 
 
-def get_default_provenance() -> dict:
+def get_default_provenance() -> dict[str, Any]:
     """Get default provenance data for non-interactive mode.
 
     For OCTP project: defaults to AI-assisted with substantial review.
@@ -55,11 +64,11 @@ def is_interactive() -> bool:
 
 
 def sign_command(
-    output: Path = typer.Option(
-        Path(".octp-envelope.json"),
+    output: Optional[Path] = typer.Option(
+        None,
         "--output",
         "-o",
-        help="Path to write the envelope JSON",
+        help="Path to write the envelope (default: .octp-envelope.json or .cbor)",
     ),
     yes: bool = typer.Option(
         False, "--yes", "-y", help="Skip interactive prompts — use defaults"
@@ -70,64 +79,248 @@ def sign_command(
         "-p",
         help="Runner profile: fast (3-8s), full (all checks), ci, security",
     ),
+    format: str = typer.Option(
+        "json",
+        "--format",
+        "-f",
+        help="Envelope encoding: json (pretty) or cbor (compact, deterministic)",
+    ),
+    notes: bool = typer.Option(
+        False,
+        "--notes",
+        help=f"Also attach the envelope to the commit as a git note ({NOTES_REF})",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse check results recorded for an identical working tree",
+    ),
+    workspace: Optional[Path] = typer.Option(
+        None,
+        "--workspace",
+        "-w",
+        help="Sign every git repository under this directory",
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 4,
+        "--jobs",
+        "-j",
+        help="Checks running at once across the workspace (with --workspace)",
+    ),
 ):
     """Generate and sign a trust envelope for the current commit."""
 
     print_header()
 
-    # Read git state
-    try:
-        repo_info = read_repo()
-    except RuntimeError as e:
-        console.print(f"[red]Error:[/red] {e}")
+    if format not in FORMATS:
+        console.print(
+            f"[red]Error:[/red] Unknown format: {format}. "
+            f"Available: {', '.join(FORMATS)}"
+        )
         raise typer.Exit(1)
+    if output is None:
+        output = Path(f".octp-envelope.{format}")
 
-    console.print(f"\n  Repository : [cyan]{repo_info.repository}[/cyan]")
-    console.print(f"  Commit     : [cyan]{repo_info.commit_hash[:12]}[/cyan]")
-    console.print(f"  Profile    : [cyan]{profile}[/cyan]")
+    if workspace is not None:
+        sign_workspace(workspace, jobs, output, yes, profile, format, notes, use_cache)
+        return
 
-    # Resolve identity
-    ensure_keypair()
-    developer_id = resolve_developer_id()
-    console.print(f"  Developer  : [cyan]{developer_id}[/cyan]\n")
+    interactive = not yes and is_interactive()
+    progress = CheckProgress()
 
-    # Run verification checks
-    check_results = run_all(repo_info.root, profile=profile)
-    print_verification_results(check_results)
+    def on_start(repo_info: RepoInfo, developer_id: str) -> None:
+        console.print(f"\n  Repository : [cyan]{repo_info.repository}[/cyan]")
+        console.print(f"  Commit     : [cyan]{repo_info.commit_hash[:12]}[/cyan]")
+        console.print(f"  Profile    : [cyan]{profile}[/cyan]")
+        console.print(f"  Developer  : [cyan]{developer_id}[/cyan]\n")
 
-    # Collect provenance declaration
-    if yes:
-        # Explicit --yes flag: use defaults
-        provenance_data = get_default_provenance()
-        console.print("\n[dim]Using default provenance (non-interactive mode)[/dim]")
-    elif not is_interactive():
-        # No TTY detected: use defaults with warning
-        provenance_data = get_default_provenance()
-        console.print(
-            "\n[yellow]Warning:[/yellow] Non-interactive mode detected. "
-            "Using default provenance. Use --yes to suppress this warning."
-        )
-    else:
+    def provenance() -> dict[str, Any]:
+        # Called while the checks run in the background
+        if yes:
+            # Explicit --yes flag: use defaults
+            console.print(
+                "\n[dim]Using default provenance (non-interactive mode)[/dim]"
+            )
+            return get_default_provenance()
+        if not interactive:
+            # No TTY detected: use defaults with warning
+            console.print(
+                "\n[yellow]Warning:[/yellow] Non-interactive mode detected. "
+                "Using default provenance. Use --yes to suppress this warning."
+            )
+            return get_default_provenance()
         # Interactive: collect from user
         try:
-            provenance_data = collect_interactively()
+            data = collect_interactively(status_line=progress.status_line)
         except Exception as e:
             console.print(f"\n[red]Error collecting input:[/red] {e}")
             console.print("[dim]Falling back to default provenance...[/dim]")
-            provenance_data = get_default_provenance()
-
-    # Build and sign envelope
-    envelope = build_envelope(
-        repo_info=repo_info,
-        developer_id=developer_id,
-        provenance_data=provenance_data,
-        check_results=check_results,
-    )
+            data = get_default_provenance()
+        console.print("\n[dim]Waiting for verification checks...[/dim]")
+        return data
 
-    # Write envelope
-    envelope_json = envelope.model_dump_json(indent=2)
-    output.write_text(envelope_json)
+    try:
+        signed = asyncio.run(
+            api.sign(
+                provenance=provenance,
+                profile=profile,
+                output=output,
+                format=format,
+                notes=notes,
+                use_cache=use_cache,
+                on_start=on_start,
+                on_result=progress,
+            )
+        )
+    except (RuntimeError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    print_verification_results(signed.results)
+    _print_published(signed)
 
     # Print summary
-    print_envelope_summary(envelope)
+    print_envelope_summary(signed.envelope)
     print_success(str(output))
+
+
+def _print_published(signed: api.SignResult) -> None:
+    """Where the envelope went besides its file, and what went wrong."""
+    if signed.noted:
+        console.print(f"\n[dim]Attached envelope as a note under {NOTES_REF}[/dim]")
+    if signed.log_index is not None:
+        console.print(
+            f"[dim]Logged as entry {signed.log_index} in the transparency log[/dim]"
+        )
+    for warning in signed.warnings:
+        console.print(f"[yellow]Warning:[/yellow] {warning}")
+
+
+def _provenance(
+    yes: bool, status_line: Callable[[], str] | None = None
+) -> dict[str, Any]:
+    """Provenance for a workspace: asked once, applied to every repository."""
+    if yes or not is_interactive():
+        console.print("\n[dim]Using default provenance (non-interactive mode)[/dim]")
+        return get_default_provenance()
+    console.print("\nThis declaration is recorded for every repository.")
+    try:
+        return collect_interactively(status_line=status_line)
+    except Exception as e:
+        console.print(f"\n[red]Error collecting input:[/red] {e}")
+        console.print("[dim]Falling back to default provenance...[/dim]")
+        return get_default_provenance()
+
+
+def sign_workspace(
+    root: Path,
+    jobs: int,
+    output: Path,
+    yes: bool,
+    profile: str,
+    format: str,
+    notes: bool,
+    use_cache: bool,
+) -> None:
+    """Sign every repository under ``root``, one envelope each.
+
+    All repositories' runners share one pool of ``jobs`` workers. The
+    envelope is written to ``output`` relative to each repository root.
+    """
+    if output.is_absolute():
+        console.print(
+            "[red]Error:[/red] --output must be relative with --workspace "
+            "(one envelope is written per repository)"
+        )
+        raise typer.Exit(1)
+    if jobs < 1:
+        console.print("[red]Error:[/red] --jobs must be at least 1")
+        raise typer.Exit(1)
+    repos = discover_repos(root)
+    if not repos:
+        console.print(f"[red]Error:[/red] No git repositories under {root}")
+        raise typer.Exit(1)
+
+    console.print(f"\n  Workspace  : [cyan]{root}[/cyan]")
+    console.print(f"  Repos      : [cyan]{len(repos)}[/cyan] ({jobs} jobs)")
+    console.print(f"  Profile    : [cyan]{profile}[/cyan]\n")
+    ensure_keypair()
+
+    prepared: dict[Path, api.PreparedRepo] = {}
+    failed: dict[Path, str] = {}
+    for repo in repos:
+        try:
+            prepared[repo] = api.prepare_repo(repo, use_cache)
+        except RuntimeError as e:
+            failed[repo] = str(e)
+        except Exception as e:  # e.g. a repository without commits
+            failed[repo] = f"Cannot read repository: {e}"
+
+    def run_kwargs(repo: Path) -> dict[str, Any]:
+        kwargs = prepared[repo].check_kwargs
+        # The shared pool already uses every core; shards would oversubscribe
+        options = {**kwargs["options"], "shards": 1}
+        return {**kwargs, "profile": profile, "options": options}
+
+    done = 0
+    lock = threading.Lock()
+
+    def on_repo(repo: Path, outcome: dict[str, CheckResult] | Exception) -> None:
+        nonlocal done
+        with lock:
+            done += 1
+
+    def status_line() -> str:
+        with lock:
+            return f"repositories checked: {done}/{len(prepared)}"
+
+    # Checks run in the background while provenance is collected
+    results: dict[Path, dict[str, CheckResult] | Exception] = {}
+    background = threading.Thread(
+        target=lambda: results.update(
+            run_workspace(list(prepared), jobs, run_kwargs, on_repo)
+        ),
+        name="octp-workspace",
+        daemon=True,
+    )
+    background.start()
+    provenance_data = _provenance(yes, status_line)
+    if background.is_alive():
+        console.print("\n[dim]Waiting for verification checks…[/dim]")
+    background.join()
+
+    signed = 0
+    for repo in repos:
+        if repo in failed:
+            continue
+        outcome = results.get(repo)
+        if not isinstance(outcome, dict):
+            failed[repo] = f"Checks failed to run: {outcome}"
+            continue
+        name = repo.relative_to(root) if repo != root else repo
+        console.print(f"\n[bold]{name}[/bold]")
+        print_verification_results(outcome)
+        try:
+            result = api.sign_checked(
+                prepared[repo],
+                provenance_data,
+                outcome,
+                output=prepared[repo].repo.root / output,
+                format=format,
+                notes=notes,
+            )
+        except (RuntimeError, ValueError, OSError) as e:
+            failed[repo] = f"Could not sign: {e}"
+            continue
+        _print_published(result)
+        signed += 1
+
+    try:
+        export_metrics(load_config(repo_root=root))
+    except ValueError as e:
+        console.print(f"[yellow]Warning:[/yellow] Metrics not exported: {e}")
+    console.print(f"\n[green]✓[/green] Signed {signed} of {len(repos)} repositories")
+    for repo, reason in failed.items():
+        console.print(f"  [red]✗[/red] {repo}: {reason}")
+    if failed:
+        raise typer.Exit(1)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+REPORTS = ("method-share", "review-levels", "pass-rate")
+
+
+def stats_command(
+    paths: list[Path] = typer.Argument(
+        ..., help="Envelope files, directories or archives"
+    ),
+    report: str = typer.Option(
+        "method-share",
+        "--report",
+        "-r",
+        help="method-share, review-levels or pass-rate",
+    ),
+    method: str = typer.Option(
+        "ai_generated_unreviewed",
+        "--method",
+        help="Provenance method for the method-share report",
+    ),
+    by: Optional[list[str]] = typer.Option(
+        None,
+        "--by",
+        help="Group by repository, developer or week (repeatable)",
+    ),
+):
+    """Aggregate provenance statistics over many envelopes."""
+    # Imported here so NumPy is only loaded when stats are asked for
+    from octp.analytics.columns import METHODS, REVIEW_LEVELS, EnvelopeColumns
+    from octp.analytics.queries import (
+        GROUP_KEYS,
+        method_share,
+        pass_rate,
+        review_levels,
+    )
+    from octp.output.archive import ArchiveError
+
+    if report not in REPORTS:
+        console.print(
+            f"[red]Error:[/red] Unknown report: {report}. "
+            f"Available: {', '.join(REPORTS)}"
+        )
+        raise typer.Exit(1)
+    if method not in METHODS:
+        console.print(
+            f"[red]Error:[/red] Unknown method: {method}. "
+            f"Available: {', '.join(METHODS)}"
+        )
+        raise typer.Exit(1)
+    for key in by or []:
+        if key not in GROUP_KEYS:
+            console.print(
+                f"[red]Error:[/red] Unknown grouping: {key}. "
+                f"Available: {', '.join(GROUP_KEYS)}"
+            )
+            raise typer.Exit(1)
+    if report != "method-share" and by and len(by) > 1:
+        console.print(
+            f"[red]Error:[/red] The {report} report groups by a single key; "
+            f"got --by {', '.join(by)}"
+        )
+        raise typer.Exit(1)
+
+    start = time.perf_counter()
+    try:
+        columns = EnvelopeColumns.from_paths(paths)
+    except (ArchiveError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - start
+    console.print(
+        f"[dim]Loaded {len(columns)} envelopes in {elapsed:.2f}s"
+        + (f", skipped {columns.skipped} other files" if columns.skipped else "")
+        + "[/dim]"
+    )
+    if not len(columns):
+        raise typer.Exit(0)
+
+    table = Table(box=box.SIMPLE)
+    if report == "method-share":
+        groups = tuple(by) if by else ("repository", "week")
+        for name in groups:
+            table.add_column(name.capitalize())
+        table.add_column("Matching", justify="right")
+        table.add_column("Total", justify="right")
+        table.add_column("Share", justify="right")
+        for labels, hits, total, share in method_share(columns, method, groups):
+            table.add_row(*labels, str(hits), str(total), f"{share:.1%}")
+    elif report == "review-levels":
+        group = by[0] if by else "developer"
+        table.add_column(group.capitalize())
+        for level in REVIEW_LEVELS:
+            table.add_column(level, justify="right")
+        for label, levels in review_levels(columns, group).items():
+            table.add_row(label, *(str(levels.get(lv, 0)) for lv in REVIEW_LEVELS))
+    else:
+        group = by[0] if by else "repository"
+        table.add_column(group.capitalize())
+        table.add_column("Passed", justify="right")
+        table.add_column("Ran", justify="right")
+        table.add_column("Pass rate", justify="right")
+        for label, passed, ran, rate in pass_rate(columns, group):
+            table.add_row(label, str(passed), str(ran), f"{rate:.1%}")
+
+    console.print(table)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
 
-from octp.core.envelope import OCTPEnvelope
-from octp.integrity.hasher import hash_payload
+from octp import api
+from octp.cli.metrics import export_metrics
+from octp.core.config import load_config
+from octp.core.policy import Policy
 from octp.output.formatter import print_header, print_verify_result
 
 console = Console()
@@ -15,7 +18,10 @@ console = Console()
 
 def verify_command(
     envelope_path: Path = typer.Argument(
-        ..., help="Path to the envelope JSON file to verify"
+        ..., help="Path to the envelope file (JSON or CBOR) to verify"
+    ),
+    policy_path: Optional[Path] = typer.Option(
+        None, "--policy", help="Also enforce the [policy] rules of this .octp.toml"
     ),
 ):
     """Verify a trust envelope — check integrity and signature."""
@@ -26,26 +32,29 @@ def verify_command(
         console.print(f"[red]Error:[/red] Envelope file not found: {envelope_path}")
         raise typer.Exit(1)
 
-    try:
-        data = json.loads(envelope_path.read_text())
-        envelope = OCTPEnvelope.model_validate(data)
-    except Exception as e:
-        print_verify_result(False, f"Could not parse envelope: {e}")
-        raise typer.Exit(1)
+    policy = None
+    if policy_path:
+        try:
+            policy = Policy.load(policy_path).compile()
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error:[/red] Could not load policy: {e}")
+            raise typer.Exit(1)
 
-    if not envelope.integrity:
-        print_verify_result(False, "No integrity section found in envelope")
+    result = asyncio.run(api.verify(envelope_path, policy=policy))
+    try:
+        export_metrics(load_config())
+    except ValueError as e:
+        console.print(f"[yellow]Warning:[/yellow] Metrics not exported: {e}")
+    if not result.valid:
+        print_verify_result(False, result.reason)
         raise typer.Exit(1)
-
-    # Recompute payload hash
-    payload_dict = envelope.to_signable_dict()
-    computed_hash = hash_payload(payload_dict)
-
-    if computed_hash != envelope.integrity.payload_hash:
-        print_verify_result(
-            False, "Payload hash mismatch — envelope has been tampered with"
-        )
+    if result.violations:
+        for v in result.violations:
+            console.print(f"  [red]✗[/red] {v.rule}: {v.message}")
+        print_verify_result(False, "Envelope violates repository policy")
         raise typer.Exit(1)
+    envelope = result.envelope
+    assert envelope is not None  # a valid result always carries its envelope
 
     # Note: full signature verification requires public key lookup
     # In v0.1 we verify the hash integrity and flag if signature is present
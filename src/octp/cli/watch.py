@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import time
+
+import typer
+from rich.console import Console
+
+from octp.core.config import load_config
+from octp.git.reader import read_repo, state_dir
+from octp.identity.resolver import resolve_developer_id
+from octp.verification.artifacts import ARTIFACTS_DIR, ArtifactStore
+from octp.verification.base import CheckResult
+from octp.verification.cache import cache_from_config
+from octp.verification.registry import get_runners_for_profile
+from octp.verification.watch import open_watcher, watch
+
+console = Console()
+
+
+def watch_command(
+    profile: str = typer.Option(
+        "full", "--profile", "-p", help="Runner profile to keep warm"
+    ),
+    debounce: float = typer.Option(
+        1.0, "--debounce", help="Seconds of quiet before re-running checks"
+    ),
+    poll: bool = typer.Option(
+        False, "--poll", help="Poll for changes instead of using inotify"
+    ),
+    interval: float = typer.Option(
+        1.0, "--interval", help="Polling interval in seconds (with --poll)"
+    ),
+    niceness: int = typer.Option(
+        10, "--nice", help="Scheduling niceness increment for checks (0 to keep)"
+    ),
+):
+    """Run checks in the background as you edit, so `octp sign` hits the cache."""
+
+    try:
+        get_runners_for_profile(profile)
+        repo_info = read_repo()
+        config = load_config(repo_root=repo_info.root)
+        cache = cache_from_config(
+            config,
+            state_dir(repo_info.root),
+            developer_id=resolve_developer_id(repo_info.root),
+        )
+    except (RuntimeError, OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if cache is None:
+        console.print(
+            "[red]Error:[/red] The result cache is disabled ([cache] enabled = false)"
+        )
+        raise typer.Exit(1)
+
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)  # inherited by every runner subprocess
+
+    watcher = open_watcher(repo_info.root, poll=poll, interval=interval)
+    console.print(
+        f"Watching [cyan]{repo_info.root}[/cyan] "
+        f"({type(watcher).__name__.removesuffix('Watcher').lower()}, "
+        f"profile {profile}). Ctrl-C to stop."
+    )
+
+    def report(tree: str, results: dict[str, CheckResult]) -> None:
+        ran = sum(not r.cached for r in results.values())
+        failed = [name for name, r in results.items() if not r.passed]
+        status = (
+            f"[red]failed: {', '.join(sorted(failed))}[/red]"
+            if failed
+            else "[green]all passed[/green]"
+        )
+        console.print(
+            f"  {time.strftime('%H:%M:%S')}  tree {tree[:12]}  "
+            f"{ran} run, {len(results) - ran} cached  {status}"
+        )
+
+    try:
+        watch(
+            repo_info.root,
+            cache,
+            profile=profile,
+            debounce=debounce,
+            in_process=bool(config.get("runners", {}).get("in_process", False)),
+            options=config.get("runners", {}),
+            artifacts=ArtifactStore(state_dir(repo_info.root) / ARTIFACTS_DIR),
+            watcher=watcher,
+            on_run=report,
+        )
+    except KeyboardInterrupt:
+        console.print("\nStopped watching.")
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Protocol
+
+import git
+
+from octp.core import cbor
+from octp.core.policy import CompiledPolicy, Policy
+from octp.core.validator import check_integrity, validate_envelope_bytes
+from octp.git.notes import NotesReader
+from octp.git.reader import open_repo
+from octp.identity.keyring import KeyRing
+from octp.output.archive import ArchiveReader
+from octp.output.encoding import is_cbor
+
+
+@dataclass
+class AuditResult:
+    commit: str
+    status: str  # "valid", "missing", "invalid" or "policy_violation"
+    reason: str = ""
+    contribution_id: str | None = None
+    signature_verified: bool | None = None
+
+
+class EnvelopeSource(Protocol):
+    def lookup(self, commit: str) -> list[bytes]:
+        """Raw envelope documents recorded for a full commit hash."""
+        ...
+
+
+class NotesSource:
+    def __init__(self, path: Path, ref: str) -> None:
+        self.reader = NotesReader(path, ref)
+
+    def lookup(self, commit: str) -> list[bytes]:
+        data = self.reader.get(commit)
+        return [data] if data is not None else []
+
+
+class ArchiveSource:
+    def __init__(self, path: Path) -> None:
+        self.reader = ArchiveReader(path)
+
+    def lookup(self, commit: str) -> list[bytes]:
+        return [self.reader.record(e) for e in self.reader.commit_entries(commit)]
+
+
+class DirectorySource:
+    """Envelope files under a directory, indexed by commit on first use."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._index: dict[str, list[Path]] | None = None
+
+    def _build_index(self) -> dict[str, list[Path]]:
+        index: dict[str, list[Path]] = {}
+        for pattern in ("*.json", "*.cbor"):
+            for file in self.path.rglob(pattern):
+                try:
+                    data = file.read_bytes()
+                    doc = cbor.loads(data) if is_cbor(data) else json.loads(data)
+                    commit = doc["commit_hash"]
+                except Exception:
+                    continue  # not an envelope
+                index.setdefault(commit, []).append(file)
+        return index
+
+    def lookup(self, commit: str) -> list[bytes]:
+        if self._index is None:
+            self._index = self._build_index()
+        return [file.read_bytes() for file in self._index.get(commit, [])]
+
+
+def iter_commits(
+    rev_range: str, path: Path = Path("."), since: str | None = None
+) -> Iterator[str]:
+    """Stream commit hashes from ``git rev-list`` as git produces them.
+
+    The range is checked before anything is streamed: an unknown revision
+    raises ValueError here rather than midway through the iteration.
+    """
+    repo = open_repo(path)
+    for end in re.split(r"\.{2,3}", rev_range):
+        rev = end.removeprefix("^")
+        if not rev:
+            continue  # "A.." means "A..HEAD"
+        try:
+            repo.git.rev_parse("--verify", "--quiet", f"{rev}^{{commit}}")
+        except git.GitCommandError:
+            repo.close()
+            raise ValueError(f"Invalid revision range {rev_range}: unknown {rev}")
+    args = [rev_range] + ([f"--since={since}"] if since else [])
+    proc = repo.git.rev_list(*args, as_process=True)
+    return _stream(proc, repo)
+
+
+def _stream(proc: Any, repo: git.Repo) -> Iterator[str]:
+    try:
+        for line in proc.stdout:
+            yield line.decode().strip()
+    finally:
+        proc.wait()
+        repo.close()
+
+
+_worker_keyring: KeyRing | None = None
+_worker_policy: CompiledPolicy | None = None
+
+
+def _init_worker(keyring: KeyRing | None, policy: Policy | None) -> None:
+    global _worker_keyring, _worker_policy
+    _worker_keyring = keyring
+    # Compiled checks are closures; compile per process instead of pickling
+    _worker_policy = policy.compile() if policy else None
+
+
+def verify_commit(
+    commit: str,
+    documents: list[bytes],
+    keyring: KeyRing | None = None,
+    policy: CompiledPolicy | None = None,
+) -> AuditResult:
+    """Check a commit's envelopes; one valid envelope is enough.
+
+    With a keyring, an envelope only passes if one of its keys verifies
+    the signature; a developer without a key fails the commit.
+    """
+    if not documents:
+        return AuditResult(commit, "missing", "No envelope found")
+
+    # With several envelopes the commit passes if any one does; otherwise
+    # the last failure is reported
+    failure = AuditResult(commit, "invalid")
+    for data in documents:
+        parsed = validate_envelope_bytes(data)
+        if parsed.envelope is None:
+            reason = f"Could not parse envelope: {parsed.summary()}"
+            failure = AuditResult(commit, "invalid", reason)
+            continue
+        envelope = parsed.envelope
+        if envelope.commit_hash != commit:
+            reason = f"Envelope is for commit {envelope.commit_hash[:12]}"
+            failure = AuditResult(commit, "invalid", reason, envelope.contribution_id)
+            continue
+        result = check_integrity(envelope, keyring)
+        if not result.valid:
+            failure = AuditResult(
+                commit,
+                "invalid",
+                result.reason,
+                envelope.contribution_id,
+                result.signature_verified,
+            )
+            continue
+        if keyring is not None and result.signature_verified is None:
+            # Anyone can sign as a developer the keyring does not know
+            developer = envelope.provenance.developer_id
+            failure = AuditResult(
+                commit,
+                "invalid",
+                f"No trusted key for developer {developer}",
+                envelope.contribution_id,
+            )
+            continue
+        violations = policy.evaluate(envelope) if policy else []
+        if violations:
+            failure = AuditResult(
+                commit,
+                "policy_violation",
+                "; ".join(f"{v.rule}: {v.message}" for v in violations),
+                envelope.contribution_id,
+                result.signature_verified,
+            )
+            continue
+        return AuditResult(
+            commit,
+            "valid",
+            contribution_id=envelope.contribution_id,
+            signature_verified=result.signature_verified,
+        )
+    return failure
+
+
+def _verify_chunk(chunk: list[tuple[str, list[bytes]]]) -> list[AuditResult]:
+    return [
+        verify_commit(commit, docs, _worker_keyring, _worker_policy)
+        for commit, docs in chunk
+    ]
+
+
+def _chunks(
+    commits: Iterable[str], sources: list[EnvelopeSource], size: int
+) -> Iterator[list[tuple[str, list[bytes]]]]:
+    chunk = []
+    for commit in commits:
+        documents = [doc for source in sources for doc in source.lookup(commit)]
+        chunk.append((commit, documents))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def audit(
+    commits: Iterable[str],
+    sources: list[EnvelopeSource],
+    keyring: KeyRing | None = None,
+    workers: int | None = None,
+    chunk_size: int = 256,
+    policy: Policy | None = None,
+) -> Iterator[AuditResult]:
+    """Verify the envelopes of each commit, yielding results in input order.
+
+    Envelopes are fetched in this process (sources hold git and mmap
+    handles) and verified in chunks by a process pool. At most a few
+    chunks per worker are in flight, so memory stays flat however long
+    the history is.
+    """
+    workers = workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(keyring, policy)
+    ) as executor:
+        pending: deque[concurrent.futures.Future[list[AuditResult]]] = deque()
+        for chunk in _chunks(commits, sources, chunk_size):
+            pending.append(executor.submit(_verify_chunk, chunk))
+            if len(pending) >= workers * 4:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
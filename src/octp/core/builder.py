@@ -12,9 +12,9 @@ from octp.core.envelope import (
     Verification,
 )
 from octp.git.reader import RepoInfo
-from octp.identity.keymanager import sign_payload
+from octp.identity.keymanager import sign_payload, signature_algorithm
 from octp.integrity.hasher import hash_payload
-from octp.verification.base import CheckResult
+from octp.verification.base import NOT_APPLICABLE, CheckResult
 
 
 def build_envelope(
@@ -37,7 +37,17 @@ def build_envelope(
         developer_id=developer_id,
     )
 
-    # Build verification from check results
+    # Build verification from check results; skipped runners count as not run
+    not_applicable = sorted(
+        name
+        for name, result in check_results.items()
+        if result.status == NOT_APPLICABLE
+    )
+    check_results = {
+        name: result
+        for name, result in check_results.items()
+        if name not in not_applicable
+    }
     tests_result = check_results.get("pytest")
     static_result = check_results.get("semgrep") or check_results.get("bandit")
     deps_result = check_results.get("pip-audit")
@@ -61,6 +71,13 @@ def build_envelope(
             else "skipped"
         ),
         novel_dependencies_introduced=False,  # v0.1: always false, future runner
+        reports={
+            name: result.report_digest
+            for name, result in check_results.items()
+            if result.report_digest
+        }
+        or None,
+        not_applicable=not_applicable or None,
     )
 
     # Build optional context
@@ -96,7 +113,7 @@ def build_envelope(
     envelope.integrity = Integrity(
         payload_hash=payload_hash,
         developer_signature=signature,
-        signature_algorithm="ES256",
+        signature_algorithm=signature_algorithm(),
         signed_at=datetime.now(timezone.utc),
     )
 
@@ -0,0 +1,183 @@
+"""Deterministic CBOR (RFC 8949 §4.2.1) for JSON-compatible data.
+
+Only the subset of CBOR needed to mirror JSON is supported: integers,
+floats, text strings, byte strings, arrays, maps, booleans and null.
+Encoding follows the core deterministic rules — shortest-form heads,
+definite lengths only, shortest float that preserves the value, and map
+keys sorted by the bytewise order of their encoded form — so equal data
+always encodes to identical bytes.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any
+
+
+class CBORError(ValueError):
+    """Raised for data that cannot be encoded or decoded."""
+
+
+# Envelope field names repeat on every record; cache their encoded form
+_KEY_CACHE_SIZE = 4096
+_key_cache: dict[str, bytes] = {}
+
+
+def _head(major: int, value: int) -> bytes:
+    """Encode a major type and argument in the shortest form."""
+    mt = major << 5
+    if value < 24:
+        return bytes((mt | value,))
+    if value < 0x100:
+        return bytes((mt | 24, value))
+    if value < 0x10000:
+        return bytes((mt | 25,)) + value.to_bytes(2, "big")
+    if value < 0x100000000:
+        return bytes((mt | 26,)) + value.to_bytes(4, "big")
+    if value < 0x10000000000000000:
+        return bytes((mt | 27,)) + value.to_bytes(8, "big")
+    raise CBORError(f"Integer out of range for CBOR: {value}")
+
+
+def _float(value: float) -> bytes:
+    if math.isnan(value):
+        return b"\xf9\x7e\x00"  # canonical NaN
+    for fmt, prefix in (("e", b"\xf9"), ("f", b"\xfa")):
+        try:
+            packed = struct.pack(">" + fmt, value)
+        except OverflowError:
+            continue
+        if struct.unpack(">" + fmt, packed)[0] == value:
+            return prefix + packed
+    return b"\xfb" + struct.pack(">d", value)
+
+
+def _encode(obj: Any, out: bytearray) -> None:
+    # bool before int: bool is an int subclass
+    if obj is None:
+        out += b"\xf6"
+    elif obj is True:
+        out += b"\xf5"
+    elif obj is False:
+        out += b"\xf4"
+    elif isinstance(obj, int):
+        out += _head(0, obj) if obj >= 0 else _head(1, -1 - obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        out += _head(3, len(data))
+        out += data
+    elif isinstance(obj, float):
+        out += _float(obj)
+    elif isinstance(obj, (list, tuple)):
+        out += _head(4, len(obj))
+        for item in obj:
+            _encode(item, out)
+    elif isinstance(obj, dict):
+        items = []
+        for key, value in obj.items():
+            key_bytes = _key_cache.get(key) if isinstance(key, str) else None
+            if key_bytes is None:
+                buf = bytearray()
+                _encode(key, buf)
+                key_bytes = bytes(buf)
+                if isinstance(key, str) and len(_key_cache) < _KEY_CACHE_SIZE:
+                    _key_cache[key] = key_bytes
+            items.append((key_bytes, value))
+        items.sort(key=lambda item: item[0])
+        out += _head(5, len(items))
+        for i, (key_bytes, value) in enumerate(items):
+            if i and key_bytes == items[i - 1][0]:
+                raise CBORError("Duplicate map key")
+            out += key_bytes
+            _encode(value, out)
+    elif isinstance(obj, (bytes, bytearray)):
+        out += _head(2, len(obj))
+        out += obj
+    else:
+        raise CBORError(f"Cannot encode {type(obj).__name__} as CBOR")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as deterministic CBOR."""
+    out = bytearray()
+    _encode(obj, out)
+    return bytes(out)
+
+
+class _Decoder:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def _take(self, n: int) -> bytes:
+        end = self.pos + n
+        if end > len(self.data):
+            raise CBORError("Truncated CBOR data")
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def _argument(self, info: int) -> int:
+        if info < 24:
+            return info
+        if info == 24:
+            return self._take(1)[0]
+        if info == 25:
+            return int.from_bytes(self._take(2), "big")
+        if info == 26:
+            return int.from_bytes(self._take(4), "big")
+        if info == 27:
+            return int.from_bytes(self._take(8), "big")
+        raise CBORError("Indefinite-length items are not allowed")
+
+    def decode(self) -> Any:
+        initial = self._take(1)[0]
+        major, info = initial >> 5, initial & 0x1F
+        if major == 7:
+            if info == 20:
+                return False
+            if info == 21:
+                return True
+            if info == 22:
+                return None
+            if info == 25:
+                return struct.unpack(">e", self._take(2))[0]
+            if info == 26:
+                return struct.unpack(">f", self._take(4))[0]
+            if info == 27:
+                return struct.unpack(">d", self._take(8))[0]
+            raise CBORError(f"Unsupported simple value {info}")
+
+        value = self._argument(info)
+        if major == 0:
+            return value
+        if major == 1:
+            return -1 - value
+        if major == 2:
+            return self._take(value)
+        if major == 3:
+            try:
+                return self._take(value).decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise CBORError(f"Invalid UTF-8 in text string: {e}")
+        if major == 4:
+            return [self.decode() for _ in range(value)]
+        if major == 5:
+            result = {}
+            for _ in range(value):
+                key = self.decode()
+                if isinstance(key, (list, dict)):
+                    raise CBORError("Map keys must be scalars")
+                result[key] = self.decode()
+            return result
+        raise CBORError("CBOR tags are not supported")
+
+
+def loads(data: bytes) -> Any:
+    """Decode a single CBOR item, rejecting trailing bytes."""
+    decoder = _Decoder(bytes(data))
+    obj = decoder.decode()
+    if decoder.pos != len(decoder.data):
+        raise CBORError("Trailing bytes after CBOR item")
+    return obj
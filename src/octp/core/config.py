@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+import tomllib
+from pathlib import Path
+from typing import Any
+
+CONFIG_FILE = ".octp.toml"
+
+
+def find_config(repo_root: Path = Path(".")) -> Path | None:
+    """Locate the config file: $OCTP_CONFIG, else .octp.toml in repo_root."""
+    override = os.environ.get("OCTP_CONFIG")
+    if override:
+        return Path(override)
+    path = repo_root / CONFIG_FILE
+    return path if path.exists() else None
+
+
+def load_config(
+    path: Path | None = None, repo_root: Path = Path(".")
+) -> dict[str, Any]:
+    """Parse the OCTP config file. Returns {} when there is none."""
+    path = path or find_config(repo_root)
+    if path is None:
+        return {}
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Invalid TOML in {path}: {e}")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -56,6 +56,10 @@ class Verification(BaseModel):
     static_analysis_tool: Optional[str] = None
     dependency_check: AnalysisResult
     novel_dependencies_introduced: bool
+    # Runner name -> SHA-256 of its full report in the artifact store
+    reports: Optional[dict[str, str]] = None
+    # Runners skipped because no changed file concerned them
+    not_applicable: Optional[list[str]] = None
 
 
 class Integrity(BaseModel):
@@ -83,8 +87,20 @@ class OCTPEnvelope(BaseModel):
     integrity: Optional[Integrity] = None
     optional_context: Optional[OptionalContext] = None
 
-    def to_signable_dict(self) -> dict:
+    def to_canonical_dict(self) -> dict[str, Any]:
+        """Returns envelope as a JSON-mode dict for hashing.
+
+        Fields added after v0.1 are left out when unset, so envelopes
+        created before they existed keep the same hashes."""
+        d = self.model_dump(mode="json")
+        for field in ("reports", "not_applicable"):
+            if d["verification"].get(field) is None:
+                del d["verification"][field]
+        return d
+
+    def to_signable_dict(self) -> dict[str, Any]:
         """Returns envelope as dict excluding the integrity section.
         This is what gets hashed before signing."""
-        d = self.model_dump(mode="json", exclude={"integrity"})
+        d = self.to_canonical_dict()
+        del d["integrity"]
         return d
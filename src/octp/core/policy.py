@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from octp.core.config import load_config
+from octp.core.envelope import OCTPEnvelope, ProvenanceMethod, ReviewLevel
+
+# Review levels from least to most human involvement
+REVIEW_ORDER = (
+    ReviewLevel.NONE,
+    ReviewLevel.GLANCE,
+    ReviewLevel.MODERATE,
+    ReviewLevel.SUBSTANTIAL,
+    ReviewLevel.REWRITE,
+)
+
+
+@dataclass(frozen=True)
+class Violation:
+    rule: str  # the .octp.toml key that was violated
+    message: str
+
+
+@dataclass(frozen=True)
+class Policy:
+    """Acceptance rules from the [policy] and [identity] sections."""
+
+    require_envelope: bool = False
+    minimum_review_level: Optional[ReviewLevel] = None
+    block_on_failed_tests: bool = False
+    allow_unreviewed_ai: bool = True
+    require_signed_envelope: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> Policy:
+        section = {**config.get("policy", {})}
+        identity = config.get("identity", {})
+        if "require_signed_envelope" in identity:
+            section.setdefault(
+                "require_signed_envelope", identity["require_signed_envelope"]
+            )
+
+        values: dict[str, Any] = {}
+        for f in fields(cls):
+            if f.name not in section:
+                continue
+            value = section[f.name]
+            if f.name == "minimum_review_level":
+                try:
+                    value = ReviewLevel(value)
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid minimum_review_level: {value!r}. Options: "
+                        f"{', '.join(level.value for level in REVIEW_ORDER)}"
+                    )
+            elif not isinstance(value, bool):
+                raise ValueError(f"policy.{f.name} must be true or false")
+            values[f.name] = value
+        return cls(**values)
+
+    @classmethod
+    def load(cls, path: Path | None = None, repo_root: Path = Path(".")) -> Policy:
+        return cls.from_config(load_config(path, repo_root))
+
+    def compile(self) -> CompiledPolicy:
+        return CompiledPolicy(self)
+
+
+Check = Callable[[OCTPEnvelope], Optional[Violation]]
+
+
+class CompiledPolicy:
+    """A policy reduced to the checks it actually enables.
+
+    Each rule becomes a closure over precomputed constants, including the
+    Violation objects it can return, so evaluating an envelope is a few
+    attribute reads and set lookups with no allocation on the happy path.
+    """
+
+    def __init__(self, policy: Policy) -> None:
+        self.policy = policy
+        self._checks = tuple(self._build(policy))
+
+    @staticmethod
+    def _build(policy: Policy) -> list[Check]:
+        checks: list[Check] = []
+
+        if not policy.allow_unreviewed_ai:
+            unreviewed = Violation(
+                "allow_unreviewed_ai",
+                "AI-generated contribution declared as unreviewed",
+            )
+
+            def check_unreviewed(e: OCTPEnvelope) -> Violation | None:
+                if e.provenance.method is ProvenanceMethod.AI_GENERATED_UNREVIEWED:
+                    return unreviewed
+                return None
+
+            checks.append(check_unreviewed)
+
+        if policy.minimum_review_level is not None:
+            minimum = policy.minimum_review_level
+            too_low = {
+                level: Violation(
+                    "minimum_review_level",
+                    f"Review level {level.value} is below {minimum.value}",
+                )
+                for level in REVIEW_ORDER[: REVIEW_ORDER.index(minimum)]
+            }
+
+            # Review requirements apply to AI involvement; human-only work
+            # has no AI output to review
+            def check_review(e: OCTPEnvelope) -> Violation | None:
+                if e.provenance.method is ProvenanceMethod.HUMAN_ONLY:
+                    return None
+                return too_low.get(e.provenance.human_review_level)
+
+            checks.append(check_review)
+
+        if policy.block_on_failed_tests:
+            failed = Violation("block_on_failed_tests", "Tests failed")
+
+            def check_tests(e: OCTPEnvelope) -> Violation | None:
+                return failed if e.verification.tests_passed is False else None
+
+            checks.append(check_tests)
+
+        # Presence only: the policy has no keys, so the signature itself is
+        # checked by the caller's keyring (``octp audit --public-key``)
+        if policy.require_signed_envelope:
+            unsigned = Violation(
+                "require_signed_envelope",
+                "Envelope carries no developer signature",
+            )
+
+            def check_signed(e: OCTPEnvelope) -> Violation | None:
+                if e.integrity is None or not e.integrity.developer_signature:
+                    return unsigned
+                return None
+
+            checks.append(check_signed)
+
+        return checks
+
+    def evaluate(self, envelope: OCTPEnvelope) -> list[Violation]:
+        """Every rule the envelope violates, in a stable order."""
+        violations = []
+        for check in self._checks:
+            violation = check(envelope)
+            if violation is not None:
+                violations.append(violation)
+        return violations
+
+    def allows(self, envelope: OCTPEnvelope) -> bool:
+        """True if no rule is violated; stops at the first violation."""
+        for check in self._checks:
+            if check(envelope) is not None:
+                return False
+        return True
+
+    def evaluate_many(self, envelopes: list[OCTPEnvelope]) -> list[list[Violation]]:
+        evaluate = self.evaluate
+        return [evaluate(e) for e in envelopes]
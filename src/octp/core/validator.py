@@ -1,28 +1,170 @@
 from __future__ import annotations
 
+import functools
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
+from pydantic import TypeAdapter, ValidationError
+
+from octp.core import cbor
 from octp.core.envelope import OCTPEnvelope
+from octp.identity.keymanager import ALGORITHMS
+from octp.identity.keyring import KeyRing
+from octp.integrity.hasher import hash_payload
+from octp.output.encoding import is_cbor
 
 
-def validate_envelope_json(data: dict) -> bool:
-    """Validate that a dict conforms to OCTP v0.1 envelope schema."""
+@dataclass
+class IntegrityResult:
+    valid: bool
+    reason: str = ""
+    signature_verified: bool | None = None  # None = no public key available
+
+
+@dataclass
+class ValidationIssue:
+    loc: str  # dotted path into the envelope, e.g. "provenance.method"
+    message: str
+    type: str  # pydantic error type, e.g. "enum" or "json_invalid"
+
+
+@dataclass
+class ValidationResult:
+    envelope: OCTPEnvelope | None
+    errors: list[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return self.envelope is not None
+
+    def summary(self) -> str:
+        """One-line description of the errors, for console output."""
+        return "; ".join(
+            f"{e.loc}: {e.message}" if e.loc else e.message for e in self.errors
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def envelope_adapter() -> TypeAdapter[OCTPEnvelope]:
+    return TypeAdapter(OCTPEnvelope)
+
+
+@functools.lru_cache(maxsize=None)
+def envelope_list_adapter() -> TypeAdapter[list[OCTPEnvelope]]:
+    return TypeAdapter(list[OCTPEnvelope])
+
+
+def _issues(error: ValidationError) -> list[ValidationIssue]:
+    return [
+        ValidationIssue(
+            loc=".".join(str(part) for part in e["loc"]),
+            message=e["msg"],
+            type=e["type"],
+        )
+        for e in error.errors(include_url=False)
+    ]
+
+
+def validate_envelope_bytes(data: bytes) -> ValidationResult:
+    """Validate raw envelope bytes (JSON or CBOR) in a single pass."""
+    try:
+        if is_cbor(data):
+            envelope = envelope_adapter().validate_python(cbor.loads(data))
+            return ValidationResult(envelope)
+        return ValidationResult(envelope_adapter().validate_json(data))
+    except ValidationError as e:
+        return ValidationResult(None, _issues(e))
+    except cbor.CBORError as e:
+        return ValidationResult(None, [ValidationIssue("", str(e), "cbor_invalid")])
+
+
+def validate_envelope_data(data: Any) -> ValidationResult:
+    """Validate an already-decoded envelope."""
     try:
-        OCTPEnvelope.model_validate(data)
-        return True
-    except Exception:
-        return False
+        return ValidationResult(envelope_adapter().validate_python(data))
+    except ValidationError as e:
+        return ValidationResult(None, _issues(e))
+
+
+def validate_envelope_array(data: bytes) -> list[ValidationResult]:
+    """Validate a JSON array of envelopes, one result per element.
+
+    The whole array is validated in one call; only when something fails is
+    it re-validated element by element to attribute the errors.
+    Raises ValueError if ``data`` is not a JSON array.
+    """
+    try:
+        envelopes = envelope_list_adapter().validate_json(data)
+        return [ValidationResult(envelope) for envelope in envelopes]
+    except ValidationError:
+        pass
+    try:
+        items = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array of envelopes")
+    return [validate_envelope_data(item) for item in items]
+
+
+def validate_many(blobs: Iterable[bytes]) -> Iterator[ValidationResult]:
+    """Validate a stream of envelope documents, reusing the cached adapter."""
+    for blob in blobs:
+        yield validate_envelope_bytes(blob)
+
+
+def validate_envelope_json(data: dict) -> bool:
+    """Validate that a dict conforms to OCTP v0.1 envelope schema.
+
+    Use validate_envelope_data() to get the reasons for a failure.
+    """
+    return validate_envelope_data(data).valid
 
 
 def validate_envelope_file(path: Path) -> tuple[bool, str]:
     """Validate an envelope file.
     Returns (is_valid, error_message)."""
     try:
-        data = json.loads(path.read_text())
-        OCTPEnvelope.model_validate(data)
+        result = validate_envelope_bytes(path.read_bytes())
+    except OSError as e:
+        return False, f"Could not read file: {e}"
+    if result.valid:
         return True, ""
-    except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {e}"
-    except Exception as e:
-        return False, f"Schema validation failed: {e}"
+    if any(e.type == "json_invalid" for e in result.errors):
+        return False, f"Invalid JSON: {result.summary()}"
+    return False, f"Schema validation failed: {result.summary()}"
+
+
+def check_integrity(
+    envelope: OCTPEnvelope, keyring: KeyRing | None = None
+) -> IntegrityResult:
+    """Recompute the payload hash and, if a key is known, check the signature."""
+    if not envelope.integrity:
+        return IntegrityResult(False, "No integrity section found in envelope")
+
+    computed_hash = hash_payload(envelope.to_signable_dict())
+    if computed_hash != envelope.integrity.payload_hash:
+        return IntegrityResult(
+            False, "Payload hash mismatch — envelope has been tampered with"
+        )
+
+    if keyring is None:
+        return IntegrityResult(True)
+
+    verified = keyring.verify(
+        envelope.provenance.developer_id,
+        envelope.integrity.payload_hash,
+        envelope.integrity.developer_signature,
+        envelope.integrity.signature_algorithm,
+    )
+    if verified is False:
+        algorithm = envelope.integrity.signature_algorithm
+        reason = (
+            "Signature does not match the developer's public key"
+            if algorithm in ALGORITHMS
+            else f"Unsupported signature algorithm {algorithm!r}"
+        )
+        return IntegrityResult(False, reason, signature_verified=False)
+    return IntegrityResult(True, signature_verified=verified)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import git
+
+from octp.git.reader import open_repo
+
+NOTES_REF = "refs/notes/octp"
+
+
+def add_note(
+    content: bytes,
+    commit: str = "HEAD",
+    path: Path = Path("."),
+    ref: str = NOTES_REF,
+) -> str:
+    """Attach ``content`` to ``commit`` under the notes ref, replacing any
+    existing note. Returns the note blob's object id.
+
+    The blob is written directly and attached with ``git notes add -C`` so
+    git's message cleanup never rewrites the envelope bytes.
+    """
+    repo = open_repo(path)
+    try:
+        # git reads stdin from a real file handle, so spool the bytes
+        with tempfile.TemporaryFile() as f:
+            f.write(content)
+            f.seek(0)
+            blob: str = repo.git.hash_object("-w", "--stdin", istream=f)
+        repo.git.notes("--ref", ref, "add", "-f", "-C", blob, commit)
+    finally:
+        repo.close()
+    return blob
+
+
+class NotesReader:
+    """Batched reads of envelopes stored as git notes.
+
+    The note index is listed once, and note blobs are read through
+    GitPython's persistent ``git cat-file --batch`` process, so reading any
+    number of commits costs two process spawns. Not thread-safe.
+    """
+
+    def __init__(self, path: Path = Path("."), ref: str = NOTES_REF) -> None:
+        self.repo = open_repo(path)
+        self.ref = ref
+        self._index: dict[str, str] | None = None
+
+    def __enter__(self) -> NotesReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.repo.close()
+
+    @property
+    def index(self) -> dict[str, str]:
+        """Map of annotated commit hash to note blob id."""
+        if self._index is None:
+            try:
+                listing = self.repo.git.notes("--ref", self.ref, "list")
+            except git.GitCommandError:
+                listing = ""  # ref does not exist yet
+            self._index = {}
+            for line in listing.splitlines():
+                blob, _, commit = line.partition(" ")
+                self._index[commit] = blob
+        return self._index
+
+    def get(self, commit: str) -> bytes | None:
+        """Return the note attached to a full commit hash, if any."""
+        blob = self.index.get(commit)
+        if blob is None:
+            return None
+        _, _, _, data = self.repo.git.get_object_data(blob)
+        return data
+
+    def read_many(self, commits: Iterable[str]) -> Iterator[tuple[str, bytes | None]]:
+        """Yield ``(commit, note)`` for each commit, in order."""
+        for commit in commits:
+            yield commit, self.get(commit)
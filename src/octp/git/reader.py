@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
 import re
+import shutil
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -15,15 +18,20 @@ class RepoInfo:
     root: Path
 
 
-def read_repo(path: Path = Path(".")) -> RepoInfo:
-    """Read current git repository state."""
+def open_repo(path: Path = Path(".")) -> git.Repo:
+    """Open the git repository containing ``path``."""
     try:
-        repo = git.Repo(path, search_parent_directories=True)
-    except git.InvalidGitRepositoryError:
+        return git.Repo(path, search_parent_directories=True)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
         raise RuntimeError(
             "Not inside a git repository. Run octp from within a git project."
         )
 
+
+def read_repo(path: Path = Path(".")) -> RepoInfo:
+    """Read current git repository state."""
+    repo = open_repo(path)
+
     commit_hash = repo.head.commit.hexsha
 
     # Normalise remote URL to platform/org/repo format
@@ -62,3 +70,38 @@ def _parse_remote(repo: git.Repo) -> str:
         return f"{host}/{path}"
 
     return remote_url
+
+
+def state_dir(path: Path = Path(".")) -> Path:
+    """octp's per-repository state directory, ``<git dir>/octp``.
+
+    Lives in the common git dir so linked worktrees share it.
+    """
+    directory = Path(open_repo(path).common_dir) / "octp"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def working_tree_hash(path: Path = Path(".")) -> str:
+    """Git tree id of the working tree as it is on disk.
+
+    Includes uncommitted and untracked (but not ignored) files. Built in a
+    scratch copy of the index so the real index is never touched; copying
+    it lets git reuse cached stat data instead of rehashing every file.
+    """
+    repo = open_repo(path)
+    index = Path(repo.git_dir) / "index"
+    fd, scratch = tempfile.mkstemp(prefix="octp-index-")
+    os.close(fd)
+    try:
+        if index.exists():
+            shutil.copyfile(index, scratch)
+        else:
+            os.unlink(scratch)
+        env = {"GIT_INDEX_FILE": scratch}
+        repo.git.add("-A", env=env)
+        tree: str = repo.git.write_tree(env=env)
+        return tree
+    finally:
+        if os.path.exists(scratch):
+            os.unlink(scratch)
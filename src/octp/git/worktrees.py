@@ -0,0 +1,83 @@
+"""A pool of detached git worktrees, reused across runs.
+
+Checking a commit out into a worktree that already holds a nearby commit
+only rewrites the files that differ, so backfilling many commits costs
+far less than cloning or creating a worktree for each. The worktrees
+live in ``<git dir>/octp/worktrees`` and are kept for the next run.
+"""
+
+from __future__ import annotations
+
+import queue
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import git
+
+from octp.git.reader import open_repo, state_dir
+
+WORKTREES_DIR = "worktrees"
+
+
+class WorktreePool:
+    """``size`` worktrees of one repository, handed out one at a time.
+
+    Args:
+        repo_root: Any path inside the repository
+        size: Number of worktrees (and so of commits checked out at once)
+    """
+
+    def __init__(self, repo_root: Path, size: int) -> None:
+        self.repo = open_repo(repo_root)
+        self.directory = state_dir(repo_root) / WORKTREES_DIR
+        self.paths = [self._prepare(self.directory / f"wt-{i}") for i in range(size)]
+        self._free: queue.Queue[Path] = queue.Queue()
+        for path in self.paths:
+            self._free.put(path)
+
+    def _registered(self) -> set[Path]:
+        listing = self.repo.git.worktree("list", "--porcelain")
+        return {
+            Path(line[len("worktree ") :]).resolve()
+            for line in listing.splitlines()
+            if line.startswith("worktree ")
+        }
+
+    def _prepare(self, path: Path) -> Path:
+        """Reuse ``path`` if it is still a worktree, else (re)create it."""
+        self.repo.git.worktree("prune")
+        if path.resolve() in self._registered():
+            return path
+        if path.exists():
+            shutil.rmtree(path)  # left over from an interrupted setup
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.repo.git.worktree("add", "--detach", str(path), "HEAD")
+        return path
+
+    @contextmanager
+    def checkout(self, commit: str) -> Iterator[Path]:
+        """Borrow a worktree with ``commit`` checked out and nothing else.
+
+        Local changes and untracked or ignored files left by a previous
+        commit's checks are discarded first, so every commit is checked
+        from a pristine tree.
+        """
+        path = self._free.get()
+        try:
+            wt = git.Repo(path)
+            try:
+                wt.git.checkout("--detach", "--force", commit)
+                wt.git.clean("-ffdxq")
+            finally:
+                wt.close()
+            yield path
+        finally:
+            self._free.put(path)
+
+    def remove(self) -> None:
+        """Delete every worktree in the pool."""
+        for path in self.paths:
+            self.repo.git.worktree("remove", "--force", str(path))
+        self.repo.close()
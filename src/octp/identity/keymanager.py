@@ -1,25 +1,52 @@
 from __future__ import annotations
 
 import base64
+from datetime import datetime, timezone
 from pathlib import Path
 
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+    PublicKeyTypes,
+)
 
 KEYS_DIR = Path.home() / ".octp" / "keys"
 PRIVATE_KEY_FILE = KEYS_DIR / "private.pem"
 PUBLIC_KEY_FILE = KEYS_DIR / "public.pem"
+RETIRED_DIR = "retired"
 
+# Values of Integrity.signature_algorithm (JOSE names)
+ES256 = "ES256"
+EDDSA = "EdDSA"
+ALGORITHMS = (ES256, EDDSA)
+DEFAULT_ALGORITHM = ES256
 
-def ensure_keypair() -> None:
-    """Generate keypair if it doesn't exist."""
-    if PRIVATE_KEY_FILE.exists():
-        return
-    KEYS_DIR.mkdir(parents=True, exist_ok=True)
-    private_key = ec.generate_private_key(ec.SECP256R1())
-    public_key = private_key.public_key()
 
-    with open(PRIVATE_KEY_FILE, "wb") as f:
+def key_algorithm(key: PrivateKeyTypes | PublicKeyTypes) -> str | None:
+    """The signature algorithm a key is used with, or None if unsupported."""
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        return ES256 if isinstance(key.curve, ec.SECP256R1) else None
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return EDDSA
+    return None
+
+
+def generate_private_key(algorithm: str = DEFAULT_ALGORITHM) -> PrivateKeyTypes:
+    if algorithm == ES256:
+        return ec.generate_private_key(ec.SECP256R1())
+    if algorithm == EDDSA:
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(
+        f"Unsupported signature algorithm {algorithm!r} — "
+        f"expected one of {', '.join(ALGORITHMS)}"
+    )
+
+
+def _write_keypair(private_key: PrivateKeyTypes, keys_dir: Path) -> None:
+    keys_dir.mkdir(parents=True, exist_ok=True)
+    private_file = keys_dir / PRIVATE_KEY_FILE.name
+    with open(private_file, "wb") as f:
         f.write(
             private_key.private_bytes(
                 encoding=serialization.Encoding.PEM,
@@ -27,29 +54,61 @@ def ensure_keypair() -> None:
                 encryption_algorithm=serialization.NoEncryption(),
             )
         )
-    PRIVATE_KEY_FILE.chmod(0o600)
+    private_file.chmod(0o600)
 
-    with open(PUBLIC_KEY_FILE, "wb") as f:
+    with open(keys_dir / PUBLIC_KEY_FILE.name, "wb") as f:
         f.write(
-            public_key.public_bytes(
+            private_key.public_key().public_bytes(
                 encoding=serialization.Encoding.PEM,
                 format=serialization.PublicFormat.SubjectPublicKeyInfo,
             )
         )
 
 
+def ensure_keypair(
+    algorithm: str = DEFAULT_ALGORITHM, keys_dir: Path = KEYS_DIR
+) -> None:
+    """Generate keypair if it doesn't exist.
+
+    ``algorithm`` only applies to a new key; an existing key is kept
+    whatever its type.
+    """
+    if (keys_dir / PRIVATE_KEY_FILE.name).exists():
+        return
+    _write_keypair(generate_private_key(algorithm), keys_dir)
+
+
+def load_private_key(keys_dir: Path = KEYS_DIR) -> PrivateKeyTypes:
+    """The developer's private key, generated on first use."""
+    ensure_keypair(keys_dir=keys_dir)
+    data = (keys_dir / PRIVATE_KEY_FILE.name).read_bytes()
+    return serialization.load_pem_private_key(data, password=None)
+
+
+def signature_algorithm(keys_dir: Path = KEYS_DIR) -> str:
+    """Algorithm of the developer's key, for Integrity.signature_algorithm."""
+    algorithm = key_algorithm(load_private_key(keys_dir))
+    if algorithm is None:
+        raise ValueError(f"Unsupported key type in {keys_dir / PRIVATE_KEY_FILE.name}")
+    return algorithm
+
+
+def sign_with_key(payload_hash: str, private_key: PrivateKeyTypes) -> str:
+    """Sign a payload hash with an already-loaded key. Returns base64."""
+    data = payload_hash.encode()
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        signature = private_key.sign(data)
+    elif isinstance(private_key, ec.EllipticCurvePrivateKey):
+        signature = private_key.sign(data, ec.ECDSA(hashes.SHA256()))
+    else:
+        raise ValueError(f"Unsupported key type {type(private_key).__name__}")
+    return base64.b64encode(signature).decode()
+
+
 def sign_payload(payload_hash: str) -> str:
     """Sign a payload hash with the developer's private key.
     Returns base64-encoded signature."""
-    ensure_keypair()
-    with open(PRIVATE_KEY_FILE, "rb") as f:
-        private_key = serialization.load_pem_private_key(f.read(), password=None)
-
-    signature = private_key.sign(
-        payload_hash.encode(),
-        ec.ECDSA(hashes.SHA256()),
-    )
-    return base64.b64encode(signature).decode()
+    return sign_with_key(payload_hash, load_private_key())
 
 
 def get_public_key_pem() -> str:
@@ -58,18 +117,78 @@ def get_public_key_pem() -> str:
     return PUBLIC_KEY_FILE.read_text()
 
 
-def verify_signature(
-    payload_hash: str, signature_b64: str, public_key_pem: str
+def migrate_keypair(algorithm: str, keys_dir: Path = KEYS_DIR) -> Path | None:
+    """Replace the developer's key with a new one for ``algorithm``.
+
+    The old pair is moved to ``retired/<timestamp>-<algorithm>-*.pem``
+    and its directory returned (None if there was no key): publish the
+    new public key next to the old one so envelopes signed before the
+    switch keep verifying.
+    """
+    new_key = generate_private_key(algorithm)
+    private_file = keys_dir / PRIVATE_KEY_FILE.name
+    if not private_file.exists():
+        _write_keypair(new_key, keys_dir)
+        return None
+    old_algorithm = signature_algorithm(keys_dir)
+    if old_algorithm == algorithm:
+        raise ValueError(f"The current key already uses {algorithm}")
+    retired = keys_dir / RETIRED_DIR
+    retired.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    prefix = f"{stamp}-{old_algorithm}"
+    private_file.rename(retired / f"{prefix}-private.pem")
+    public_file = keys_dir / PUBLIC_KEY_FILE.name
+    if public_file.exists():
+        public_file.rename(retired / f"{prefix}-public.pem")
+    _write_keypair(new_key, keys_dir)
+    return retired
+
+
+def load_public_key(public_key_pem: str) -> PublicKeyTypes:
+    """Parse a PEM-encoded public key."""
+    return serialization.load_pem_public_key(public_key_pem.encode())
+
+
+def verify_with_key(
+    payload_hash: str,
+    signature_b64: str,
+    public_key: PublicKeyTypes,
+    algorithm: str | None = None,
 ) -> bool:
-    """Verify a signature against a payload hash and public key."""
+    """Verify a signature against a payload hash and an already-loaded key.
+
+    The scheme follows the key type. When the envelope's ``algorithm`` is
+    given it must match the key, so a signature is never checked under
+    an algorithm other than the one it claims.
+    """
+    key_alg = key_algorithm(public_key)
+    if key_alg is None or (algorithm is not None and algorithm != key_alg):
+        return False
     try:
-        public_key = serialization.load_pem_public_key(public_key_pem.encode())
         signature = base64.b64decode(signature_b64)
-        public_key.verify(
-            signature,
-            payload_hash.encode(),
-            ec.ECDSA(hashes.SHA256()),
-        )
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            public_key.verify(signature, payload_hash.encode())
+        elif isinstance(public_key, ec.EllipticCurvePublicKey):
+            public_key.verify(
+                signature, payload_hash.encode(), ec.ECDSA(hashes.SHA256())
+            )
+        else:
+            return False
         return True
     except Exception:
         return False
+
+
+def verify_signature(
+    payload_hash: str,
+    signature_b64: str,
+    public_key_pem: str,
+    algorithm: str | None = None,
+) -> bool:
+    """Verify a signature against a payload hash and public key."""
+    try:
+        public_key = load_public_key(public_key_pem)
+    except Exception:
+        return False
+    return verify_with_key(payload_hash, signature_b64, public_key, algorithm)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+
+from octp.identity.keymanager import (
+    ALGORITHMS,
+    key_algorithm,
+    load_public_key,
+    verify_with_key,
+)
+
+
+class KeyRing:
+    """Developer public keys, parsed once and kept in memory.
+
+    Long-running verifiers (the verification server, audits) look keys up
+    by ``developer_id`` instead of re-reading PEM files per envelope. A
+    developer may have several keys, e.g. the old ES256 key and the new
+    EdDSA key after ``octp keys migrate``.
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[str, list[PublicKeyTypes]] = {}
+        self._pems: dict[str, list[str]] = {}
+
+    # Loaded keys cannot be pickled; ship the PEMs to worker processes instead
+    def __getstate__(self) -> dict[str, list[str]]:
+        return self._pems
+
+    def __setstate__(self, pems: dict[str, list[str]]) -> None:
+        self.__init__()  # type: ignore[misc]
+        for developer_id, developer_pems in pems.items():
+            for pem in developer_pems:
+                self.add(developer_id, pem)
+
+    @classmethod
+    def from_specs(cls, specs: list[str]) -> KeyRing:
+        """Build a keyring from ``developer_id=path/to/public.pem`` strings.
+
+        A developer_id may appear more than once to load several keys.
+        """
+        keyring = cls()
+        for spec in specs:
+            developer_id, sep, path = spec.partition("=")
+            if not sep or not developer_id or not path:
+                raise ValueError(
+                    f"Invalid key spec {spec!r} — expected developer_id=path.pem"
+                )
+            keyring.add_file(developer_id, Path(path))
+        return keyring
+
+    def add(self, developer_id: str, public_key_pem: str) -> None:
+        if public_key_pem in self._pems.get(developer_id, []):
+            return
+        public_key = load_public_key(public_key_pem)
+        if key_algorithm(public_key) is None:
+            raise ValueError(
+                f"Unsupported key type for {developer_id} — "
+                f"expected one of {', '.join(ALGORITHMS)}"
+            )
+        self._keys.setdefault(developer_id, []).append(public_key)
+        self._pems.setdefault(developer_id, []).append(public_key_pem)
+
+    def add_file(self, developer_id: str, path: Path) -> None:
+        self.add(developer_id, path.read_text())
+
+    def __contains__(self, developer_id: object) -> bool:
+        return developer_id in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def verify(
+        self,
+        developer_id: str,
+        payload_hash: str,
+        signature_b64: str,
+        algorithm: str | None = None,
+    ) -> bool | None:
+        """Verify a signature with one of the developer's keys.
+
+        Only keys of the given ``algorithm`` are tried. Returns None when
+        no key is known for the developer.
+        """
+        public_keys = self._keys.get(developer_id)
+        if not public_keys:
+            return None
+        return any(
+            verify_with_key(payload_hash, signature_b64, key, algorithm)
+            for key in public_keys
+            if algorithm is None or key_algorithm(key) == algorithm
+        )
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+from typing import Any
 
+from octp.core import cbor
 
-def hash_payload(data: dict) -> str:
+
+def hash_payload(data: dict[str, Any]) -> str:
     """Compute SHA-256 hash of envelope payload.
 
     Data is serialised to JSON with sorted keys for determinism.
@@ -12,3 +15,13 @@ def hash_payload(data: dict) -> str:
     """
     serialised = json.dumps(data, sort_keys=True, ensure_ascii=True)
     return hashlib.sha256(serialised.encode()).hexdigest()
+
+
+def hash_cbor(data: dict[str, Any]) -> str:
+    """Compute SHA-256 hash of data in deterministic CBOR form.
+
+    Independent of JSON formatting, so the same envelope hashes the same
+    whether it was stored as pretty JSON, compact JSON or CBOR.
+    Returns lowercase hex string.
+    """
+    return hashlib.sha256(cbor.dumps(data)).hexdigest()
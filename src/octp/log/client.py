@@ -0,0 +1,166 @@
+"""Client for an octp transparency log server.
+
+Nothing the server says is taken on trust: inclusion proofs are checked
+against a tree head, and every new tree head is checked to extend the
+last one this machine saw. A log that drops or replaces an entry cannot
+produce that consistency proof, so the client raises instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .merkle import leaf_hash, verify_consistency, verify_inclusion
+from .store import TreeHead, parse_digest
+
+LOG_PATH = "/v1/log/"
+HEADS_DIR = Path.home() / ".octp" / "log"
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    digest: str
+    index: int
+    head: TreeHead
+    path: list[str]
+
+    def verify(self) -> bool:
+        try:
+            return verify_inclusion(
+                leaf_hash(parse_digest(self.digest)),
+                self.index,
+                self.head.size,
+                [bytes.fromhex(node) for node in self.path],
+                bytes.fromhex(self.head.root),
+            )
+        except ValueError:
+            return False
+
+
+def _head(data: Any) -> TreeHead:
+    try:
+        head = TreeHead(int(data["tree_size"]), str(data["root"]))
+        parse_digest(head.root)
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Malformed tree head: {data!r}")
+    return head
+
+
+class LogClient:
+    """Talks to a log server over HTTP.
+
+    Args:
+        url: Base URL of the log server
+        heads_dir: Where the last verified tree head of each log is kept;
+            None to check consistency within this client's lifetime only
+
+    Network failures raise OSError. Entries the log does not hold raise
+    KeyError, and a log that breaks its append-only promise ValueError.
+    """
+
+    def __init__(
+        self, url: str, heads_dir: Path | None = HEADS_DIR, timeout: float = 5.0
+    ) -> None:
+        self.url = url.rstrip("/")
+        self.heads_dir = heads_dir
+        self.timeout = timeout
+        self._seen: TreeHead | None = None
+
+    def _request(
+        self, path: str, params: dict[str, Any] | None = None, body: Any = None
+    ) -> Any:
+        url = self.url + LOG_PATH + path
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        request = urllib.request.Request(
+            url,
+            data=None if body is None else json.dumps(body).encode(),
+            method="GET" if body is None else "POST",
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get("error", e.reason)
+            except (OSError, ValueError, AttributeError):
+                message = e.reason
+            if e.code == 404:
+                raise KeyError(message)
+            raise ValueError(f"Log server error {e.code}: {message}")
+
+    def append(self, digest: str) -> int:
+        """Log an envelope digest; returns its leaf index."""
+        parse_digest(digest)
+        return int(self._request("entries", body={"digest": digest})["index"])
+
+    def _heads_file(self) -> Path | None:
+        if self.heads_dir is None:
+            return None
+        name = hashlib.sha256(self.url.encode()).hexdigest()[:16]
+        return self.heads_dir / f"{name}.json"
+
+    def _last_head(self) -> TreeHead | None:
+        path = self._heads_file()
+        if self._seen is not None or path is None:
+            return self._seen
+        try:
+            return _head(json.loads(path.read_bytes()))
+        except (OSError, ValueError):
+            return None
+
+    def _save_head(self, head: TreeHead) -> None:
+        self._seen = head
+        path = self._heads_file()
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"url": self.url, **head.to_dict()}, f)
+        os.replace(tmp, path)
+
+    def head(self) -> TreeHead:
+        """Current tree head, checked to extend the last one seen."""
+        head = _head(self._request("head"))
+        last = self._last_head()
+        if last is not None and last != head:
+            if last.size > head.size:
+                raise ValueError(f"Log shrank from {last.size} to {head.size} entries")
+            if last.size:
+                proof = self._request(
+                    "consistency", {"first": last.size, "second": head.size}
+                )
+                if not verify_consistency(
+                    last.size,
+                    head.size,
+                    bytes.fromhex(last.root),
+                    bytes.fromhex(head.root),
+                    [bytes.fromhex(node) for node in proof["proof"]],
+                ):
+                    raise ValueError(
+                        f"Log at size {head.size} is not an extension of the "
+                        f"head seen at size {last.size}: entries were changed"
+                    )
+        self._save_head(head)
+        return head
+
+    def prove(self, digest: str) -> InclusionProof:
+        """Fetch and check proof that ``digest`` is in the current log."""
+        parse_digest(digest)
+        head = self.head()
+        data = self._request("inclusion", {"digest": digest, "tree_size": head.size})
+        proof = InclusionProof(digest, int(data["index"]), head, list(data["proof"]))
+        if not proof.verify():
+            raise ValueError(f"Inclusion proof for {digest} does not verify")
+        return proof
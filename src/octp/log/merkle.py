@@ -0,0 +1,131 @@
+"""Merkle tree hashing and proofs for the transparency log (RFC 9162).
+
+Leaves and interior nodes are domain-separated SHA-256 hashes, so a leaf
+can never be passed off as a subtree. Proofs are lists of sibling hashes;
+checking one costs O(log n) hashes and needs nothing but the proof and
+the two tree heads involved.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Callable
+
+HASH_SIZE = 32
+
+# Hash of the subtree covering leaves [start, end)
+SubtreeHash = Callable[[int, int], bytes]
+
+
+def leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def empty_root() -> bytes:
+    return hashlib.sha256(b"").digest()
+
+
+def split_point(size: int) -> int:
+    """Largest power of two strictly below ``size`` (which must be > 1)."""
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+def inclusion_path(index: int, size: int, subtree: SubtreeHash) -> list[bytes]:
+    """Audit path for leaf ``index`` in the tree of the first ``size`` leaves."""
+    path: list[bytes] = []
+    start, end = 0, size
+    while end - start > 1:
+        k = split_point(end - start)
+        if index < start + k:
+            path.append(subtree(start + k, end))
+            end = start + k
+        else:
+            path.append(subtree(start, start + k))
+            start += k
+    path.reverse()  # leaf to root
+    return path
+
+
+def consistency_path(first: int, second: int, subtree: SubtreeHash) -> list[bytes]:
+    """Proof that the first ``first`` leaves are a prefix of ``second`` leaves."""
+    if not 0 < first <= second:
+        raise ValueError(
+            f"Invalid tree sizes for a consistency proof: {first}, {second}"
+        )
+    path: list[bytes] = []
+    start, end, m, complete = 0, second, first, True
+    while m != end - start:
+        k = split_point(end - start)
+        if m <= k:
+            path.append(subtree(start + k, end))
+            end = start + k
+        else:
+            path.append(subtree(start, start + k))
+            start += k
+            m -= k
+            complete = False
+    if not complete:
+        path.append(subtree(start, end))
+    path.reverse()
+    return path
+
+
+def verify_inclusion(
+    leaf: bytes, index: int, size: int, path: list[bytes], root: bytes
+) -> bool:
+    """Check an audit path against a tree head (RFC 9162, 2.1.3.2)."""
+    if index >= size:
+        return False
+    fn, sn, r = index, size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == root
+
+
+def verify_consistency(
+    first: int,
+    second: int,
+    first_root: bytes,
+    second_root: bytes,
+    path: list[bytes],
+) -> bool:
+    """Check that tree head ``second`` extends tree head ``first`` (2.1.4.2)."""
+    if first == second:
+        return not path and first_root == second_root
+    if not 0 < first < second or not path:
+        return False
+    if first & (first - 1) == 0:  # a power of two: the old root is in the tree
+        path = [first_root, *path]
+    fn, sn = first - 1, second - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+    fr = sr = path[0]
+    for c in path[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr = node_hash(c, fr)
+            sr = node_hash(c, sr)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            sr = node_hash(sr, c)
+        fn >>= 1
+        sn >>= 1
+    return fr == first_root and sr == second_root and sn == 0
@@ -0,0 +1,232 @@
+"""File-backed append-only Merkle log.
+
+The log keeps every complete subtree hash on disk, one flat file per
+level: ``level-k`` holds the hashes of the aligned subtrees of ``2**k``
+leaves, in order. An append writes the leaf and then one node per level
+it completes, reading only the left sibling of each, so extending the
+tree takes constant memory and amortised O(1) I/O however long the log
+grows. Any tree head and any proof is built from O(log n) of these
+stored nodes.
+
+The logged digests are kept in ``entries`` and also filed into 256
+buckets by their first byte, so finding an envelope's leaf index scans
+1/256th of the log instead of all of it. Every append looks its digest
+up first, to return the existing index for a repeat, so an append as a
+whole reads O(n/256) bucket records: linear in the log's size, with a
+small constant.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .merkle import (
+    HASH_SIZE,
+    consistency_path,
+    empty_root,
+    inclusion_path,
+    leaf_hash,
+    node_hash,
+    split_point,
+)
+
+ENTRIES_FILE = "entries"
+LEVEL_PREFIX = "level-"
+INDEX_DIR = "index"
+# Bucket record: the logged digest followed by its leaf index
+_INDEX_RECORD = HASH_SIZE + 8
+
+
+def parse_digest(digest: str) -> bytes:
+    """Raw bytes of a hex SHA-256 digest; ValueError if it is not one."""
+    try:
+        raw = bytes.fromhex(digest)
+    except (TypeError, ValueError):
+        raw = b""
+    if len(raw) != HASH_SIZE:
+        raise ValueError(f"Not a SHA-256 hex digest: {digest!r}")
+    return raw
+
+
+@dataclass(frozen=True)
+class TreeHead:
+    size: int
+    root: str  # hex
+
+    def to_dict(self) -> dict[str, object]:
+        return {"tree_size": self.size, "root": self.root}
+
+
+class TransparencyLog:
+    """Append-only log of envelope digests in one directory.
+
+    Safe to share between threads; appends are serialised. A write cut
+    short by a crash is completed or discarded the next time the log is
+    opened.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        (directory / INDEX_DIR).mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._fd_lock = threading.Lock()
+        self._fds: dict[int | str, int] = {}
+        self.size = self._recover()
+
+    def close(self) -> None:
+        with self._lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+    def __enter__(self) -> TransparencyLog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _fd(self, level: int | str) -> int:
+        """Descriptor for a level file, or for ``ENTRIES_FILE``."""
+        with self._fd_lock:
+            fd = self._fds.get(level)
+            if fd is None:
+                name = level if isinstance(level, str) else f"{LEVEL_PREFIX}{level}"
+                flags = os.O_RDWR | os.O_CREAT | os.O_APPEND
+                fd = self._fds[level] = os.open(self.directory / name, flags, 0o644)
+            return fd
+
+    def _count(self, level: int | str) -> int:
+        return os.fstat(self._fd(level)).st_size // HASH_SIZE
+
+    def _node(self, level: int | str, position: int) -> bytes:
+        node = os.pread(self._fd(level), HASH_SIZE, position * HASH_SIZE)
+        if len(node) != HASH_SIZE:
+            raise RuntimeError(f"Log is missing node {position} at level {level}")
+        return node
+
+    def _recover(self) -> int:
+        """Bring every file in line with the leaves completely written."""
+        # Entries are written before their leaf; a torn record is dropped
+        size = min(self._count(ENTRIES_FILE), self._count(0))
+        os.ftruncate(self._fd(ENTRIES_FILE), size * HASH_SIZE)
+        os.ftruncate(self._fd(0), size * HASH_SIZE)
+        level = 1
+        while size >> level or self._count(level):
+            expected = size >> level
+            have = min(self._count(level), expected)
+            os.ftruncate(self._fd(level), have * HASH_SIZE)
+            for position in range(have, expected):
+                os.write(
+                    self._fd(level),
+                    node_hash(
+                        self._node(level - 1, 2 * position),
+                        self._node(level - 1, 2 * position + 1),
+                    ),
+                )
+            level += 1
+        if size:
+            # The bucket record is written last, so only the final entry
+            # can be missing from the index
+            tail = self._node(ENTRIES_FILE, size - 1)
+            bucket = self._bucket(tail)
+            if bucket.exists():
+                length = bucket.stat().st_size
+                os.truncate(bucket, length - length % _INDEX_RECORD)
+            if self._lookup(tail) is None:
+                self._index(tail, size - 1)
+        return size
+
+    def _bucket(self, digest: bytes) -> Path:
+        return self.directory / INDEX_DIR / f"{digest[0]:02x}"
+
+    def _lookup(self, digest: bytes) -> int | None:
+        try:
+            with open(self._bucket(digest), "rb") as f:
+                while chunk := f.read(_INDEX_RECORD * 4096):
+                    offset = chunk.find(digest)
+                    while offset != -1:
+                        if offset % _INDEX_RECORD == 0:
+                            start = offset + HASH_SIZE
+                            return int.from_bytes(chunk[start : start + 8], "big")
+                        offset = chunk.find(digest, offset + 1)
+        except FileNotFoundError:
+            pass
+        return None
+
+    def _index(self, digest: bytes, index: int) -> None:
+        with open(self._bucket(digest), "ab") as f:
+            f.write(digest + index.to_bytes(8, "big"))
+
+    def append(self, digest: str) -> int:
+        """Log a digest and return its leaf index.
+
+        Appending a digest that is already logged returns its existing
+        index, so retries are harmless.
+        """
+        raw = parse_digest(digest)
+        with self._lock:
+            existing = self._lookup(raw)
+            if existing is not None and existing < self.size:
+                return existing
+            index = self.size
+            node = leaf_hash(raw)
+            os.write(self._fd(ENTRIES_FILE), raw)
+            os.write(self._fd(0), node)
+            level, position = 0, index
+            while position & 1:  # completes a subtree one level up
+                node = node_hash(self._node(level, position - 1), node)
+                level += 1
+                position >>= 1
+                os.write(self._fd(level), node)
+            self._index(raw, index)
+            self.size = index + 1
+            return index
+
+    def find(self, digest: str) -> int | None:
+        """Leaf index of a logged digest, or None."""
+        raw = parse_digest(digest)
+        index = self._lookup(raw)
+        return index if index is not None and index < self.size else None
+
+    def entry(self, index: int) -> str:
+        """The digest logged at ``index``."""
+        if not 0 <= index < self.size:
+            raise ValueError(f"Leaf {index} is not in the log (size {self.size})")
+        return self._node(ENTRIES_FILE, index).hex()
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        """Hash of leaves [start, end), from stored complete subtrees."""
+        size = end - start
+        if size & (size - 1) == 0 and start % size == 0:
+            return self._node(size.bit_length() - 1, start // size)
+        k = split_point(size)
+        return node_hash(self._subtree(start, start + k), self._subtree(start + k, end))
+
+    def _check_size(self, size: int | None) -> int:
+        current = self.size
+        if size is None:
+            return current
+        if not 0 <= size <= current:
+            raise ValueError(f"Tree size {size} is not in the log (size {current})")
+        return size
+
+    def head(self, size: int | None = None) -> TreeHead:
+        """Tree head for the whole log, or for its first ``size`` leaves."""
+        size = self._check_size(size)
+        root = self._subtree(0, size) if size else empty_root()
+        return TreeHead(size, root.hex())
+
+    def inclusion_proof(self, index: int, size: int | None = None) -> list[str]:
+        size = self._check_size(size)
+        if not 0 <= index < size:
+            raise ValueError(f"Leaf {index} is not in a tree of size {size}")
+        return [node.hex() for node in inclusion_path(index, size, self._subtree)]
+
+    def consistency_proof(self, first: int, second: int | None = None) -> list[str]:
+        second = self._check_size(second)
+        if first == second:
+            return []
+        return [node.hex() for node in consistency_path(first, second, self._subtree)]
@@ -0,0 +1,289 @@
+"""Counters and histograms about octp runs, exported for Prometheus.
+
+octp records into the process-wide ``METRICS`` as it works: per-runner
+durations and outcomes (timeouts and crashes included), cache hits and
+misses, the time to check a repository and verification throughput.
+Recording is a dict update under a lock; nothing leaves the process
+unless ``[metrics]`` (or the environment) asks for it::
+
+    [metrics]
+    textfile = "/var/lib/node_exporter/textfile/octp.prom"
+    push_url = "http://pushgateway:9091/metrics/job/octp"
+
+At the end of a command the run's samples are added to the textfile, so
+its counters accumulate across runs as Prometheus expects, and the whole
+file is then pushed, under this host's ``instance`` label, to the push
+URL. ``octp metrics serve`` is a local stand-in for that endpoint.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fcntl
+import math
+import os
+import re
+import socket
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+TEXTFILE_ENV = "OCTP_METRICS_TEXTFILE"
+PUSH_ENV = "OCTP_METRICS_PUSH"
+# Where counters accumulate when only push_url is set
+METRICS_DIR = Path.home() / ".octp" / "metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds, from a cache-hit lint to a full test suite
+DURATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# Every family octp records: name -> (type, help)
+FAMILIES = {
+    "octp_runner_duration_seconds": (
+        "histogram",
+        "Wall time of each check runner that ran",
+    ),
+    "octp_runner_results_total": (
+        "counter",
+        "Check runner results by status (ok, timeout, error, crashed or "
+        "not_applicable) and whether the check passed",
+    ),
+    "octp_cache_lookups_total": (
+        "counter",
+        "Result cache lookups by runner and result (hit or miss)",
+    ),
+    "octp_checks_duration_seconds": (
+        "histogram",
+        "Wall time of running a repository's checks, cache lookups included",
+    ),
+    "octp_verify_duration_seconds": (
+        "histogram",
+        "Wall time of each verification call (one envelope or a batch)",
+    ),
+    "octp_verify_envelopes_total": (
+        "counter",
+        "Envelopes verified by result (accepted, violations or invalid)",
+    ),
+}
+
+Labels = tuple[tuple[str, str], ...]
+SampleKey = tuple[str, Labels]
+
+_SAMPLE_RE = re.compile(
+    r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)(?:\s+-?\d+)?$"
+)
+_LABEL_RE = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"\s*,?')
+_SUFFIXES = ("_bucket", "_sum", "_count")
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _le(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", lambda m: "\n" if m[1] == "n" else m[1], value)
+
+
+def _format_value(value: float) -> str:
+    if value.is_integer() and abs(value) < 2**53:
+        return str(int(value))
+    return repr(value)
+
+
+class Metrics:
+    """Thread-safe counters and histograms, kept as Prometheus samples.
+
+    Histogram buckets are stored cumulatively, like every other sample
+    here, so two sets of samples merge by adding them (see ``merge``).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: dict[SampleKey, float] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Add ``value`` to the counter ``name`` with ``labels``."""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record ``value`` in the histogram ``name`` with ``labels``."""
+        base = _labels(labels)
+        first = bisect.bisect_left(DURATION_BUCKETS, value)
+        with self._lock:
+            for bound in (*DURATION_BUCKETS[first:], math.inf):
+                key = (f"{name}_bucket", _labels({**dict(base), "le": _le(bound)}))
+                self._samples[key] = self._samples.get(key, 0.0) + 1
+            # Empty buckets below the value still have to be exported
+            for bound in DURATION_BUCKETS[:first]:
+                key = (f"{name}_bucket", _labels({**dict(base), "le": _le(bound)}))
+                self._samples.setdefault(key, 0.0)
+            for suffix, amount in (("_sum", value), ("_count", 1.0)):
+                key = (name + suffix, base)
+                self._samples[key] = self._samples.get(key, 0.0) + amount
+
+    def samples(self) -> dict[SampleKey, float]:
+        with self._lock:
+            return dict(self._samples)
+
+    def merge(self, samples: dict[SampleKey, float]) -> None:
+        """Add another set of samples (e.g. an earlier run's) to these."""
+        with self._lock:
+            for key, value in samples.items():
+                self._samples[key] = self._samples.get(key, 0.0) + value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def render(self) -> str:
+        """The samples in the Prometheus text exposition format."""
+        return render(self.samples())
+
+
+def _family(name: str) -> str:
+    for suffix in _SUFFIXES:
+        base = name.removesuffix(suffix)
+        if base != name and FAMILIES.get(base, ("",))[0] == "histogram":
+            return base
+    return name
+
+
+def _order(key: SampleKey) -> tuple[Any, ...]:
+    """Sort key: family, label set, then buckets by bound, sum, count."""
+    name, labels = key
+    family = _family(name)
+    others = tuple(item for item in labels if item[0] != "le")
+    le = dict(labels).get("le")
+    bound = math.inf if le in (None, "+Inf") else float(le)
+    suffix = name[len(family) :]
+    return family, others, _SUFFIXES.index(suffix) if suffix else 0, bound
+
+
+def render(samples: dict[SampleKey, float], extra: dict[str, str] | None = None) -> str:
+    """Format samples as Prometheus text, adding ``extra`` labels to each."""
+    lines = []
+    family = None
+    for key in sorted(samples, key=_order):
+        name, labels = key
+        if _family(name) != family:
+            family = _family(name)
+            if family in FAMILIES:
+                kind, help_text = FAMILIES[family]
+                lines.append(f"# HELP {family} {help_text}")
+                lines.append(f"# TYPE {family} {kind}")
+        merged = _labels({**(extra or {}), **dict(labels)})
+        label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in merged)
+        selector = f"{name}{{{label_text}}}" if label_text else name
+        lines.append(f"{selector} {_format_value(samples[key])}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def parse(text: str) -> dict[SampleKey, float]:
+    """Samples from Prometheus text; raises ValueError on a bad line."""
+    samples: dict[SampleKey, float] = {}
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE_RE.match(line)
+        if match is None:
+            raise ValueError(f"Line {number}: not a metric sample: {line[:80]}")
+        name, label_text, value = match.groups()
+        labels = {}
+        if label_text:
+            pos = 0
+            for label in _LABEL_RE.finditer(label_text):
+                if label.start() != pos:
+                    break
+                labels[label[1]] = _unescape(label[2])
+                pos = label.end()
+            if pos != len(label_text):
+                raise ValueError(f"Line {number}: bad labels: {label_text[:80]}")
+        try:
+            samples[(name, _labels(labels))] = float(value)
+        except ValueError:
+            raise ValueError(f"Line {number}: bad value: {value}")
+    return samples
+
+
+class MetricsExporter:
+    """Accumulates runs into a textfile and optionally pushes it.
+
+    Args:
+        textfile: The ``.prom`` file counters accumulate in (for the
+            node_exporter textfile collector, say)
+        push_url: Pushgateway-style job URL; the file is PUT to it under
+            ``/instance/<hostname>``
+    """
+
+    def __init__(
+        self, textfile: Path, push_url: str | None = None, timeout: float = 2.0
+    ) -> None:
+        self.textfile = textfile
+        self.push_url = push_url.rstrip("/") if push_url else None
+        self.timeout = timeout
+
+    def export(self, metrics: Metrics) -> None:
+        """Add ``metrics`` to the textfile, clear them and push the total.
+
+        Concurrent octp processes on one machine take turns through a
+        lock file, so no run's samples are lost. Raises OSError (and
+        ValueError for a corrupt textfile, which is left untouched).
+        """
+        self.textfile.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.textfile.with_name(self.textfile.name + ".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            total = Metrics()
+            if self.textfile.exists():
+                total.merge(parse(self.textfile.read_text()))
+            total.merge(metrics.samples())
+            text = total.render()
+            fd, tmp = tempfile.mkstemp(dir=self.textfile.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp, self.textfile)
+        metrics.clear()
+        if self.push_url:
+            self.push(text)
+
+    def push(self, text: str) -> None:
+        instance = urllib.parse.quote(socket.gethostname(), safe="")
+        request = urllib.request.Request(
+            f"{self.push_url}/instance/{instance}",
+            data=text.encode(),
+            method="PUT",
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+        urllib.request.urlopen(request, timeout=self.timeout).close()
+
+
+def exporter_from_config(config: dict[str, Any]) -> MetricsExporter | None:
+    """Build the exporter the ``[metrics]`` section describes, if any.
+
+    ``textfile`` (or $OCTP_METRICS_TEXTFILE) and ``push_url`` (or
+    $OCTP_METRICS_PUSH) are each optional; None when neither is set.
+    """
+    section = config.get("metrics", {})
+    textfile = os.environ.get(TEXTFILE_ENV) or section.get("textfile")
+    push_url = os.environ.get(PUSH_ENV) or section.get("push_url")
+    if not textfile and not push_url:
+        return None
+    path = Path(textfile).expanduser() if textfile else METRICS_DIR / "octp.prom"
+    return MetricsExporter(path, push_url)
+
+
+# Process-wide metrics every part of octp records into
+METRICS = Metrics()
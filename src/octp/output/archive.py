@@ -0,0 +1,339 @@
+"""Single-file envelope archive with a sorted footer index.
+
+Layout::
+
+    header   b"OCTPARC1"
+    blocks   repeated: flags u8 | stored_len u32 | raw_len u32 | payload
+             payload (zlib-compressed if flags & 1) is a run of records,
+             each u32 length + deterministic CBOR envelope
+    index    n entries sorted by contribution_id, then the same n entries
+             sorted by commit_hash; each entry is contribution_id (64 bytes),
+             commit_hash (64 bytes), block offset u64, record offset u32,
+             record length u32
+    trailer  index offset u64 | entry count u64 | b"OCTPIDX1"
+
+Records are append-only: appending drops the old footer, writes new blocks
+after the existing ones and writes a fresh merged index. Readers mmap the
+file, binary-search the index and decode only the blocks they touch. A
+missing or torn footer is rebuilt by scanning the blocks.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from octp.core import cbor
+from octp.core.envelope import OCTPEnvelope
+
+MAGIC = b"OCTPARC1"
+INDEX_MAGIC = b"OCTPIDX1"
+KEY_WIDTH = 64
+FLAG_ZLIB = 0x01
+
+_BLOCK_HEADER = struct.Struct(">BII")
+_RECORD_LEN = struct.Struct(">I")
+_ENTRY = struct.Struct(f">{KEY_WIDTH}s{KEY_WIDTH}sQII")
+_TRAILER = struct.Struct(">QQ8s")
+
+
+class ArchiveError(ValueError):
+    """Raised for unreadable or malformed archives."""
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    contribution_id: str
+    commit_hash: str
+    block_offset: int
+    record_offset: int
+    record_length: int
+
+    def pack(self) -> bytes:
+        return _ENTRY.pack(
+            _key(self.contribution_id),
+            _key(self.commit_hash),
+            self.block_offset,
+            self.record_offset,
+            self.record_length,
+        )
+
+    @classmethod
+    def unpack_from(cls, buffer: bytes | mmap.mmap, offset: int) -> ArchiveEntry:
+        cid, commit, block, record, length = _ENTRY.unpack_from(buffer, offset)
+        return cls(
+            cid.rstrip(b"\0").decode(),
+            commit.rstrip(b"\0").decode(),
+            block,
+            record,
+            length,
+        )
+
+
+def _key(value: str) -> bytes:
+    data = value.encode()
+    if len(data) > KEY_WIDTH:
+        raise ArchiveError(f"Key longer than {KEY_WIDTH} bytes: {value}")
+    return data
+
+
+def _read_footer(buffer: bytes | mmap.mmap) -> tuple[int, int] | None:
+    """Return (index offset, entry count), or None if the footer is missing."""
+    size = len(buffer)
+    if size < len(MAGIC) + _TRAILER.size:
+        return None
+    index_offset, count, magic = _TRAILER.unpack_from(buffer, size - _TRAILER.size)
+    expected_end = index_offset + 2 * count * _ENTRY.size + _TRAILER.size
+    if magic != INDEX_MAGIC or expected_end != size:
+        return None
+    return index_offset, count
+
+
+def _scan_blocks(buffer: bytes | mmap.mmap) -> tuple[list[ArchiveEntry], int]:
+    """Rebuild index entries by walking every complete block.
+
+    Returns the entries and the offset just past the last complete block.
+    """
+    entries = []
+    pos = len(MAGIC)
+    size = len(buffer)
+    while pos + _BLOCK_HEADER.size <= size:
+        flags, stored_len, _ = _BLOCK_HEADER.unpack_from(buffer, pos)
+        end = pos + _BLOCK_HEADER.size + stored_len
+        if end > size:
+            break
+        try:
+            raw = _block_payload(buffer, pos)
+        except (ArchiveError, zlib.error):
+            break
+        offset = 0
+        while offset < len(raw):
+            (length,) = _RECORD_LEN.unpack_from(raw, offset)
+            offset += _RECORD_LEN.size
+            data = cbor.loads(raw[offset : offset + length])
+            entries.append(
+                ArchiveEntry(
+                    data["contribution_id"], data["commit_hash"], pos, offset, length
+                )
+            )
+            offset += length
+        pos = end
+    return entries, pos
+
+
+def _block_payload(buffer: bytes | mmap.mmap, block_offset: int) -> bytes:
+    flags, stored_len, raw_len = _BLOCK_HEADER.unpack_from(buffer, block_offset)
+    start = block_offset + _BLOCK_HEADER.size
+    payload = buffer[start : start + stored_len]
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    if len(payload) != raw_len:
+        raise ArchiveError(f"Corrupt block at offset {block_offset}")
+    return payload
+
+
+class ArchiveWriter:
+    """Append envelopes to an archive, creating it if needed.
+
+    Use as a context manager; the index is written on close.
+    """
+
+    def __init__(
+        self, path: Path, compress: bool = True, block_records: int = 64
+    ) -> None:
+        self.path = path
+        self.compress = compress
+        self.block_records = block_records
+        self._pending: list[tuple[str, str, bytes]] = []
+
+        if path.exists() and path.stat().st_size > 0:
+            self._file: BinaryIO = open(path, "r+b")
+            with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[: len(MAGIC)] != MAGIC:
+                    self._file.close()
+                    raise ArchiveError(f"Not an OCTP archive: {path}")
+                footer = _read_footer(data)
+                if footer:
+                    index_offset, count = footer
+                    self._entries = [
+                        ArchiveEntry.unpack_from(data, index_offset + i * _ENTRY.size)
+                        for i in range(count)
+                    ]
+                    data_end = index_offset
+                else:
+                    self._entries, data_end = _scan_blocks(data)
+            self._file.seek(data_end)
+            self._file.truncate()
+        else:
+            self._file = open(path, "wb")
+            self._file.write(MAGIC)
+            self._entries = []
+        self._ids = {e.contribution_id for e in self._entries}
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def add(self, envelope: OCTPEnvelope) -> bool:
+        """Queue an envelope; returns False if its contribution_id is present."""
+        if envelope.contribution_id in self._ids:
+            return False
+        _key(envelope.contribution_id)
+        _key(envelope.commit_hash)
+        self._ids.add(envelope.contribution_id)
+        self._pending.append(
+            (
+                envelope.contribution_id,
+                envelope.commit_hash,
+                cbor.dumps(envelope.model_dump(mode="json")),
+            )
+        )
+        if len(self._pending) >= self.block_records:
+            self._flush_block()
+        return True
+
+    def _flush_block(self) -> None:
+        if not self._pending:
+            return
+        block_offset = self._file.tell()
+        raw = bytearray()
+        for contribution_id, commit_hash, record in self._pending:
+            raw += _RECORD_LEN.pack(len(record))
+            self._entries.append(
+                ArchiveEntry(
+                    contribution_id, commit_hash, block_offset, len(raw), len(record)
+                )
+            )
+            raw += record
+        payload = zlib.compress(bytes(raw), 6) if self.compress else bytes(raw)
+        flags = FLAG_ZLIB if self.compress else 0
+        self._file.write(_BLOCK_HEADER.pack(flags, len(payload), len(raw)))
+        self._file.write(payload)
+        self._pending.clear()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush_block()
+        index_offset = self._file.tell()
+        by_id = sorted(self._entries, key=lambda e: e.contribution_id)
+        by_commit = sorted(
+            self._entries, key=lambda e: (e.commit_hash, e.contribution_id)
+        )
+        self._file.write(b"".join(e.pack() for e in by_id))
+        self._file.write(b"".join(e.pack() for e in by_commit))
+        self._file.write(_TRAILER.pack(index_offset, len(self._entries), INDEX_MAGIC))
+        self._file.close()
+
+
+class ArchiveReader:
+    """Memory-mapped, read-only view of an archive."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ArchiveError(f"Empty archive: {path}")
+        if self._map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ArchiveError(f"Not an OCTP archive: {path}")
+        footer = _read_footer(self._map)
+        if footer is None:
+            self.close()
+            raise ArchiveError(
+                f"Archive index missing in {path} — re-run `octp archive pack` "
+                "on it to rebuild"
+            )
+        self._index_offset, self._count = footer
+        self._commit_offset = self._index_offset + self._count * _ENTRY.size
+        self._cached_block: tuple[int, bytes] | None = None
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        if hasattr(self, "_map") and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def _entry(self, table_offset: int, i: int) -> ArchiveEntry:
+        return ArchiveEntry.unpack_from(self._map, table_offset + i * _ENTRY.size)
+
+    def _raw_key(self, table_offset: int, i: int, field: int) -> bytes:
+        start = table_offset + i * _ENTRY.size + field * KEY_WIDTH
+        return self._map[start : start + KEY_WIDTH].rstrip(b"\0")
+
+    def _lower_bound(self, table_offset: int, field: int, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._raw_key(table_offset, mid, field) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def entries(self) -> Iterator[ArchiveEntry]:
+        """Index entries in contribution_id order; no records are decoded."""
+        for i in range(self._count):
+            yield self._entry(self._index_offset, i)
+
+    def records(self) -> Iterator[bytes]:
+        """Every record in storage order, decompressing each block once."""
+        for entry in sorted(
+            self.entries(), key=lambda e: (e.block_offset, e.record_offset)
+        ):
+            yield self.record(entry)
+
+    def record(self, entry: ArchiveEntry) -> bytes:
+        """The CBOR bytes of the record an index entry points at."""
+        if self._cached_block and self._cached_block[0] == entry.block_offset:
+            raw = self._cached_block[1]
+        else:
+            raw = _block_payload(self._map, entry.block_offset)
+            self._cached_block = (entry.block_offset, raw)
+        start = entry.record_offset
+        return raw[start : start + entry.record_length]
+
+    def load(self, entry: ArchiveEntry) -> OCTPEnvelope:
+        """Decode the record an index entry points at."""
+        return OCTPEnvelope.model_validate(cbor.loads(self.record(entry)))
+
+    def get(self, contribution_id: str) -> OCTPEnvelope | None:
+        """Look up an envelope by exact contribution_id."""
+        key = contribution_id.encode()
+        i = self._lower_bound(self._index_offset, 0, key)
+        if i < self._count and self._raw_key(self._index_offset, i, 0) == key:
+            return self.load(self._entry(self._index_offset, i))
+        return None
+
+    def commit_entries(self, commit_prefix: str) -> list[ArchiveEntry]:
+        """Index entries whose commit_hash starts with ``commit_prefix``."""
+        prefix = commit_prefix.encode()
+        i = self._lower_bound(self._commit_offset, 1, prefix)
+        found = []
+        while i < self._count and self._raw_key(self._commit_offset, i, 1).startswith(
+            prefix
+        ):
+            found.append(self._entry(self._commit_offset, i))
+            i += 1
+        return found
+
+    def find_commit(self, commit_prefix: str) -> list[OCTPEnvelope]:
+        """All envelopes whose commit_hash starts with ``commit_prefix``."""
+        return [self.load(entry) for entry in self.commit_entries(commit_prefix)]
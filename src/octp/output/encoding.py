@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from octp.core import cbor
+from octp.core.envelope import OCTPEnvelope
+from octp.integrity.hasher import hash_cbor
+
+FORMATS = ("json", "cbor")
+
+
+def encode_envelope(envelope: OCTPEnvelope, format: str = "json") -> bytes:
+    """Serialise an envelope as pretty JSON or deterministic CBOR."""
+    if format == "json":
+        return envelope.model_dump_json(indent=2).encode()
+    if format == "cbor":
+        return cbor.dumps(envelope.model_dump(mode="json"))
+    raise ValueError(f"Unknown format: {format}. Available: {', '.join(FORMATS)}")
+
+
+def is_cbor(data: bytes) -> bool:
+    """True if ``data`` starts like a CBOR map (JSON starts with ``{`` or space)."""
+    return bool(data) and data[0] >> 5 == 5
+
+
+def decode_envelope(data: bytes) -> OCTPEnvelope:
+    """Parse an envelope from JSON or CBOR bytes, detecting the format."""
+    if is_cbor(data):
+        return OCTPEnvelope.model_validate(cbor.loads(data))
+    return OCTPEnvelope.model_validate_json(data)
+
+
+def envelope_digest(envelope: OCTPEnvelope) -> str:
+    """Stable content digest of a whole envelope, integrity section included.
+
+    Defined as SHA-256 over the deterministic CBOR encoding of the
+    envelope's JSON-mode dict, so it does not depend on how the envelope
+    was stored. The signed ``payload_hash`` is unchanged and still covers
+    the JSON form without the integrity section.
+    """
+    return hash_cbor(envelope.to_canonical_dict())
@@ -6,6 +6,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from octp.core.envelope import OCTPEnvelope
+from octp.verification.base import NOT_APPLICABLE
 
 console = Console()
 
@@ -22,11 +23,18 @@ def print_header():
 def print_verification_results(results: dict):
     console.print("\n[bold]Running verification checks...[/bold]")
     for name, result in results.items():
+        if result.status == NOT_APPLICABLE:
+            console.print(f"  [dim]– {result.tool_name} — {result.detail}[/dim]")
+            continue
         icon = "✓" if result.passed else "✗"
         colour = "green" if result.passed else "red"
+        cached = " [dim](cached)[/dim]" if result.cached else ""
         console.print(
             f"  [{colour}]{icon}[/{colour}] {result.tool_name} — {result.detail}"
+            f"{cached}"
         )
+        if not result.passed and result.report_digest:
+            console.print(f"    [dim]full report: octp artifacts show {name}[/dim]")
 
 
 def print_envelope_summary(envelope: OCTPEnvelope):
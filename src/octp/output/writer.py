@@ -3,11 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 from octp.core.envelope import OCTPEnvelope
+from octp.output.encoding import encode_envelope
 
 
-def write_envelope(envelope: OCTPEnvelope, path: Path) -> None:
-    """Write an envelope to disk as JSON."""
-    path.write_text(envelope.model_dump_json(indent=2))
+def write_envelope(envelope: OCTPEnvelope, path: Path, format: str = "json") -> None:
+    """Write an envelope to disk as JSON or deterministic CBOR."""
+    path.write_bytes(encode_envelope(envelope, format))
 
 
 def write_envelope_string(envelope: OCTPEnvelope) -> str:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from rich.console import Console
 from rich.prompt import Prompt
 
@@ -8,8 +10,23 @@ from .models import AITool, ProvenanceMethod, ReviewLevel
 console = Console()
 
 
-def collect_interactively() -> dict:
-    """Collect provenance declaration interactively from the developer."""
+def collect_interactively(status_line: Callable[[], str] | None = None) -> dict:
+    """Collect provenance declaration interactively from the developer.
+
+    ``status_line`` reports work running meanwhile (e.g. verification
+    checks); it is shown between prompts whenever it changes, never while
+    the developer is typing.
+    """
+    last_status = None
+
+    def ask(*args: Any, **kwargs: Any) -> str:
+        nonlocal last_status
+        if status_line is not None:
+            status = status_line()
+            if status != last_status:
+                console.print(f"[dim]  {status}[/dim]")
+                last_status = status
+        return Prompt.ask(*args, **kwargs)
 
     console.print("\n[bold blue]Provenance Declaration[/bold blue]")
     console.print("─" * 40)
@@ -33,7 +50,7 @@ def collect_interactively() -> dict:
     for num, label, _ in methods:
         console.print(f"  [{num}] {label}")
 
-    method_choice = Prompt.ask("\n", choices=["1", "2", "3", "4"], default="1")
+    method_choice = ask("\n", choices=["1", "2", "3", "4"], default="1")
     method = methods[int(method_choice) - 1][2]
 
     # AI tools (if applicable)
@@ -42,7 +59,7 @@ def collect_interactively() -> dict:
         console.print(
             "\nWhich AI tools did you use? (comma separated, or press enter to skip)"
         )
-        tools_input = Prompt.ask("", default="")
+        tools_input = ask("", default="")
         if tools_input.strip():
             for tool_name in [t.strip() for t in tools_input.split(",")]:
                 if tool_name:
@@ -71,11 +88,11 @@ def collect_interactively() -> dict:
     for num, label, _ in levels:
         console.print(f"  [{num}] {label}")
 
-    level_choice = Prompt.ask("\n", choices=["1", "2", "3", "4", "5"], default="2")
+    level_choice = ask("\n", choices=["1", "2", "3", "4", "5"], default="2")
     review_level = levels[int(level_choice) - 1][2]
 
     # Duration (optional)
-    duration_str = Prompt.ask(
+    duration_str = ask(
         "\nHow many minutes did you spend on this? (optional, press enter to skip)",
         default="",
     )
@@ -85,19 +102,19 @@ def collect_interactively() -> dict:
     console.print("\n[bold blue]Optional Context[/bold blue]")
     console.print("─" * 40)
 
-    issue_ref = Prompt.ask("\nIssue reference (e.g. #123, optional)", default="")
+    issue_ref = ask("\nIssue reference (e.g. #123, optional)", default="")
 
-    confidence_input = Prompt.ask(
+    confidence_input = ask(
         "\nSelf-assessed confidence",
         choices=["low", "medium", "high"],
         default="medium",
     )
 
-    uncertainty = Prompt.ask(
+    uncertainty = ask(
         "\nAny areas of uncertainty for the reviewer? (optional)", default=""
     )
 
-    time_in_codebase_str = Prompt.ask(
+    time_in_codebase_str = ask(
         "\nMinutes spent reading the codebase before contributing? (optional)",
         default="",
     )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import tomllib
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from octp.core.envelope import Provenance
+
+
+def load_template(path: Path) -> dict[str, Any]:
+    """Read a provenance declaration to apply to many commits.
+
+    The file is JSON, or TOML for any other suffix, with the keys of an
+    interactive declaration (``method``, ``ai_tools``,
+    ``human_review_level``, ...). Raises ValueError if it is unreadable
+    or not a valid declaration.
+    """
+    try:
+        raw = path.read_bytes()
+        data = (
+            json.loads(raw) if path.suffix == ".json" else tomllib.loads(raw.decode())
+        )
+    except (OSError, UnicodeDecodeError, ValueError) as e:  # TOMLDecodeError too
+        raise ValueError(f"Could not read provenance template {path}: {e}")
+    if not isinstance(data, dict):
+        raise ValueError(f"Provenance template {path} must be a table of fields")
+    try:
+        Provenance.model_validate({**data, "developer_id": "template"})
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+        )
+        raise ValueError(f"Invalid provenance template {path}: {problems}")
+    return data
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+
+from octp import __version__
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class JSONRequestHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON request handler shared by octp's local services.
+
+    Subclasses fill in ``routes`` with ``(method, path) -> handler name``;
+    a path ending in "/" matches every path under it. Each handler takes
+    the raw request body and returns ``(status, payload)``; a ``bytes``
+    payload is sent as already-encoded JSON and a ``str`` one as
+    ``text_type``.
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive by default
+    server_version = f"octp/{__version__}"
+    routes: dict[tuple[str, str], str] = {}
+    text_type = "text/plain; charset=utf-8"
+    verbose = False
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.verbose:
+            super().log_message(format, *args)
+
+    def route(self, method: str, path: str) -> Callable[[bytes], Any] | None:
+        """Return the handler for a request, or None if nothing matches."""
+        path = path.split("?", 1)[0]
+        name = self.routes.get((method, path))
+        if name is None:
+            for (route_method, prefix), candidate in self.routes.items():
+                if (
+                    route_method == method
+                    and prefix.endswith("/")
+                    and path.startswith(prefix)
+                ):
+                    name = candidate
+                    break
+        return getattr(self, name) if name else None
+
+    def _read_body(self) -> bytes:
+        header = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(header)
+        except ValueError:
+            raise ValueError(f"Invalid Content-Length: {header!r}")
+        if length < 0:
+            raise ValueError(f"Invalid Content-Length: {header!r}")
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"Request body too large (limit {MAX_BODY_BYTES} bytes)")
+        return self.rfile.read(length) if length else b""
+
+    def _dispatch(self, method: str) -> None:
+        handler = self.route(method, self.path)
+        body: bytes | None = None
+        try:
+            body = self._read_body()
+            if handler is None:
+                status, payload = 404, {"error": f"No route for {method} {self.path}"}
+            else:
+                status, payload = handler(body)
+        except ValueError as e:
+            if body is None:
+                # The unread body would be taken for the next request
+                self.close_connection = True
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": f"Internal error: {e}"}
+        if isinstance(payload, bytes):
+            self.send_bytes(status, payload, "application/json")
+        elif isinstance(payload, str):
+            self.send_bytes(status, payload.encode(), self.text_type)
+        else:
+            self.send_json(status, payload)
+
+    def send_json(self, status: int, payload: Any) -> None:
+        self.send_bytes(status, json.dumps(payload).encode(), "application/json")
+
+    def send_bytes(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """HTTP over a Unix domain socket, one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        handler_class: Callable[..., BaseHTTPRequestHandler],
+    ) -> None:
+        self.socket_path = socket_path
+        if socket_path.exists():
+            socket_path.unlink()  # stale socket from a previous run
+        super().__init__(str(socket_path), handler_class)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.socket_path.exists():
+            os.unlink(self.socket_path)
+
+
+def make_server(
+    handler_class: Callable[..., BaseHTTPRequestHandler],
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """Create a threaded HTTP server on TCP or, if given, a Unix socket."""
+    if socket_path is not None:
+        return ThreadingUnixHTTPServer(socket_path, handler_class)
+    return ThreadingHTTPServer((host, port), handler_class)
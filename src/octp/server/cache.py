@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import socketserver
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from octp.verification.cache import RESULTS_PATH, is_cache_key
+
+from .base import JSONRequestHandler, make_server
+
+
+class CacheStore:
+    """Reference storage for the shared result cache: one file per key.
+
+    Entries are stored as uploaded; clients check signatures on read, so the
+    server needs no keys of its own.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        if not is_cache_key(key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, entry: bytes) -> None:
+        data = json.loads(entry)
+        if not isinstance(data, dict) or data.get("key") != key:
+            raise ValueError("Entry key does not match the request path")
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(entry)
+        os.replace(tmp, path)
+
+
+class CacheHandler(JSONRequestHandler):
+    routes = {
+        ("GET", "/healthz"): "handle_health",
+        ("GET", RESULTS_PATH): "handle_get",
+        ("PUT", RESULTS_PATH): "handle_put",
+    }
+
+    def __init__(self, *args: Any, store: CacheStore, **kwargs: Any) -> None:
+        self.store = store
+        super().__init__(*args, **kwargs)
+
+    def _key(self) -> str:
+        return self.path.split("?", 1)[0][len(RESULTS_PATH) :]
+
+    def handle_health(self, body: bytes) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    def handle_get(self, body: bytes) -> tuple[int, Any]:
+        entry = self.store.get(self._key())
+        if entry is None:
+            return 404, {"error": "Not cached"}
+        return 200, entry  # stored as JSON already
+
+    def handle_put(self, body: bytes) -> tuple[int, Any]:
+        self.store.put(self._key(), body)
+        return 204, b""
+
+
+def create_cache_server(
+    store: CacheStore,
+    host: str = "127.0.0.1",
+    port: int = 8766,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """Create (but do not start) a cache server backed by ``store``."""
+    handler = functools.partial(CacheHandler, store=store)
+    return make_server(handler, host=host, port=port, socket_path=socket_path)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import functools
+import json
+import socketserver
+import urllib.parse
+from pathlib import Path
+from typing import Any
+
+from octp.log.client import LOG_PATH
+from octp.log.store import TransparencyLog
+
+from .base import JSONRequestHandler, make_server
+
+
+class LogHandler(JSONRequestHandler):
+    routes = {
+        ("GET", "/healthz"): "handle_health",
+        ("GET", LOG_PATH + "head"): "handle_head",
+        ("POST", LOG_PATH + "entries"): "handle_append",
+        ("GET", LOG_PATH + "inclusion"): "handle_inclusion",
+        ("GET", LOG_PATH + "consistency"): "handle_consistency",
+    }
+
+    def __init__(self, *args: Any, log: TransparencyLog, **kwargs: Any) -> None:
+        self.log = log
+        super().__init__(*args, **kwargs)
+
+    def _params(self) -> dict[str, str]:
+        query = urllib.parse.urlsplit(self.path).query
+        return {k: v[-1] for k, v in urllib.parse.parse_qs(query).items()}
+
+    def _int(self, params: dict[str, str], name: str) -> int | None:
+        if name not in params:
+            return None
+        try:
+            return int(params[name])
+        except ValueError:
+            raise ValueError(f"{name} must be an integer")
+
+    def handle_health(self, body: bytes) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    def handle_head(self, body: bytes) -> tuple[int, Any]:
+        size = self._int(self._params(), "tree_size")
+        return 200, self.log.head(size).to_dict()
+
+    def handle_append(self, body: bytes) -> tuple[int, Any]:
+        data = json.loads(body or b"null")
+        if not isinstance(data, dict) or not isinstance(data.get("digest"), str):
+            raise ValueError('Expected {"digest": "<sha256 hex>"}')
+        index = self.log.append(data["digest"])
+        return 200, {"index": index, **self.log.head().to_dict()}
+
+    def handle_inclusion(self, body: bytes) -> tuple[int, Any]:
+        params = self._params()
+        size = self._int(params, "tree_size")
+        if size is None:
+            size = self.log.size
+        index = self._int(params, "index")
+        if index is None:
+            index = self.log.find(params.get("digest", ""))
+            if index is None:
+                return 404, {"error": "Digest is not in the log"}
+        return 200, {
+            "index": index,
+            "tree_size": size,
+            "proof": self.log.inclusion_proof(index, size),
+        }
+
+    def handle_consistency(self, body: bytes) -> tuple[int, Any]:
+        params = self._params()
+        first = self._int(params, "first")
+        if first is None:
+            raise ValueError("first is required")
+        second = self._int(params, "second")
+        return 200, {"proof": self.log.consistency_proof(first, second)}
+
+
+def create_log_server(
+    log: TransparencyLog,
+    host: str = "127.0.0.1",
+    port: int = 8767,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """Create (but do not start) a transparency log server over ``log``."""
+    handler = functools.partial(LogHandler, log=log)
+    return make_server(handler, host=host, port=port, socket_path=socket_path)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import functools
+import socketserver
+import threading
+import urllib.parse
+from pathlib import Path
+from typing import Any
+
+from octp.metrics import CONTENT_TYPE, Labels, SampleKey, parse, render
+
+from .base import JSONRequestHandler, make_server
+
+PUSH_PATH = "/metrics/job/"
+
+
+def grouping_key(path: str) -> Labels:
+    """Labels of a push URL path, e.g. ``/metrics/job/octp/instance/ci-7``."""
+    parts = path.split("?", 1)[0].removeprefix("/metrics/").split("/")
+    if len(parts) % 2 or parts[0] != "job" or not parts[1]:
+        raise ValueError("Expected /metrics/job/<job>[/<label>/<value>...]")
+    pairs = zip(parts[::2], parts[1::2])
+    return tuple(sorted((k, urllib.parse.unquote(v)) for k, v in pairs))
+
+
+class PushStore:
+    """The latest samples pushed by each group (job, instance, ...).
+
+    A push replaces everything its group pushed before; POST is treated
+    like PUT, which is all octp's exporter needs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._groups: dict[Labels, dict[SampleKey, float]] = {}
+
+    def replace(self, group: Labels, text: str) -> int:
+        samples = parse(text)
+        with self._lock:
+            self._groups[group] = samples
+        return len(samples)
+
+    def render(self) -> str:
+        """Every group's samples, labelled with their grouping key."""
+        merged: dict[SampleKey, float] = {}
+        with self._lock:
+            groups = list(self._groups.items())
+        for group, samples in groups:
+            for (name, labels), value in samples.items():
+                # Grouping labels win over pushed ones, as in a Pushgateway
+                key = (name, tuple(sorted({**dict(labels), **dict(group)}.items())))
+                merged[key] = value
+        return render(merged)
+
+
+class MetricsHandler(JSONRequestHandler):
+    routes = {
+        ("GET", "/healthz"): "handle_health",
+        ("GET", "/metrics"): "handle_metrics",
+        ("PUT", PUSH_PATH): "handle_push",
+        ("POST", PUSH_PATH): "handle_push",
+    }
+    text_type = CONTENT_TYPE
+
+    def __init__(self, *args: Any, store: PushStore, **kwargs: Any) -> None:
+        self.store = store
+        super().__init__(*args, **kwargs)
+
+    def handle_health(self, body: bytes) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    def handle_metrics(self, body: bytes) -> tuple[int, Any]:
+        return 200, self.store.render()
+
+    def handle_push(self, body: bytes) -> tuple[int, Any]:
+        try:
+            text = body.decode()
+        except UnicodeDecodeError:
+            raise ValueError("Metrics must be UTF-8 text")
+        count = self.store.replace(grouping_key(self.path), text)
+        return 200, {"samples": count}
+
+
+def create_metrics_server(
+    store: PushStore,
+    host: str = "127.0.0.1",
+    port: int = 9091,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """Create (but do not start) a push endpoint that Prometheus can scrape."""
+    handler = functools.partial(MetricsHandler, store=store)
+    return make_server(handler, host=host, port=port, socket_path=socket_path)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import functools
+import socketserver
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from octp.core.policy import CompiledPolicy
+from octp.core.validator import (
+    ValidationResult,
+    check_integrity,
+    validate_envelope_array,
+    validate_envelope_bytes,
+    validate_envelope_data,
+)
+from octp.identity.keyring import KeyRing
+from octp.metrics import CONTENT_TYPE, METRICS
+
+from .base import JSONRequestHandler, make_server
+
+
+class VerifyService:
+    """Verification state shared by every request the server handles.
+
+    The envelope type adapters are built once and the keyring is parsed
+    once at startup, so each request only pays for validation and hashing.
+    """
+
+    def __init__(
+        self, keyring: KeyRing | None = None, policy: CompiledPolicy | None = None
+    ) -> None:
+        self.keyring = keyring
+        self.policy = policy
+
+    def verify_json(self, body: bytes) -> dict[str, Any]:
+        """Verify a single envelope given as JSON (or CBOR) bytes."""
+        start = time.perf_counter()
+        response = self._verify(validate_envelope_bytes(body))
+        METRICS.observe("octp_verify_duration_seconds", time.perf_counter() - start)
+        return response
+
+    def verify_data(self, data: Any) -> dict[str, Any]:
+        """Verify a single envelope that has already been decoded from JSON."""
+        return self._verify(validate_envelope_data(data))
+
+    def verify_batch(self, body: bytes) -> list[dict[str, Any]]:
+        """Verify a JSON array of envelopes; results keep the input order."""
+        start = time.perf_counter()
+        results = [self._verify(result) for result in validate_envelope_array(body)]
+        METRICS.observe("octp_verify_duration_seconds", time.perf_counter() - start)
+        return results
+
+    def _verify(self, parsed: ValidationResult) -> dict[str, Any]:
+        response = self._check(parsed)
+        outcome = (
+            "invalid"
+            if not response["valid"]
+            else "violations"
+            if response.get("violations")
+            else "accepted"
+        )
+        METRICS.inc("octp_verify_envelopes_total", result=outcome)
+        return response
+
+    def _check(self, parsed: ValidationResult) -> dict[str, Any]:
+        if parsed.envelope is None:
+            return {
+                "valid": False,
+                "reason": f"Could not parse envelope: {parsed.summary()}",
+                "errors": [asdict(e) for e in parsed.errors],
+            }
+        envelope = parsed.envelope
+        result = check_integrity(envelope, self.keyring)
+        response = {
+            "valid": result.valid,
+            "reason": result.reason,
+            "signature_verified": result.signature_verified,
+            "contribution_id": envelope.contribution_id,
+            "commit_hash": envelope.commit_hash,
+        }
+        if self.policy is not None:
+            response["violations"] = [
+                asdict(v) for v in self.policy.evaluate(envelope)
+            ]
+        return response
+
+
+class VerifyHandler(JSONRequestHandler):
+    routes = {
+        ("GET", "/healthz"): "health",
+        ("GET", "/metrics"): "metrics",
+        ("POST", "/verify"): "verify",
+        ("POST", "/verify/batch"): "verify_batch",
+    }
+    text_type = CONTENT_TYPE
+
+    def __init__(self, *args: Any, service: VerifyService, **kwargs: Any) -> None:
+        self.service = service
+        super().__init__(*args, **kwargs)
+
+    def health(self, body: bytes) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    def metrics(self, body: bytes) -> tuple[int, Any]:
+        return 200, METRICS.render()
+
+    def verify(self, body: bytes) -> tuple[int, Any]:
+        return 200, self.service.verify_json(body)
+
+    def verify_batch(self, body: bytes) -> tuple[int, Any]:
+        return 200, {"results": self.service.verify_batch(body)}
+
+
+def create_verify_server(
+    service: VerifyService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """Create (but do not start) a verification server bound to ``service``."""
+    handler = functools.partial(VerifyHandler, service=service)
+    return make_server(handler, host=host, port=port, socket_path=socket_path)
@@ -0,0 +1,133 @@
+"""Content-addressed store for full tool reports.
+
+Runners keep a short ``detail`` for the console and envelope; the whole
+report goes here, zlib-compressed under ``<git dir>/octp/artifacts`` and
+named by the SHA-256 of its uncompressed bytes, so identical reports
+(the same findings on many commits) are stored once. Results and
+envelopes carry only the digest and the report is read back on demand.
+Every store or read refreshes the file's mtime, which ``gc`` uses to
+drop the least recently used reports first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+ARTIFACTS_DIR = "artifacts"
+SUFFIX = ".z"
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_digest(value: str) -> bool:
+    return bool(_DIGEST_RE.match(value))
+
+
+class ArtifactStore:
+    """One compressed file per report under a directory, fanned out by prefix."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, digest: str) -> Path:
+        if not is_digest(digest):
+            raise ValueError(f"Not a report digest: {digest!r}")
+        return self.directory / digest[:2] / f"{digest}{SUFFIX}"
+
+    def __contains__(self, digest: object) -> bool:
+        return (
+            isinstance(digest, str)
+            and is_digest(digest)
+            and self._path(digest).exists()
+        )
+
+    def put(self, report: str) -> str:
+        """Store a report and return its digest. Storing it again is cheap."""
+        data = report.encode(errors="surrogateescape")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        try:
+            os.utime(path)  # already stored; mark it recently used
+            return digest
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(zlib.compress(data, 6))
+        os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """The report for a digest. Raises KeyError if it is not stored
+        (never recorded here, or garbage-collected since)."""
+        path = self._path(digest)
+        try:
+            data = zlib.decompress(path.read_bytes())
+        except (FileNotFoundError, zlib.error):
+            raise KeyError(digest)
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise KeyError(digest)
+        os.utime(path)
+        return data.decode(errors="surrogateescape")
+
+    def gc(
+        self, max_age: float | None = None, max_bytes: int | None = None
+    ) -> tuple[int, int]:
+        """Delete reports unused for ``max_age`` seconds, then the least
+        recently used ones until at most ``max_bytes`` remain.
+
+        Returns (reports removed, bytes freed).
+        """
+        entries = []
+        for path in self.directory.glob(f"*/*{SUFFIX}"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()  # oldest first
+
+        cutoff = time.time() - max_age if max_age is not None else None
+        total = sum(size for _, size, _ in entries)
+        removed = freed = 0
+        for mtime, size, path in entries:
+            too_old = cutoff is not None and mtime < cutoff
+            too_big = max_bytes is not None and total > max_bytes
+            if not (too_old or too_big):
+                break  # everything after this is newer
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+            freed += size
+        return removed, freed
+
+
+# Defaults for the [artifacts] config section
+MAX_AGE_DAYS = 30
+MAX_SIZE_MB = 256
+
+
+def gc_limits(config: dict[str, Any]) -> tuple[float | None, int | None]:
+    """(max_age seconds, max_bytes) from the ``[artifacts]`` section.
+
+    A limit set to 0 is disabled.
+    """
+    section = config.get("artifacts", {})
+    try:
+        days = float(section.get("max_age_days", MAX_AGE_DAYS))
+        megabytes = float(section.get("max_size_mb", MAX_SIZE_MB))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid [artifacts] limit: {e}")
+    return (
+        days * 86400 if days > 0 else None,
+        int(megabytes * 1024 * 1024) if megabytes > 0 else None,
+    )
@@ -0,0 +1,101 @@
+"""Run checks on historical commits, several at a time.
+
+``octp backfill`` signs past commits so existing repositories can adopt
+octp. Each commit is checked out into a worktree from a reused pool and
+checked there; all of their runners share one pool of ``jobs`` threads,
+as for ``octp sign --workspace``.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import git
+
+from octp.git.reader import RepoInfo, open_repo, read_repo
+from octp.git.worktrees import WorktreePool
+
+from .base import CheckResult
+from .registry import run_all
+
+Outcome = dict[str, CheckResult] | Exception
+
+
+def list_commits(repo_root: Path, revs: list[str]) -> list[str]:
+    """Full hashes of the commits ``revs`` select, oldest first.
+
+    ``revs`` are ``git rev-list`` arguments, e.g. ``["v1.0..v2.0"]`` or
+    ``["--tags", "--no-walk"]``. Raises ValueError for a bad range.
+    """
+    repo = open_repo(repo_root)
+    try:
+        listing: str = repo.git.rev_list("--reverse", *revs)
+    except git.GitCommandError as e:
+        message = str(e.stderr).strip()
+        raise ValueError(f"Invalid revision range {' '.join(revs)}: {message}")
+    finally:
+        repo.close()
+    return listing.split()
+
+
+def backfill(
+    repo_root: Path,
+    commits: list[str],
+    jobs: int,
+    on_checked: Callable[[RepoInfo, dict[str, CheckResult]], None],
+    run_kwargs: dict[str, Any] | None = None,
+    on_commit: Callable[[str, Outcome], None] | None = None,
+    stop: threading.Event | None = None,
+) -> dict[str, Outcome]:
+    """Check each commit in a pooled worktree and hand over the results.
+
+    Args:
+        repo_root: The repository
+        commits: Commits to check, in the order to start them
+        jobs: Runners executing at once; also the number of worktrees
+        on_checked: Called from a worker thread with each commit's
+            repository info and results while its worktree is still
+            checked out (to build and store the envelope); an exception
+            it raises becomes that commit's outcome
+        run_kwargs: Extra run_all arguments (profile, cache, options, ...)
+        on_commit: Called from a worker thread as each commit finishes
+        stop: Once set, commits not yet started are skipped and left out
+            of the returned outcomes
+
+    Returns each finished commit's results, or the exception that
+    stopped it.
+    """
+    outcomes: dict[str, Outcome] = {}
+    if not commits:
+        return outcomes
+    pool = WorktreePool(repo_root, max(min(jobs, len(commits)), 1))
+    workers = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(jobs, 1), thread_name_prefix="octp-job"
+    )
+
+    def check(commit: str) -> Outcome | None:
+        if stop is not None and stop.is_set():
+            return None
+        try:
+            with pool.checkout(commit) as path:
+                results = run_all(path, executor=workers, **(run_kwargs or {}))
+                on_checked(read_repo(path), results)
+            outcome: Outcome = results
+        except Exception as e:
+            outcome = e
+        if on_commit is not None:
+            on_commit(commit, outcome)
+        return outcome
+
+    # One coordinator per worktree: each checks out, enumerates and waits
+    coordinators = concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(pool.paths), thread_name_prefix="octp-commit"
+    )
+    with workers, coordinators:
+        for commit, outcome in zip(commits, coordinators.map(check, commits)):
+            if outcome is not None:
+                outcomes[commit] = outcome
+    return outcomes
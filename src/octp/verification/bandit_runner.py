@@ -4,30 +4,48 @@ import shutil
 import subprocess
 
 from .base import CheckResult, CheckRunner
+from .fileset import command_paths
+from .inprocess import get_pool, run_bandit
 
 
 class BanditRunner(CheckRunner):
     name = "bandit"
+    file_patterns = ("*.py",)
+    change_patterns = (*file_patterns, "pyproject.toml", ".bandit")
+    in_process_tool = "bandit"
+    shardable = True
 
     def is_available(self) -> bool:
         return shutil.which("bandit") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        targets = command_paths(files) if files is not None else ["."]
+        status = "ok"
+        output = None
         try:
-            result = subprocess.run(
-                ["bandit", "-r", ".", "-q", "-ll"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            passed = result.returncode == 0
-            detail = "No high-severity issues" if passed else result.stdout[:200]
+            if self.in_process:
+                returncode, stdout, _ = get_pool().call(
+                    run_bandit, repo_root, targets, timeout=60
+                )
+            else:
+                result = subprocess.run(
+                    ["bandit", "-r", "-q", "-ll", "--", *targets],
+                    cwd=repo_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                )
+                returncode, stdout = result.returncode, result.stdout
+            passed = returncode == 0
+            detail = "No high-severity issues" if passed else stdout[:200]
+            output = stdout
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "Bandit timed out"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
         return CheckResult(
@@ -35,4 +53,6 @@ class BanditRunner(CheckRunner):
             tool_name="bandit",
             suite_hash=None,
             detail=detail,
+            status=status,
+            output=output,
         )
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import functools
+import os
+import shutil
+import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Any
+
+from .fileset import match_paths
+
+# CheckResult.status of a runner skipped because no changed file concerns it
+NOT_APPLICABLE = "not_applicable"
 
 
 @dataclass
@@ -10,24 +20,100 @@ class CheckResult:
     tool_name: str  # e.g. "pytest@7.4.0"
     suite_hash: str | None  # hash of test suite if applicable
     detail: str  # human-readable summary
+    status: str = "ok"  # "ok", "timeout", "error", "crashed" or NOT_APPLICABLE
+    cached: bool = False  # reused from the result cache, not run
+    # Full tool report; run_all moves it to the artifact store and keeps
+    # only its digest
+    output: str | None = None
+    report_digest: str | None = None
+
+
+@functools.lru_cache(maxsize=None)
+def tool_version(executable: str) -> str:
+    """First line of ``<executable> --version``, or "unknown"."""
+    path = shutil.which(executable)
+    if path is None:
+        return "unknown"
+    try:
+        out = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=30
+        ).stdout
+    except Exception:
+        return "unknown"
+    return out.strip().splitlines()[0] if out.strip() else "unknown"
 
 
 class CheckRunner(ABC):
     """Abstract base for all verification runners."""
 
     name: str = ""  # Class attribute - subclasses override this
+    # False for runners whose result depends on more than the working tree
+    # and cache_inputs(), e.g. online vulnerability databases
+    cacheable: bool = True
+    # Globs selecting the files this runner checks, e.g. ("*.py",). Runners
+    # that set this receive the matching paths from the shared FileSet
+    # instead of walking the tree themselves; None means "the whole repo".
+    file_patterns: tuple[str, ...] | None = None
+    # Globs of changed files that make this runner worth running, e.g. its
+    # config files on top of the files it checks. None falls back to
+    # file_patterns; a runner with neither always runs
+    change_patterns: tuple[str, ...] | None = None
+    # Key in inprocess.TOOL_MODULES for runners that can drive their tool
+    # through its Python API; run_all(in_process=True) then sets in_process
+    in_process_tool: str | None = None
+    in_process: bool = False
+    # Runners whose tool is single-threaded and scans files independently
+    # set this; run_all then splits their file list over up to ``shards``
+    # parallel runs (see sharding.py) and combines them with merge()
+    shardable: bool = False
+    shards: int = 1
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         if not cls.name:
             raise TypeError(f"{cls.__name__} must define 'name'")
 
+    def configure(self, options: dict[str, Any]) -> None:
+        """Apply the repository's ``[runners]`` config section."""
+        overrides = options.get("change_patterns")
+        if isinstance(overrides, dict) and isinstance(overrides.get(self.name), list):
+            self.change_patterns = tuple(overrides[self.name])
+        if self.shardable:
+            shards = options.get("shards")
+            if isinstance(shards, int) and shards > 0:
+                self.shards = shards
+            else:
+                self.shards = os.cpu_count() or 1
+
+    def applies_to(self, changed: list[str]) -> bool:
+        """True if any of the ``changed`` paths concerns this runner."""
+        patterns = self.change_patterns or self.file_patterns
+        return patterns is None or bool(match_paths(changed, patterns))
+
     @abstractmethod
     def is_available(self) -> bool:
         """Returns True if this runner can be used in the current environment."""
         ...
 
     @abstractmethod
-    def run(self, repo_root: str) -> CheckResult:
-        """Run the check and return a result."""
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        """Run the check and return a result.
+
+        ``files`` is only passed to runners with ``file_patterns``: the
+        matching paths, relative to repo_root (possibly none).
+        """
         ...
+
+    def merge(self, results: list[CheckResult]) -> CheckResult:
+        """Combine the per-shard results of a sharded run."""
+        from .sharding import merge_results
+
+        return merge_results(results)
+
+    def cache_inputs(self) -> list[str]:
+        """Values besides the working tree that determine the result.
+
+        Part of the result cache key; override when a runner depends on
+        configuration beyond its tool version.
+        """
+        return [tool_version(self.name)]
@@ -0,0 +1,278 @@
+"""Verification result cache keyed by working tree and tool versions.
+
+Results are stored locally under ``<git dir>/octp/cache`` and, optionally,
+in a shared remote cache spoken to over a small HTTP protocol::
+
+    GET /v1/results/<key>   -> 200 entry | 404
+    PUT /v1/results/<key>   <- entry     -> 204
+
+An entry is ``{"key", "result", "signer", "signature"}``. The signature is
+the signer's envelope key over ``hash_payload({"key", "result"})``, and a
+client accepts only entries signed by one of its trusted signers, unless
+it explicitly opts out with ``trust_unsigned``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import tempfile
+import urllib.request
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Callable, Protocol
+
+from octp import __version__
+from octp.identity.keymanager import sign_payload
+from octp.identity.keyring import KeyRing
+from octp.integrity.hasher import hash_payload
+
+from .base import CheckResult, CheckRunner
+
+CACHE_DIR = "cache"
+REMOTE_ENV = "OCTP_REMOTE_CACHE"
+RESULTS_PATH = "/v1/results/"
+
+_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+# Reports travel by digest (report_digest), never inline
+_RESULT_FIELDS = {f.name for f in fields(CheckResult)} - {"cached", "output"}
+
+
+def is_cache_key(key: str) -> bool:
+    return bool(_KEY_RE.match(key))
+
+
+def cache_key(tree_hash: str, runner: CheckRunner) -> str:
+    """Key for a runner's result on a given working tree."""
+    parts = [
+        tree_hash,
+        runner.name,
+        __version__,
+        platform.python_version(),
+        *runner.cache_inputs(),
+    ]
+    return hash_payload({"inputs": parts})
+
+
+def result_to_dict(result: CheckResult) -> dict[str, Any]:
+    data = asdict(result)
+    data.pop("cached")
+    data.pop("output")
+    return data
+
+
+def result_from_dict(data: Any) -> CheckResult:
+    """Rebuild a CheckResult, ignoring fields this version does not know."""
+    if not isinstance(data, dict):
+        raise ValueError("Cached result must be an object")
+    try:
+        return CheckResult(**{k: v for k, v in data.items() if k in _RESULT_FIELDS})
+    except TypeError as e:
+        raise ValueError(f"Malformed cached result: {e}")
+
+
+class ResultCache(Protocol):
+    def get(self, key: str) -> CheckResult | None: ...
+
+    def put(self, key: str, result: CheckResult) -> None: ...
+
+
+class LocalCache:
+    """One JSON file per key under a directory, fanned out by prefix."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CheckResult | None:
+        try:
+            data = json.loads(self._path(key).read_bytes())
+            result = result_from_dict(data)
+        except (OSError, ValueError):
+            return None
+        result.cached = True
+        return result
+
+    def put(self, key: str, result: CheckResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(result_to_dict(result), f)
+        os.replace(tmp, path)
+
+    def clear(self) -> int:
+        """Delete every entry. Returns the number removed."""
+        removed = 0
+        for path in self.directory.glob("*/*.json"):
+            path.unlink()
+            removed += 1
+        return removed
+
+
+def sign_entry(
+    key: str,
+    result: CheckResult,
+    developer_id: str | None = None,
+    sign: Callable[[str], str] | None = None,
+) -> dict[str, Any]:
+    """Wrap a result for upload, signed when a developer_id is given."""
+    data = result_to_dict(result)
+    entry: dict[str, Any] = {
+        "key": key,
+        "result": data,
+        "signer": None,
+        "signature": None,
+    }
+    if developer_id is not None:
+        entry["signer"] = developer_id
+        entry["signature"] = (sign or sign_payload)(
+            hash_payload({"key": key, "result": data})
+        )
+    return entry
+
+
+def open_entry(
+    entry: Any,
+    key: str,
+    keyring: KeyRing | None = None,
+    trust_unsigned: bool = False,
+) -> CheckResult | None:
+    """Unwrap a downloaded entry, or None if it is for another key or untrusted.
+
+    Only entries signed by one of the keyring's keys pass, so without a
+    keyring nothing does; ``trust_unsigned`` skips the signature check.
+    """
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    data = entry.get("result")
+    if not trust_unsigned:
+        if keyring is None:
+            return None
+        signer, signature = entry.get("signer"), entry.get("signature")
+        if not isinstance(signer, str) or not isinstance(signature, str):
+            return None
+        digest = hash_payload({"key": key, "result": data})
+        if keyring.verify(signer, digest, signature) is not True:
+            return None
+    try:
+        result = result_from_dict(data)
+    except ValueError:
+        return None
+    result.cached = True
+    return result
+
+
+class RemoteCache:
+    """Client for the shared cache. Network failures are treated as misses.
+
+    Args:
+        url: Base URL of the cache server
+        keyring: Trusted signers; unsigned or foreign entries are ignored
+        developer_id: Sign uploads as this developer (with the local key)
+        push: Upload results; read-only when False
+        trust_unsigned: Accept entries without checking who signed them
+    """
+
+    def __init__(
+        self,
+        url: str,
+        keyring: KeyRing | None = None,
+        developer_id: str | None = None,
+        push: bool = False,
+        timeout: float = 2.0,
+        trust_unsigned: bool = False,
+    ) -> None:
+        self.url = url.rstrip("/")
+        self.keyring = keyring
+        self.developer_id = developer_id
+        self.push = push
+        self.timeout = timeout
+        self.trust_unsigned = trust_unsigned
+
+    def get(self, key: str) -> CheckResult | None:
+        try:
+            with urllib.request.urlopen(
+                self.url + RESULTS_PATH + key, timeout=self.timeout
+            ) as response:
+                entry = json.loads(response.read())
+        except (OSError, ValueError):  # URLError and HTTPError are OSErrors
+            return None
+        return open_entry(entry, key, self.keyring, self.trust_unsigned)
+
+    def put(self, key: str, result: CheckResult) -> None:
+        if not self.push:
+            return
+        body = json.dumps(sign_entry(key, result, self.developer_id)).encode()
+        request = urllib.request.Request(
+            self.url + RESULTS_PATH + key,
+            data=body,
+            method="PUT",
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+        except OSError:
+            pass
+
+
+class LayeredCache:
+    """Local cache in front of a remote one; remote hits are kept locally."""
+
+    def __init__(self, local: LocalCache, remote: RemoteCache) -> None:
+        self.local = local
+        self.remote = remote
+
+    def get(self, key: str) -> CheckResult | None:
+        result = self.local.get(key)
+        if result is None:
+            result = self.remote.get(key)
+            if result is not None:
+                self.local.put(key, result)
+        return result
+
+    def put(self, key: str, result: CheckResult) -> None:
+        self.local.put(key, result)
+        self.remote.put(key, result)
+
+
+def cache_from_config(
+    config: dict[str, Any],
+    state_dir: Path,
+    developer_id: str | None = None,
+) -> ResultCache | None:
+    """Build the cache described by the ``[cache]`` config section.
+
+    ``enabled`` (default true) turns the local cache on; ``remote`` (or
+    $OCTP_REMOTE_CACHE) adds a shared cache, ``push`` uploads to it and
+    ``trusted_keys`` lists accepted signers as developer_id=path.pem. A
+    remote cache without ``trusted_keys`` raises ValueError unless
+    ``trust_unsigned`` is set.
+    """
+    section = config.get("cache", {})
+    if not section.get("enabled", True):
+        return None
+    local = LocalCache(state_dir / CACHE_DIR)
+    url = os.environ.get(REMOTE_ENV) or section.get("remote")
+    if not url:
+        return local
+    trusted_keys = section.get("trusted_keys", [])
+    trust_unsigned = bool(section.get("trust_unsigned", False))
+    if not trusted_keys and not trust_unsigned:
+        raise ValueError(
+            "[cache] remote needs trusted_keys "
+            "(or trust_unsigned = true to accept any entry)"
+        )
+    remote = RemoteCache(
+        url,
+        keyring=KeyRing.from_specs(trusted_keys),
+        developer_id=developer_id,
+        push=bool(section.get("push", False)),
+        trust_unsigned=trust_unsigned,
+    )
+    return LayeredCache(local, remote)
@@ -0,0 +1,47 @@
+"""Which files a contribution changes, for skipping unaffected runners.
+
+A runner is only worth running when a changed file matches its
+``change_patterns`` (or ``file_patterns``): a docs-only commit needs
+neither pytest nor mypy. Changes are counted from the merge base of
+``[runners] changes_since`` (default ``HEAD^``, the commit's parent) to
+the working tree, so uncommitted and untracked files count too.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SINCE = "HEAD^"
+
+
+def changed_files(repo_root: Path, since: str = DEFAULT_SINCE) -> list[str] | None:
+    """Paths changed since ``since``, relative to the repository root.
+
+    Deleted and renamed-away paths are included. Returns None when the
+    changes cannot be known (outside git, on a root commit, in a shallow
+    clone missing ``since``), in which case every runner applies.
+    """
+
+    def git(*args: str) -> bytes:
+        return subprocess.run(
+            ["git", *args], cwd=repo_root, capture_output=True, check=True
+        ).stdout
+
+    try:
+        base = git("merge-base", since, "HEAD").decode().strip()
+        diff = git("diff", "--name-only", "--no-renames", "-z", base)
+        untracked = git("ls-files", "-z", "--others", "--exclude-standard")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    names = (diff + untracked).decode(errors="surrogateescape").split("\0")
+    return sorted({name for name in names if name})
+
+
+def changes_for(repo_root: Path, options: dict[str, Any]) -> list[str] | None:
+    """Changed paths per the ``[runners]`` options; None to run everything."""
+    if not options.get("skip_unaffected", True):
+        return None
+    since = options.get("changes_since", DEFAULT_SINCE)
+    return changed_files(repo_root, since if isinstance(since, str) else DEFAULT_SINCE)
@@ -5,14 +5,32 @@ import subprocess
 
 from .base import CheckResult, CheckRunner
 
+# Manifests and lock files that decide which packages get installed
+DEPENDENCY_FILES = (
+    "requirements*.txt",
+    "requirements/*",
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "Pipfile",
+    "Pipfile.lock",
+    "poetry.lock",
+    "pdm.lock",
+    "uv.lock",
+)
+
 
 class DepsRunner(CheckRunner):
     name = "pip-audit"
+    cacheable = False  # advisory database changes independently of the tree
+    change_patterns = DEPENDENCY_FILES
 
     def is_available(self) -> bool:
         return shutil.which("pip-audit") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        status = "ok"
+        output = None
         try:
             result = subprocess.run(
                 ["pip-audit", "--progress-spinner=off"],
@@ -23,11 +41,14 @@ class DepsRunner(CheckRunner):
             )
             passed = result.returncode == 0
             detail = "No known vulnerabilities" if passed else result.stdout[:200]
+            output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "pip-audit timed out"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
         return CheckResult(
@@ -35,4 +56,6 @@ class DepsRunner(CheckRunner):
             tool_name="pip-audit",
             suite_hash=None,
             detail=detail,
+            status=status,
+            output=output,
         )
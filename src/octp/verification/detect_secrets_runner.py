@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+import json
 import shutil
 import subprocess
+from typing import Any
 
 from .base import CheckResult, CheckRunner
+from .fileset import command_paths
 
 
 class DetectSecretsRunner(CheckRunner):
     name = "detect-secrets"
+    file_patterns = ("*",)
+    shardable = True
 
     def is_available(self) -> bool:
         return shutil.which("detect-secrets") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        targets = command_paths(files) if files is not None else ["."]
+        status = "ok"
+        output = None
         try:
             result = subprocess.run(
-                ["detect-secrets", "scan", "."],
+                ["detect-secrets", "scan", "--", *targets],
                 cwd=repo_root,
                 capture_output=True,
                 text=True,
@@ -23,8 +31,7 @@ class DetectSecretsRunner(CheckRunner):
             )
             passed = result.returncode == 0
             # detect-secrets scan outputs JSON to stdout, errors to stderr
-            import json
-
+            output = result.stdout
             try:
                 scan_result = json.loads(result.stdout)
                 has_secrets = len(scan_result.get("results", {})) > 0
@@ -38,9 +45,11 @@ class DetectSecretsRunner(CheckRunner):
                 detail = "Scan completed" if passed else "Potential secrets detected"
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "detect-secrets timed out after 60 seconds"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
         return CheckResult(
@@ -48,4 +57,28 @@ class DetectSecretsRunner(CheckRunner):
             tool_name="detect-secrets",
             suite_hash=None,
             detail=detail,
+            status=status,
+            output=output,
+        )
+
+    def merge(self, results: list[CheckResult]) -> CheckResult:
+        """Combine shard scans into one baseline-style JSON report."""
+        merged = super().merge(results)
+        if merged.status != "ok":
+            return merged
+        combined: dict[str, Any] = {}
+        found: dict[str, Any] = {}
+        for r in results:
+            try:
+                scan = json.loads(r.output or "")
+            except json.JSONDecodeError:
+                return merged
+            combined = combined or scan
+            found.update(scan.get("results", {}))
+        combined["results"] = found
+        merged.passed = not found
+        merged.detail = (
+            "No secrets detected" if not found else f"Secrets found: {len(found)}"
         )
+        merged.output = json.dumps(combined, indent=2)
+        return merged
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+# Half the kernel's argument limit, leaving room for the tool's own
+# arguments and the environment
+_ARG_MAX = os.sysconf("SC_ARG_MAX") if hasattr(os, "sysconf") else 32768
+ARG_BUDGET = min(_ARG_MAX, 2 * 1024 * 1024) // 2
+
+
+@dataclass(frozen=True)
+class FileSet:
+    """Every file git would consider part of the working tree.
+
+    Tracked files plus untracked files that are not ignored, so ignored
+    directories (.venv, node_modules, build output) are never scanned.
+    Paths are relative to ``root``, sorted, and exist on disk.
+    """
+
+    root: Path
+    paths: tuple[str, ...]
+
+    @classmethod
+    def discover(cls, root: Path) -> FileSet:
+        """Enumerate the tree once with ``git ls-files``.
+
+        Raises RuntimeError outside a git work tree.
+        """
+        try:
+            out = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                cwd=root,
+                capture_output=True,
+                check=True,
+            ).stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise RuntimeError(f"Could not list files in {root}: {e}")
+        names = {p for p in out.decode(errors="surrogateescape").split("\0") if p}
+        # Deleted-but-tracked files and submodule gitlinks are not files
+        paths = sorted(p for p in names if os.path.isfile(root / p))
+        return cls(root, tuple(paths))
+
+    def select(self, patterns: Iterable[str]) -> list[str]:
+        """Paths matching any glob, e.g. ``("*.py", "*.pyi")``.
+
+        ``*`` also matches "/", so ``src/*.py`` covers the whole src tree.
+        """
+        return match_paths(self.paths, patterns)
+
+
+def match_paths(paths: Iterable[str], patterns: Iterable[str]) -> list[str]:
+    """The paths matching any glob; ``*`` also matches "/"."""
+    patterns = tuple(patterns)
+    if "*" in patterns:
+        return list(paths)
+    return [p for p in paths if any(fnmatch.fnmatchcase(p, g) for g in patterns)]
+
+
+def command_paths(paths: list[str], budget: int = ARG_BUDGET) -> list[str]:
+    """Paths to put on a tool's command line.
+
+    The list itself when it fits the argument budget, otherwise the
+    top-level entries that contain them: coarser, but ignored top-level
+    directories (which contain no listed files) are still left out.
+    """
+    if sum(len(p) + 1 for p in paths) <= budget:
+        return paths
+    return sorted({p.split("/", 1)[0] for p in paths})
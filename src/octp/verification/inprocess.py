@@ -0,0 +1,243 @@
+"""Run Python-based tools through their APIs in persistent worker processes.
+
+Spawning ``mypy``, ``bandit`` or ``pytest`` costs an interpreter start and
+a full re-import of the tool on every call. Here each tool is driven from
+a worker process that imported it in advance: mypy and bandit keep
+long-lived workers, while pytest gets a fresh worker per run because
+test modules would otherwise stay in ``sys.modules``. Each tool has its
+own workers and each call a worker to itself, so a crash or hang ends
+only that worker, which the next call replaces.
+
+Worth it whenever octp runs checks more than once per process (``octp
+watch``, workspace signing); a single ``octp sign`` still pays one
+worker start per tool.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import subprocess
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+# Tools that have an in-process driver, by the module that must import
+TOOL_MODULES = {"mypy": "mypy.api", "bandit": "bandit", "pytest": "pytest"}
+
+
+def is_importable(tool: str) -> bool:
+    """True if octp's own interpreter can import the tool."""
+    try:
+        return importlib.util.find_spec(TOOL_MODULES[tool].split(".")[0]) is not None
+    except (KeyError, ValueError):
+        return False
+
+
+def _warm(modules: tuple[str, ...]) -> None:
+    for name in modules:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(name)
+
+
+# --- tool drivers; these run inside the workers ----------------------------
+
+
+def run_mypy(repo_root: str, args: list[str]) -> tuple[int, str, str]:
+    """Like ``mypy <args>``. Returns (exit status, stdout, version)."""
+    from mypy import api
+    from mypy.version import __version__
+
+    os.chdir(repo_root)
+    stdout, _, status = api.run(args)
+    return status, stdout, __version__
+
+
+def run_bandit(repo_root: str, targets: list[str]) -> tuple[int, str, str]:
+    """Like ``bandit -r -q -ll <targets>``. Returns (status, report, version)."""
+    import bandit
+    from bandit.core import config, constants, manager
+
+    os.chdir(repo_root)
+    mgr = manager.BanditManager(config.BanditConfig(), "file", quiet=True)
+    mgr.discover_files(targets, True, ",".join(constants.EXCLUDE))
+    mgr.run_tests()
+    issues = mgr.get_issue_list(sev_level="MEDIUM", conf_level="UNDEFINED")
+    report = "\n".join(
+        f"{i.fname}:{i.lineno}: {i.test_id} [{i.severity}] {i.text}" for i in issues
+    )
+    return (1 if issues else 0), report, bandit.__version__
+
+
+def run_pytest(
+    repo_root: str, args: list[str], env: dict[str, str] | None = None
+) -> tuple[int, str, str]:
+    """Like ``pytest <args>``. Returns (exit code, stdout, version).
+
+    ``env`` is added to the worker's environment; workers are not reused.
+    """
+    import pytest
+
+    os.chdir(repo_root)
+    os.environ.update(env or {})
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        code = pytest.main(args)
+    return int(code), out.getvalue(), pytest.__version__
+
+
+# --- pool management ---------------------------------------------------------
+
+# Modules each driver's workers import before their first call
+WARM_MODULES: dict[Callable[..., Any], tuple[str, ...]] = {
+    run_mypy: ("mypy.api",),
+    run_bandit: ("bandit.core.manager",),
+    run_pytest: ("pytest",),
+}
+
+
+def _serve(conn: Connection, modules: tuple[str, ...]) -> None:
+    """Worker loop: run each ``(fn, args)`` received and send back the outcome."""
+    _warm(modules)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        fn, args = request
+        try:
+            reply = (True, fn(*args))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:  # an unpicklable result or exception
+            conn.send((False, RuntimeError(f"{fn.__name__}: {e}")))
+
+
+class _Worker:
+    """A spawned process that runs one call at a time for whoever holds it."""
+
+    def __init__(self, modules: tuple[str, ...]) -> None:
+        # spawn: octp is multi-threaded when this runs, so fork is unsafe
+        context = multiprocessing.get_context("spawn")
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, modules))
+        self.process.start()
+        child.close()
+        self.killed = False
+
+    def call(self, fn: Callable[..., Any], args: Any, timeout: float | None) -> Any:
+        """Run ``fn(*args)``; the worker is killed if it hangs or dies."""
+        try:
+            self.conn.send((fn, args))
+            if not self.conn.poll(timeout):
+                self.kill()
+                raise subprocess.TimeoutExpired(fn.__name__, timeout or 0)
+            ok, value = self.conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            raise RuntimeError(f"Worker running {fn.__name__} exited unexpectedly")
+        if not ok:
+            raise value
+        return value
+
+    def close(self) -> None:
+        if not self.killed:
+            with contextlib.suppress(OSError):
+                self.conn.send(None)
+            self.process.join(timeout=5)
+            self.kill()
+
+    def kill(self) -> None:
+        self.killed = True
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ToolPool:
+    """Lazily started worker processes, kept separately for each tool.
+
+    A call has a worker to itself, so a timeout or crash ends only that
+    worker and never a check running in another one. Up to
+    ``shared_workers`` idle workers per tool are kept for reuse; a
+    ``fresh`` call's worker is discarded afterwards.
+    """
+
+    def __init__(self, shared_workers: int = 2) -> None:
+        self.shared_workers = shared_workers
+        self._lock = threading.Lock()
+        self._idle: dict[Callable[..., Any], list[_Worker]] = {}
+        self._busy: set[_Worker] = set()
+
+    def _checkout(self, fn: Callable[..., Any], fresh: bool) -> _Worker:
+        with self._lock:
+            idle = self._idle.get(fn)
+            worker = idle.pop() if idle and not fresh else None
+        if worker is None:
+            worker = _Worker(WARM_MODULES.get(fn, ()))
+        with self._lock:
+            self._busy.add(worker)
+        return worker
+
+    def _checkin(self, fn: Callable[..., Any], worker: _Worker, fresh: bool) -> None:
+        with self._lock:
+            self._busy.discard(worker)
+            idle = self._idle.setdefault(fn, [])
+            if not fresh and not worker.killed and len(idle) < self.shared_workers:
+                idle.append(worker)
+                return
+        worker.close()
+
+    def call(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        fresh: bool = False,
+    ) -> Any:
+        """Run ``fn(*args)`` in a worker and wait for it.
+
+        Raises subprocess.TimeoutExpired on timeout (after killing the
+        worker), like the subprocess-based runners, and RuntimeError if
+        the worker dies.
+        """
+        worker = self._checkout(fn, fresh)
+        try:
+            return worker.call(fn, args, timeout)
+        finally:
+            self._checkin(fn, worker, fresh)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            idle = [w for workers in self._idle.values() for w in workers]
+            busy = list(self._busy)
+            self._idle.clear()
+            self._busy.clear()
+        for worker in idle:
+            worker.close()
+        for worker in busy:
+            worker.kill()
+
+
+_pool: ToolPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ToolPool:
+    """The process-wide pool, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ToolPool()
+            atexit.register(_pool.shutdown)
+        return _pool
@@ -0,0 +1,133 @@
+"""Streaming reader for pytest's JUnit XML report.
+
+One ``pytest --junitxml`` run gives pass/fail, per-test durations and
+(with pytest-cov) coverage, so nothing needs a second run of the suite.
+The XML is read with ``iterparse`` and each ``<testcase>`` is discarded
+once counted, keeping memory flat for suites with many thousands of
+tests. Durations are kept in ``<git dir>/octp/pytest/durations.json``
+for scheduling and sharding.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PYTEST_DIR = "pytest"
+JUNIT_FILE = "junit.xml"
+COVERAGE_FILE = "coverage"
+DURATIONS_FILE = "durations.json"
+
+_OUTCOMES = ("failure", "error", "skipped")
+
+
+@dataclass
+class JUnitReport:
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+    skipped: int = 0
+    time: float = 0.0
+    durations: dict[str, float] = field(default_factory=dict)
+    failures: list[str] = field(default_factory=list)  # test ids, in order
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.failed + self.errors + self.skipped
+
+    def summary(self) -> str:
+        """pytest-style one-liner, e.g. "12 passed, 1 failed in 3.20s"."""
+        parts = [
+            f"{count} {label}"
+            for count, label in (
+                (self.failed, "failed"),
+                (self.passed, "passed"),
+                (self.skipped, "skipped"),
+                (self.errors, "errors" if self.errors != 1 else "error"),
+            )
+            if count
+        ]
+        return f"{', '.join(parts) or 'no tests ran'} in {self.time:.2f}s"
+
+
+def case_id(case: ET.Element) -> str:
+    """Node id such as ``tests/test_x.py::TestY::test_z``.
+
+    JUnit only has the dotted ``classname`` (``tests.test_x.TestY``);
+    trailing capitalised parts are taken to be classes.
+    """
+    name = case.get("name", "")
+    parts = [p for p in case.get("classname", "").split(".") if p]
+    if not parts:
+        return name
+    i = len(parts)
+    while i > 1 and parts[i - 1][:1].isupper():
+        i -= 1
+    return "::".join(["/".join(parts[:i]) + ".py", *parts[i:], name])
+
+
+def parse_junit(path: Path) -> JUnitReport:
+    """Count outcomes and collect durations from a JUnit XML file.
+
+    Raises ValueError for unreadable or malformed reports.
+    """
+    report = JUnitReport()
+    suite_time = None
+    try:
+        for _, elem in ET.iterparse(path, events=("end",)):
+            if elem.tag == "testsuite":
+                # Wall time of the session, setup and teardown included
+                try:
+                    suite_time = (suite_time or 0.0) + float(elem.get("time") or 0)
+                except ValueError:
+                    pass
+                continue
+            if elem.tag != "testcase":
+                continue
+            tid = case_id(elem)
+            try:
+                seconds = float(elem.get("time") or 0)
+            except ValueError:
+                seconds = 0.0
+            report.durations[tid] = seconds
+            report.time += seconds
+            outcome = next(
+                (child.tag for child in elem if child.tag in _OUTCOMES), None
+            )
+            if outcome == "failure":
+                report.failed += 1
+                report.failures.append(tid)
+            elif outcome == "error":
+                report.errors += 1
+                report.failures.append(tid)
+            elif outcome == "skipped":
+                report.skipped += 1
+            else:
+                report.passed += 1
+            elem.clear()
+    except (OSError, ET.ParseError) as e:
+        raise ValueError(f"Could not read JUnit report {path}: {e}")
+    if suite_time is not None:
+        report.time = suite_time
+    return report
+
+
+def save_durations(directory: Path, durations: dict[str, float]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(durations, f, indent=0, sort_keys=True)
+    os.replace(tmp, directory / DURATIONS_FILE)
+
+
+def load_durations(directory: Path) -> dict[str, float]:
+    """Per-test durations from the last run; {} if there was none."""
+    try:
+        data = json.loads((directory / DURATIONS_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import hashlib
+import subprocess
+from pathlib import Path
+
+# Files mypy reads its configuration from, in its own lookup order
+CONFIG_FILES = ("mypy.ini", ".mypy.ini", "pyproject.toml", "setup.cfg")
+
+# The daemon exits by itself after this long without a request
+IDLE_TIMEOUT = 4 * 60 * 60
+
+_NOISE = ("Daemon started", "Daemon stopped", "Restarting:")
+
+
+class MypyDaemon:
+    """A dmypy daemon owned by octp, one per worktree.
+
+    Status file, log and ``--cache-dir`` live under ``directory``
+    (``<git dir>/octp/mypy``, the worktree's own git dir rather than the
+    common one) and never land in the working tree. The
+    daemon keeps a fine-grained cache there, so even a freshly started
+    daemon (after a restart or its idle timeout) checks incrementally.
+    dmypy restarts the daemon itself when command-line flags change;
+    config file edits it does not notice, so their hash is stamped and a
+    mismatch stops the daemon.
+    """
+
+    def __init__(self, repo_root: Path, directory: Path) -> None:
+        self.repo_root = repo_root
+        self.directory = directory
+        self.status_file = directory / "status.json"
+        self.cache_dir = directory / "cache"
+        self.log_file = directory / "daemon.log"
+        self.stamp_file = directory / "config.sha256"
+
+    def _dmypy(
+        self, *args: str, timeout: float | None = 30
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            ["dmypy", "--status-file", str(self.status_file), *args],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+    def config_hash(self) -> str:
+        h = hashlib.sha256()
+        for name in CONFIG_FILES:
+            path = self.repo_root / name
+            if path.is_file():
+                h.update(name.encode() + b"\0" + path.read_bytes() + b"\0")
+        return h.hexdigest()
+
+    def is_running(self) -> bool:
+        return self.status_file.exists() and self._dmypy("status").returncode == 0
+
+    def stop(self) -> None:
+        if not self.status_file.exists():
+            return
+        if self._dmypy("stop").returncode != 0:
+            self._dmypy("kill")
+
+    def _restart_if_config_changed(self) -> None:
+        current = self.config_hash()
+        try:
+            stamped = self.stamp_file.read_text()
+        except FileNotFoundError:
+            stamped = None
+        if stamped != current:
+            self.stop()
+            self.stamp_file.write_text(current)
+
+    def check(self, targets: list[str], timeout: float) -> tuple[int, str]:
+        """Type-check ``targets``, starting the daemon if needed.
+
+        Returns (exit status, output) with dmypy's lifecycle chatter removed;
+        status 2 means the daemon itself failed.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._restart_if_config_changed()
+        result = self._dmypy(
+            "run",
+            "--timeout",
+            str(IDLE_TIMEOUT),
+            "--log-file",
+            str(self.log_file),
+            "--",
+            "--use-fine-grained-cache",
+            "--cache-dir",
+            str(self.cache_dir),
+            "--",
+            *targets,
+            timeout=timeout,
+        )
+        output = "\n".join(
+            line for line in result.stdout.splitlines() if not line.startswith(_NOISE)
+        )
+        if result.returncode == 2 and not output:
+            output = result.stderr.strip()
+        return result.returncode, output
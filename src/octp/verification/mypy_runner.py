@@ -1,44 +1,95 @@
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+from pathlib import Path
 
 from .base import CheckResult, CheckRunner
+from .fileset import command_paths
+from .inprocess import get_pool, run_mypy
+from .mypy_daemon import MypyDaemon
 
 
 class MypyRunner(CheckRunner):
     name = "mypy"
+    file_patterns = ("src/*.py", "src/*.pyi")
+    change_patterns = (*file_patterns, "pyproject.toml", "setup.cfg", "mypy.ini")
+    in_process_tool = "mypy"
+
+    def __init__(self, daemon: bool | None = None) -> None:
+        # Incremental checks through dmypy unless OCTP_MYPY_DAEMON=0
+        if daemon is None:
+            daemon = os.environ.get("OCTP_MYPY_DAEMON", "1") != "0"
+        self.daemon = daemon
+
+    def _daemon_for(self, repo_root: str) -> MypyDaemon | None:
+        if not self.daemon or shutil.which("dmypy") is None:
+            return None
+        from octp.git.reader import open_repo
+
+        try:
+            # Per worktree, not in the shared state dir: dmypy checks paths
+            # relative to the tree it was started in
+            git_dir = Path(open_repo(Path(repo_root)).git_dir)
+            return MypyDaemon(Path(repo_root), git_dir / "octp" / "mypy")
+        except RuntimeError:
+            return None  # not a git repository: no state dir to keep it in
 
     def is_available(self) -> bool:
         return shutil.which("mypy") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        targets = command_paths(files) if files is not None else ["src/"]
+        args = ["--", *targets]
+        status = "ok"
+        version = None
+        output = None
+        daemon = self._daemon_for(repo_root)
         try:
-            result = subprocess.run(
-                ["mypy", "src/"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            passed = result.returncode == 0
-            detail = "No type errors" if passed else result.stdout[:200]
+            if daemon is not None:
+                returncode, stdout = daemon.check(targets, timeout=120)
+            elif self.in_process:
+                returncode, stdout, version = get_pool().call(
+                    run_mypy, repo_root, args, timeout=120
+                )
+            else:
+                result = subprocess.run(
+                    ["mypy", *args],
+                    cwd=repo_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                )
+                returncode, stdout = result.returncode, result.stdout
+            passed = returncode == 0
+            detail = "No type errors" if passed else stdout[:200]
+            output = stdout
+            if returncode == 2:
+                status = "error"  # mypy itself failed, not the code
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "MyPy timed out after 120 seconds"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
-        try:
-            v = subprocess.run(["mypy", "--version"], capture_output=True, text=True)
-            version = v.stdout.strip().split(" ")[1] if v.stdout else "unknown"
-        except Exception:
-            version = "unknown"
+        if version is None:
+            try:
+                v = subprocess.run(
+                    ["mypy", "--version"], capture_output=True, text=True
+                )
+                version = v.stdout.strip().split(" ")[1] if v.stdout else "unknown"
+            except Exception:
+                version = "unknown"
 
         return CheckResult(
             passed=passed,
             tool_name=f"mypy@{version}",
             suite_hash=None,
             detail=detail,
+            status=status,
+            output=output,
         )
@@ -1,56 +1,155 @@
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import os
 import shutil
 import subprocess
+import tempfile
 from pathlib import Path
+from typing import Any, Iterator
 
 from .base import CheckResult, CheckRunner
+from .inprocess import get_pool, run_pytest
+from .junit import (
+    COVERAGE_FILE,
+    JUNIT_FILE,
+    PYTEST_DIR,
+    parse_junit,
+    save_durations,
+)
 
 
 class PytestRunner(CheckRunner):
     name = "pytest"
+    # Tests may read any file under the test and source trees
+    change_patterns = (
+        "*.py",
+        "*.pyi",
+        "src/*",
+        "tests/*",
+        "test/*",
+        "pyproject.toml",
+        "setup.cfg",
+        "setup.py",
+        "pytest.ini",
+        "tox.ini",
+        "requirements*.txt",
+    )
+    in_process_tool = "pytest"
+
+    def __init__(self) -> None:
+        self.coverage = False  # also record coverage (needs pytest-cov)
+
+    def configure(self, options: dict[str, Any]) -> None:
+        super().configure(options)
+        self.coverage = bool(options.get("pytest_coverage", False))
 
     def is_available(self) -> bool:
         return shutil.which("pytest") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    @contextlib.contextmanager
+    def _report_dir(self, root: Path) -> Iterator[tuple[Path, bool]]:
+        """<git dir>/octp/pytest, or a throwaway directory outside git.
+
+        Yields (directory, persistent).
+        """
+        from octp.git.reader import state_dir
+
+        try:
+            directory = state_dir(root) / PYTEST_DIR
+            directory.mkdir(parents=True, exist_ok=True)
+        except (RuntimeError, OSError):
+            with tempfile.TemporaryDirectory(prefix="octp-pytest-") as tmp:
+                yield Path(tmp), False
+            return
+        yield directory, True
+
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
         root = Path(repo_root)
 
         # Hash the test suite for integrity
         suite_hash = self._hash_tests(root)
 
+        with self._report_dir(root) as (report_dir, persistent):
+            return self._run(repo_root, suite_hash, report_dir, persistent)
+
+    def _run(
+        self, repo_root: str, suite_hash: str | None, report_dir: Path, persistent: bool
+    ) -> CheckResult:
+        # One run yields pass/fail, per-test durations and, optionally,
+        # coverage: JUnit XML and the coverage data file land in report_dir
+        # A fresh name per run, so a concurrent `octp watch` run or a stale
+        # report is never read; kept as junit.xml once parsed
+        fd, name = tempfile.mkstemp(dir=report_dir, prefix="junit-", suffix=".xml")
+        os.close(fd)
+        junit = Path(name)
+        args = ["--tb=no", "-q", f"--junitxml={junit}"]
+        env = {}
+        if self.coverage:
+            args += ["--cov", "--cov-report="]
+            env["COVERAGE_FILE"] = str(report_dir / COVERAGE_FILE)
+
+        status = "ok"
+        version = None
+        output = None
         try:
-            result = subprocess.run(
-                ["pytest", "--tb=no", "-q"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            passed = result.returncode == 0
-            detail = (
-                result.stdout.strip().split("\n")[-1] if result.stdout else "No output"
-            )
+            if self.in_process:
+                # A fresh worker per run: test modules stay imported
+                returncode, stdout, version = get_pool().call(
+                    run_pytest, repo_root, args, env, timeout=120, fresh=True
+                )
+            else:
+                result = subprocess.run(
+                    ["pytest", *args],
+                    cwd=repo_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                    env={**os.environ, **env},
+                )
+                returncode, stdout = result.returncode, result.stdout
+            passed = returncode == 0
+            output = stdout
+            try:
+                report = parse_junit(junit)
+            except ValueError:
+                report = None
+            if report is not None and report.total:
+                detail = report.summary()
+                if persistent:
+                    save_durations(report_dir, report.durations)
+                    os.replace(junit, report_dir / JUNIT_FILE)
+            else:
+                detail = stdout.strip().split("\n")[-1] if stdout else "No output"
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "Test suite timed out after 120 seconds"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
+        finally:
+            junit.unlink(missing_ok=True)
 
         # Get pytest version
-        try:
-            v = subprocess.run(["pytest", "--version"], capture_output=True, text=True)
-            version = v.stdout.strip().split(" ")[1] if v.stdout else "unknown"
-        except Exception:
-            version = "unknown"
+        if version is None:
+            try:
+                v = subprocess.run(
+                    ["pytest", "--version"], capture_output=True, text=True
+                )
+                version = v.stdout.strip().split(" ")[1] if v.stdout else "unknown"
+            except Exception:
+                version = "unknown"
 
         return CheckResult(
             passed=passed,
             tool_name=f"pytest@{version}",
             suite_hash=suite_hash,
             detail=detail,
+            status=status,
+            output=output,
         )
 
     def _hash_tests(self, root: Path) -> str | None:
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from octp.metrics import METRICS
 
 from .bandit_runner import BanditRunner
-from .base import CheckResult, CheckRunner
+from .base import NOT_APPLICABLE, CheckResult, CheckRunner
+from .changes import changes_for
 from .deps_runner import DepsRunner
 from .detect_secrets_runner import DetectSecretsRunner
+from .fileset import FileSet
 from .mypy_runner import MypyRunner
 from .pytest_runner import PytestRunner
 from .ruff_runner import RuffRunner
 from .semgrep_runner import SemgrepRunner
 
+if TYPE_CHECKING:
+    from .artifacts import ArtifactStore
+    from .cache import ResultCache
+
 # Define runner profiles - choose smartest combinations
-RUNNER_PROFILES = {
+RUNNER_PROFILES: dict[str, list[type[CheckRunner]]] = {
     "full": [  # All checks - comprehensive but slower
         PytestRunner,
         RuffRunner,
@@ -60,6 +73,7 @@ def get_available_runners(
     repo_root: Path,
     profile: str = DEFAULT_PROFILE,
     runner_names: list[str] | None = None,
+    options: dict[str, Any] | None = None,
 ) -> list[CheckRunner]:
     """Return available runners matching the profile or specific names.
 
@@ -67,10 +81,11 @@ def get_available_runners(
         repo_root: Path to the repository
         profile: Runner profile name ('fast', 'full', 'ci', 'security')
         runner_names: Optional list of specific runner names to use instead of profile
+        options: The ``[runners]`` config section, passed to each runner
     """
     if runner_names:
         # Use specific runners
-        runner_classes = [
+        runner_classes: list[type[CheckRunner]] = [
             cls for cls in RUNNER_PROFILES["full"] if cls.name in runner_names
         ]
     else:
@@ -80,17 +95,88 @@ def get_available_runners(
     available = []
     for RunnerClass in runner_classes:
         runner = RunnerClass()
+        runner.configure(options or {})
         if runner.is_available():
             available.append(runner)
 
     return available
 
 
+def _cache_keys(repo_root: Path, runners: list[CheckRunner]) -> dict[str, str]:
+    """Result cache keys for the cacheable runners; {} outside a git repo."""
+    from octp.git.reader import working_tree_hash
+
+    from .cache import cache_key
+
+    try:
+        tree = working_tree_hash(repo_root)
+    except Exception:
+        return {}
+    return {r.name: cache_key(tree, r) for r in runners if r.cacheable}
+
+
+def _record(name: str, status: str, passed: bool, seconds: float | None) -> None:
+    if seconds is not None:
+        METRICS.observe("octp_runner_duration_seconds", seconds, runner=name)
+    METRICS.inc(
+        "octp_runner_results_total",
+        runner=name,
+        status=status,
+        passed=str(passed).lower(),
+    )
+
+
+def _run_and_store(
+    runner: CheckRunner,
+    repo_root: Path,
+    cache: ResultCache | None,
+    key: str | None,
+    files: list[str] | None = None,
+    artifacts: ArtifactStore | None = None,
+) -> CheckResult:
+    start = time.perf_counter()
+    try:
+        if files is None:
+            result = runner.run(str(repo_root))
+        elif runner.shardable and runner.shards > 1:
+            from octp.git.reader import state_dir
+
+            from .sharding import SHARDS_DIR, run_sharded
+
+            try:
+                costs_dir: Path | None = state_dir(repo_root) / SHARDS_DIR
+            except RuntimeError:
+                costs_dir = None
+            result = run_sharded(runner, repo_root, files, runner.shards, costs_dir)
+        else:
+            result = runner.run(str(repo_root), files)
+    except Exception:
+        _record(runner.name, "crashed", False, time.perf_counter() - start)
+        raise
+    _record(runner.name, result.status, result.passed, time.perf_counter() - start)
+    if artifacts is not None and result.output:
+        try:
+            result.report_digest = artifacts.put(result.output)
+            result.output = None
+        except OSError:
+            pass  # keep the report in memory; it just is not persisted
+    # Timeouts and runner errors say nothing about the tree; never reuse them
+    if cache is not None and key is not None and result.status == "ok":
+        cache.put(key, result)
+    return result
+
+
 def run_all(
     repo_root: Path,
     profile: str = DEFAULT_PROFILE,
     runner_names: list[str] | None = None,
     max_workers: int = 4,
+    cache: ResultCache | None = None,
+    on_result: Callable[[str, CheckResult], None] | None = None,
+    in_process: bool = False,
+    options: dict[str, Any] | None = None,
+    artifacts: ArtifactStore | None = None,
+    executor: concurrent.futures.Executor | None = None,
 ) -> dict[str, CheckResult]:
     """Run all available checks and return results keyed by runner name.
 
@@ -99,20 +185,105 @@ def run_all(
         profile: Runner profile name
         runner_names: Optional specific runner names to use
         max_workers: Maximum parallel workers
+        cache: Reuse results recorded for the same working tree and tool
+            versions, and record new ones
+        on_result: Called with each result as soon as it is known
+        in_process: Drive Python-based tools through their APIs in
+            persistent worker processes where they are importable
+        options: The ``[runners]`` config section, passed to each runner;
+            it also sets which changes make a runner applicable (see
+            changes.py)
+        artifacts: Store each full tool report here and record its digest
+            in ``report_digest``
+        executor: Submit runners to this pool (shared with other run_all
+            calls, e.g. across a workspace) instead of a private one of
+            ``max_workers`` threads; it is left running
 
     Returns:
         Dictionary mapping runner names to their results
     """
-    import concurrent.futures
-
-    runners = get_available_runners(repo_root, profile, runner_names)
+    start = time.perf_counter()
+    runners = get_available_runners(repo_root, profile, runner_names, options)
     results = {}
+    if in_process:
+        from .inprocess import is_importable
+
+        for runner in runners:
+            if runner.in_process_tool and is_importable(runner.in_process_tool):
+                runner.in_process = True
+
+    pool = (
+        contextlib.nullcontext(executor)
+        if executor is not None
+        else concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    )
+    with pool as executor:
+        # Look everything up before starting any runner
+        keys = _cache_keys(repo_root, runners) if cache is not None else {}
+        if cache is not None:
+            for name, hit in zip(keys, executor.map(cache.get, keys.values())):
+                METRICS.inc(
+                    "octp_cache_lookups_total",
+                    runner=name,
+                    result="miss" if hit is None else "hit",
+                )
+                if hit is not None:
+                    results[name] = hit
+                    if on_result is not None:
+                        on_result(name, hit)
+
+        # Runners that no changed file concerns are recorded, not run
+        pending = [r for r in runners if r.name not in results]
+        changed = changes_for(repo_root, options or {}) if pending else None
+        if changed is not None:
+            for runner in pending:
+                if not runner.applies_to(changed):
+                    results[runner.name] = CheckResult(
+                        passed=True,
+                        tool_name=runner.name,
+                        suite_hash=None,
+                        detail="Not applicable: no relevant files changed",
+                        status=NOT_APPLICABLE,
+                    )
+                    _record(runner.name, NOT_APPLICABLE, True, None)
+                    if on_result is not None:
+                        on_result(runner.name, results[runner.name])
+            pending = [r for r in pending if r.name not in results]
+
+        # Enumerate the tree once for every runner that takes a path list
+        fileset = None
+        if any(r.file_patterns is not None for r in pending):
+            try:
+                fileset = FileSet.discover(repo_root)
+            except RuntimeError:
+                pass  # not a git work tree; runners walk it themselves
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all runners
-        future_to_runner = {
-            executor.submit(runner.run, str(repo_root)): runner for runner in runners
-        }
+        future_to_runner = {}
+        for runner in pending:
+            files = None
+            if fileset is not None and runner.file_patterns is not None:
+                files = fileset.select(runner.file_patterns)
+                if not files:
+                    results[runner.name] = CheckResult(
+                        passed=True,
+                        tool_name=runner.name,
+                        suite_hash=None,
+                        detail="No matching files to check",
+                    )
+                    if on_result is not None:
+                        on_result(runner.name, results[runner.name])
+                    continue
+            future = executor.submit(
+                _run_and_store,
+                runner,
+                repo_root,
+                cache,
+                keys.get(runner.name),
+                files,
+                artifacts,
+            )
+            future_to_runner[future] = runner
 
         # Collect results as they complete
         for future in concurrent.futures.as_completed(future_to_runner):
@@ -125,6 +296,56 @@ def run_all(
                     tool_name=runner.name,
                     suite_hash=None,
                     detail=f"Runner crashed: {e}",
+                    status="crashed",
                 )
+            if on_result is not None:
+                on_result(runner.name, results[runner.name])
 
+    METRICS.observe("octp_checks_duration_seconds", time.perf_counter() - start)
     return results
+
+
+def start_all(
+    repo_root: Path, **kwargs: Any
+) -> concurrent.futures.Future[dict[str, CheckResult]]:
+    """Start run_all on a background thread and return its future.
+
+    The thread is a daemon so an interrupted ``octp sign`` exits at once
+    instead of waiting for the checks it no longer needs.
+    """
+    future: concurrent.futures.Future[dict[str, CheckResult]] = (
+        concurrent.futures.Future()
+    )
+
+    def target() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(run_all(repo_root, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name="octp-checks", daemon=True).start()
+    return future
+
+
+class CheckProgress:
+    """Tally of finished checks, fed by run_all's on_result from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._done: dict[str, bool] = {}
+
+    def __call__(self, name: str, result: CheckResult) -> None:
+        with self._lock:
+            self._done[name] = result.passed
+
+    def status_line(self) -> str:
+        with self._lock:
+            done = dict(self._done)
+        if not done:
+            return "checks running…"
+        marks = " ".join(
+            f"{name} {'✓' if passed else '✗'}" for name, passed in sorted(done.items())
+        )
+        return f"checks done: {marks}"
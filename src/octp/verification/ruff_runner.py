@@ -4,18 +4,24 @@ import shutil
 import subprocess
 
 from .base import CheckResult, CheckRunner
+from .fileset import command_paths
 
 
 class RuffRunner(CheckRunner):
     name = "ruff"
+    file_patterns = ("*.py", "*.pyi")
+    change_patterns = (*file_patterns, "pyproject.toml", "ruff.toml", ".ruff.toml")
 
     def is_available(self) -> bool:
         return shutil.which("ruff") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        targets = command_paths(files) if files is not None else ["."]
+        status = "ok"
+        output = None
         try:
             result = subprocess.run(
-                ["ruff", "check", "."],
+                ["ruff", "check", "--force-exclude", "--", *targets],
                 cwd=repo_root,
                 capture_output=True,
                 text=True,
@@ -23,11 +29,14 @@ class RuffRunner(CheckRunner):
             )
             passed = result.returncode == 0
             detail = "No issues found" if passed else result.stdout[:200]
+            output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "Ruff timed out after 60 seconds"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
         try:
@@ -41,4 +50,6 @@ class RuffRunner(CheckRunner):
             tool_name=f"ruff@{version}",
             suite_hash=None,
             detail=detail,
+            status=status,
+            output=output,
         )
@@ -4,15 +4,20 @@ import shutil
 import subprocess
 
 from .base import CheckResult, CheckRunner
+from .deps_runner import DEPENDENCY_FILES
 
 
 class SafetyRunner(CheckRunner):
     name = "safety"
+    cacheable = False  # advisory database changes independently of the tree
+    change_patterns = DEPENDENCY_FILES
 
     def is_available(self) -> bool:
         return shutil.which("safety") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        status = "ok"
+        output = None
         try:
             result = subprocess.run(
                 ["safety", "check", "--json"],
@@ -24,11 +29,14 @@ class SafetyRunner(CheckRunner):
             # Safety returns 0 if no vulnerabilities, 64 if vulnerabilities found
             passed = result.returncode == 0
             detail = "No known vulnerabilities" if passed else "Vulnerabilities found"
+            output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "Safety timed out after 60 seconds"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
         return CheckResult(
@@ -36,4 +44,6 @@ class SafetyRunner(CheckRunner):
             tool_name="safety",
             suite_hash=None,
             detail=detail,
+            status=status,
+            output=output,
         )
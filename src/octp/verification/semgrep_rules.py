@@ -0,0 +1,123 @@
+"""Pinned, content-addressed semgrep rule packs.
+
+A pack is a directory of rule YAML files stored under
+``~/.octp/semgrep/packs/<sha256>``, where the hash covers every file
+name and its content. Repositories pin one with
+``[runners] semgrep_rules = "<sha256>"``; the runner then passes the pack
+directory to ``semgrep --config`` and never touches the network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+RULES_DIR = Path.home() / ".octp" / "semgrep"
+REGISTRY_URL = "https://semgrep.dev/c"
+RULE_SUFFIXES = (".yml", ".yaml")
+
+
+def pack_hash(files: dict[str, bytes]) -> str:
+    """SHA-256 over the sorted (name, content) pairs of a pack."""
+    h = hashlib.sha256()
+    for name in sorted(files):
+        data = files[name]
+        h.update(f"{name}\0{len(data)}\0".encode())
+        h.update(data)
+    return h.hexdigest()
+
+
+def _read_pack(directory: Path) -> dict[str, bytes]:
+    return {
+        p.relative_to(directory).as_posix(): p.read_bytes()
+        for p in directory.rglob("*")
+        if p.is_file() and p.suffix in RULE_SUFFIXES
+    }
+
+
+def store_pack(files: dict[str, bytes], rules_dir: Path = RULES_DIR) -> str:
+    """Store rule files content-addressed and return the pack hash.
+
+    Storing the same rules again is a no-op.
+    """
+    if not files:
+        raise ValueError("A rule pack needs at least one .yml/.yaml file")
+    digest = pack_hash(files)
+    packs = rules_dir / "packs"
+    target = packs / digest
+    if target.is_dir():
+        return digest
+    packs.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=packs, prefix=".incoming-"))
+    try:
+        for name, data in files.items():
+            path = staging / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            if not target.is_dir():  # lost a race to an identical pack is fine
+                raise
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging)
+    return digest
+
+
+def import_rules(source: Path, rules_dir: Path = RULES_DIR) -> str:
+    """Store a local rule file or directory (e.g. one copied into CI)."""
+    if source.is_dir():
+        files = _read_pack(source)
+    elif source.is_file():
+        files = {source.name: source.read_bytes()}
+    else:
+        raise ValueError(f"No such rule file or directory: {source}")
+    return store_pack(files, rules_dir)
+
+
+def fetch_rules(
+    configs: list[str],
+    rules_dir: Path = RULES_DIR,
+    registry_url: str = REGISTRY_URL,
+    timeout: float = 30.0,
+) -> str:
+    """Download registry configs (e.g. ``p/python``) once into one pack."""
+    files = {}
+    for config in configs:
+        url = f"{registry_url.rstrip('/')}/{config}"
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                files[config.replace("/", "_") + ".yaml"] = response.read()
+        except OSError as e:
+            raise RuntimeError(f"Could not fetch semgrep rules {config}: {e}")
+    return store_pack(files, rules_dir)
+
+
+def pack_path(digest: str, rules_dir: Path = RULES_DIR) -> Path:
+    """Directory of a stored pack, re-hashed to make sure it is intact."""
+    directory = rules_dir / "packs" / digest
+    if not directory.is_dir():
+        raise RuntimeError(
+            f"Semgrep rule pack {digest[:12]} is not cached; "
+            "run `octp rules fetch` or `octp rules import` first"
+        )
+    if pack_hash(_read_pack(directory)) != digest:
+        raise RuntimeError(f"Semgrep rule pack {digest[:12]} has been modified")
+    return directory
+
+
+def list_packs(rules_dir: Path = RULES_DIR) -> list[tuple[str, int]]:
+    """(hash, rule file count) for every stored pack."""
+    packs = rules_dir / "packs"
+    if not packs.is_dir():
+        return []
+    return [
+        (p.name, len(_read_pack(p)))
+        for p in sorted(packs.iterdir())
+        if p.is_dir() and not p.name.startswith(".")
+    ]
@@ -1,35 +1,75 @@
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+from typing import Any
 
-from .base import CheckResult, CheckRunner
+from .base import CheckResult, CheckRunner, tool_version
+from .fileset import command_paths
+from .semgrep_rules import pack_path
+
+# Languages and formats semgrep has rules for; prose and images are left out
+_SOURCE_EXTENSIONS = (
+    "py pyi js jsx mjs ts tsx go java kt scala rb php c h cpp cs rs swift sh tf "
+    "html json yml yaml toml xml"
+)
+SOURCE_PATTERNS = (*(f"*.{ext}" for ext in _SOURCE_EXTENSIONS.split()), "*Dockerfile*")
 
 
 class SemgrepRunner(CheckRunner):
     name = "semgrep"
+    file_patterns = ("*",)
+    change_patterns = SOURCE_PATTERNS
+    cacheable = False  # --config=auto rules change under us; see configure()
+
+    def __init__(self) -> None:
+        self.rules: str | None = None  # pinned rule pack hash
+
+    def configure(self, options: dict[str, Any]) -> None:
+        super().configure(options)
+        rules = options.get("semgrep_rules")
+        if rules:
+            self.rules = str(rules).removeprefix("sha256:")
+            self.cacheable = True  # the pack hash pins exactly which rules run
+
+    def cache_inputs(self) -> list[str]:
+        return [tool_version(self.name), f"rules:{self.rules}"]
 
     def is_available(self) -> bool:
         return shutil.which("semgrep") is not None
 
-    def run(self, repo_root: str) -> CheckResult:
+    def run(self, repo_root: str, files: list[str] | None = None) -> CheckResult:
+        targets = command_paths(files) if files is not None else ["."]
+        status = "ok"
+        output = None
         try:
+            if self.rules:
+                # Offline: the pinned pack, no metrics or version check
+                config = ["--config", str(pack_path(self.rules)), "--metrics=off"]
+                env = {**os.environ, "SEMGREP_ENABLE_VERSION_CHECK": "0"}
+            else:
+                config, env = ["--config=auto"], None
             result = subprocess.run(
-                ["semgrep", "--config=auto", "--quiet", "--error", "."],
+                ["semgrep", *config, "--quiet", "--error", "--", *targets],
                 cwd=repo_root,
                 capture_output=True,
                 text=True,
                 timeout=120,
+                env=env,
             )
             passed = result.returncode == 0
             detail = (
                 "No issues found" if passed else f"Issues found: {result.stderr[:200]}"
             )
+            output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
             passed = False
+            status = "timeout"
             detail = "Semgrep timed out after 120 seconds"
         except Exception as e:
             passed = False
+            status = "error"
             detail = f"Runner error: {e}"
 
         try:
@@ -38,9 +78,16 @@ class SemgrepRunner(CheckRunner):
         except Exception:
             version = "unknown"
 
+        # The pack hash travels with the result into cache keys and envelopes
+        tool_name = f"semgrep@{version}"
+        if self.rules:
+            tool_name += f"+rules.{self.rules[:16]}"
+
         return CheckResult(
             passed=passed,
-            tool_name=f"semgrep@{version}",
-            suite_hash=None,
+            tool_name=tool_name,
+            suite_hash=self.rules,
             detail=detail,
+            status=status,
+            output=output,
         )
@@ -0,0 +1,145 @@
+"""Split single-threaded scanners across cores.
+
+A runner opts in with ``shardable = True``: its file list is cut into
+balanced shards, ``runner.run`` is called once per shard in parallel, and
+``runner.merge`` folds the shard results into one CheckResult. Shards
+are balanced by each file's measured cost from earlier runs (kept per
+runner under ``<git dir>/octp/shards``), falling back to file size for
+files not seen before.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import heapq
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .base import CheckResult
+
+if TYPE_CHECKING:
+    from .base import CheckRunner
+
+SHARDS_DIR = "shards"
+# Below this many files per shard, process start-up outweighs the gain
+MIN_FILES_PER_SHARD = 25
+
+_STATUS_RANK = {"ok": 0, "error": 1, "timeout": 2, "crashed": 3}
+
+
+class ShardCosts:
+    """Seconds each file took to scan, as last measured, for one runner."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.costs: dict[str, float] = {}
+        if path is not None:
+            try:
+                data = json.loads(path.read_bytes())
+                if isinstance(data, dict):
+                    self.costs = {
+                        k: float(v)
+                        for k, v in data.items()
+                        if isinstance(v, (int, float))
+                    }
+            except (OSError, ValueError):
+                pass
+
+    def weights(self, root: Path, files: list[str]) -> dict[str, float]:
+        """Estimated cost per file; unseen files are priced by size at
+        the median seconds-per-byte of the files that have been seen."""
+        sizes = {}
+        for f in files:
+            try:
+                sizes[f] = max(os.path.getsize(root / f), 1)
+            except OSError:
+                sizes[f] = 1
+        rates = [self.costs[f] / sizes[f] for f in files if self.costs.get(f, 0) > 0]
+        rate = statistics.median(rates) if rates else 1.0
+        return {f: self.costs.get(f) or sizes[f] * rate for f in files}
+
+    def record(
+        self, weights: dict[str, float], shard: list[str], elapsed: float
+    ) -> None:
+        """Spread a shard's wall time over its files by estimated weight."""
+        total = sum(weights[f] for f in shard) or 1.0
+        for f in shard:
+            self.costs[f] = elapsed * weights[f] / total
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.costs, f)
+        os.replace(tmp, self.path)
+
+
+def split(weights: dict[str, float], count: int) -> list[list[str]]:
+    """Greedy balanced partition: heaviest file first onto the lightest
+    shard. Empty shards are dropped; each shard's files stay sorted."""
+    heap: list[tuple[float, int]] = [(0.0, i) for i in range(max(count, 1))]
+    shards: list[list[str]] = [[] for _ in heap]
+    for f in sorted(weights, key=lambda f: (-weights[f], f)):
+        load, i = heapq.heappop(heap)
+        shards[i].append(f)
+        heapq.heappush(heap, (load + weights[f], i))
+    return [sorted(s) for s in shards if s]
+
+
+def shard_count(files: list[str], shards: int) -> int:
+    return max(1, min(shards, len(files) // MIN_FILES_PER_SHARD))
+
+
+def merge_results(results: list[CheckResult]) -> CheckResult:
+    """Default merge: fails if any shard failed, keeps the worst status
+    and the first failing detail, and concatenates the reports."""
+    worst = max(results, key=lambda r: _STATUS_RANK.get(r.status, 3))
+    failed = [r for r in results if not r.passed]
+    outputs = [r.output for r in results if r.output]
+    return CheckResult(
+        passed=not failed,
+        tool_name=results[0].tool_name,
+        suite_hash=results[0].suite_hash,
+        detail=(worst if worst.status != "ok" else (failed or results)[0]).detail,
+        status=worst.status,
+        output="".join(outputs) if outputs else None,
+    )
+
+
+def run_sharded(
+    runner: CheckRunner,
+    repo_root: Path,
+    files: list[str],
+    shards: int,
+    costs_dir: Path | None = None,
+) -> CheckResult:
+    """Run ``runner`` over ``files`` in up to ``shards`` parallel shards."""
+    count = shard_count(files, shards)
+    if count == 1:
+        return runner.run(str(repo_root), files)
+
+    costs = ShardCosts(costs_dir / f"{runner.name}.json" if costs_dir else None)
+    weights = costs.weights(repo_root, files)
+    parts = split(weights, count)
+
+    def run_one(shard: list[str]) -> CheckResult:
+        start = time.perf_counter()
+        result = runner.run(str(repo_root), shard)
+        if result.status == "ok":
+            costs.record(weights, shard, time.perf_counter() - start)
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(parts)) as pool:
+        results = list(pool.map(run_one, parts))
+    try:
+        costs.save()
+    except OSError:
+        pass  # only a balancing hint
+    return runner.merge(results)
@@ -0,0 +1,287 @@
+"""Watch the working tree and keep the result cache warm.
+
+Linux uses inotify through ctypes; everywhere else (or when inotify is
+unavailable or out of watches) the tree is polled. Paths are reported
+relative to the repository root; "*" means "anything may have changed".
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Protocol
+
+from octp.git.reader import working_tree_hash
+
+from .artifacts import ArtifactStore
+from .base import CheckResult
+from .cache import ResultCache
+from .registry import DEFAULT_PROFILE, run_all
+
+EVERYTHING = "*"
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+_EVENT = struct.Struct("iIII")
+
+
+class Watcher(Protocol):
+    def wait(self, timeout: float | None) -> set[str]:
+        """Block until something changes; empty set on timeout."""
+        ...
+
+    def close(self) -> None: ...
+
+
+def _git_paths(root: Path, *args: str) -> list[str]:
+    out = subprocess.run(
+        ["git", "ls-files", "-z", *args],
+        cwd=root,
+        capture_output=True,
+        check=True,
+    ).stdout
+    return [p for p in out.decode(errors="surrogateescape").split("\0") if p]
+
+
+def _ignored_dirs(root: Path) -> set[str]:
+    entries = _git_paths(
+        root, "--others", "--ignored", "--exclude-standard", "--directory"
+    )
+    return {e.rstrip("/") for e in entries if e.endswith("/")}
+
+
+class PollingWatcher:
+    """Compare (mtime, size) of every non-ignored file every ``interval``."""
+
+    def __init__(self, root: Path, interval: float = 1.0) -> None:
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        for rel in _git_paths(self.root, "--cached", "--others", "--exclude-standard"):
+            try:
+                st = os.stat(self.root / rel)
+            except OSError:
+                continue  # deleted but still in the index
+            snapshot[rel] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: float | None) -> set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                p
+                for p in current.keys() | self._snapshot.keys()
+                if current.get(p) != self._snapshot.get(p)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            pause = self.interval
+            if deadline is not None:
+                pause = min(pause, max(deadline - time.monotonic(), 0))
+            time.sleep(pause)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watch of every non-ignored directory.
+
+    Raises OSError when inotify is unavailable or the watch limit is hit,
+    so callers can fall back to polling.
+    """
+
+    def __init__(self, root: Path) -> None:
+        name = ctypes.util.find_library("c")
+        if name is None:
+            raise OSError(errno.ENOSYS, "libc not found")
+        libc = ctypes.CDLL(name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc = libc
+        self.root = root
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+        try:
+            self._ignored = _ignored_dirs(root)
+            self._add_tree("")
+        except Exception:
+            self.close()
+            raise
+
+    def _add(self, rel: str) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(self.root / rel), WATCH_MASK
+        )
+        if wd < 0:
+            code = ctypes.get_errno()
+            if code == errno.ENOENT:
+                return  # removed before we got to it
+            raise OSError(code, f"inotify_add_watch failed for {rel or '.'}")
+        self._dirs[wd] = rel
+
+    def _add_tree(self, top: str) -> None:
+        for dirpath, dirnames, _ in os.walk(self.root / top):
+            rel = os.path.relpath(dirpath, self.root)
+            rel = "" if rel == "." else rel
+            self._add(rel)
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if d != ".git" and os.path.join(rel, d) not in self._ignored
+            ]
+
+    def wait(self, timeout: float | None) -> set[str]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            changed |= self._parse(data)
+
+    def _parse(self, data: bytes) -> set[str]:
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = (
+                data[offset : offset + length]
+                .rstrip(b"\0")
+                .decode(errors="surrogateescape")
+            )
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed.add(EVERYTHING)
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None:
+                continue
+            rel = os.path.join(parent, name) if name else parent
+            if mask & IN_ISDIR:
+                if rel in self._ignored:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(rel)
+            changed.add(rel)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(root: Path, poll: bool = False, interval: float = 1.0) -> Watcher:
+    """inotify where possible, polling otherwise."""
+    if not poll:
+        try:
+            return InotifyWatcher(root)
+        except OSError:
+            pass
+    return PollingWatcher(root, interval)
+
+
+def wait_for_changes(
+    watcher: Watcher,
+    quiet: float,
+    stop: threading.Event | None = None,
+) -> set[str]:
+    """Wait for a change, then keep collecting until ``quiet`` seconds pass
+    without one. Returns early with what it has if ``stop`` is set."""
+    changed: set[str] = set()
+    while not changed:
+        if stop is not None and stop.is_set():
+            return changed
+        changed = watcher.wait(0.5)
+    while True:
+        more = watcher.wait(quiet)
+        if not more:
+            return changed
+        changed |= more
+
+
+def watch(
+    repo_root: Path,
+    cache: ResultCache,
+    profile: str = DEFAULT_PROFILE,
+    debounce: float = 1.0,
+    watcher: Watcher | None = None,
+    on_run: Callable[[str, dict[str, CheckResult]], None] | None = None,
+    stop: threading.Event | None = None,
+    in_process: bool = False,
+    options: dict[str, Any] | None = None,
+    artifacts: ArtifactStore | None = None,
+) -> None:
+    """Re-run checks whenever the working tree settles on new content.
+
+    Runs are skipped when the tree hash is unchanged (e.g. only ignored
+    files were touched); runners already cached for the tree are not
+    started at all.
+    """
+    watcher = watcher or open_watcher(repo_root)
+    last_tree = None
+    try:
+        while stop is None or not stop.is_set():
+            tree = working_tree_hash(repo_root)
+            if tree != last_tree:
+                results = run_all(
+                    repo_root,
+                    profile=profile,
+                    cache=cache,
+                    in_process=in_process,
+                    options=options,
+                    artifacts=artifacts,
+                )
+                last_tree = tree
+                if on_run is not None:
+                    on_run(tree, results)
+            wait_for_changes(watcher, debounce, stop)
+    finally:
+        watcher.close()
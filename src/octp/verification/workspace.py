@@ -0,0 +1,84 @@
+"""Run checks for many repositories under one global worker bound.
+
+``octp sign --workspace`` signs every git repository below a directory.
+Each repository gets its own run_all, but all of them submit their
+runners to one shared pool of ``jobs`` threads, so the machine is kept
+busy without starting every repository's checks at once.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from .base import CheckResult
+from .registry import run_all
+
+# Never descended into while looking for repositories
+SKIP_DIRS = {"node_modules", "__pycache__", "venv"}
+
+
+def discover_repos(root: Path) -> list[Path]:
+    """Git work trees at or below ``root``, sorted.
+
+    A repository's own subdirectories are not searched, so submodules and
+    vendored checkouts are signed with their parent. Hidden directories
+    are skipped.
+    """
+    repos = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if ".git" in dirnames or ".git" in filenames:  # a file for worktrees
+            repos.append(Path(dirpath))
+            dirnames[:] = []
+            continue
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS
+        )
+    return sorted(repos)
+
+
+def run_workspace(
+    repos: list[Path],
+    jobs: int,
+    run_kwargs: Callable[[Path], dict[str, Any]] | None = None,
+    on_repo: Callable[[Path, dict[str, CheckResult] | Exception], None] | None = None,
+) -> dict[Path, dict[str, CheckResult] | Exception]:
+    """Run every repository's checks, at most ``jobs`` runners at a time.
+
+    Args:
+        repos: Repository roots
+        jobs: Runners executing at once, across all repositories
+        run_kwargs: Extra run_all arguments per repository (cache,
+            options, artifacts, ...)
+        on_repo: Called from a worker thread as each repository finishes,
+            with its results or the exception that stopped it
+    """
+    results: dict[Path, dict[str, CheckResult] | Exception] = {}
+    workers = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(jobs, 1), thread_name_prefix="octp-job"
+    )
+
+    def check(repo: Path) -> dict[str, CheckResult] | Exception:
+        kwargs = run_kwargs(repo) if run_kwargs is not None else {}
+        try:
+            outcome: dict[str, CheckResult] | Exception = run_all(
+                repo, executor=workers, **kwargs
+            )
+        except Exception as e:
+            outcome = e
+        if on_repo is not None:
+            on_repo(repo, outcome)
+        return outcome
+
+    # Coordinators only enumerate, look up the cache and wait; a few per
+    # job keep the shared pool fed without starting every repo at once
+    coordinators = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(min(len(repos), 2 * jobs), 1),
+        thread_name_prefix="octp-repo",
+    )
+    with workers, coordinators:
+        for repo, outcome in zip(repos, coordinators.map(check, repos)):
+            results[repo] = outcome
+    return results
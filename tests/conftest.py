@@ -1,8 +1,11 @@
 import json
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
+from octp.verification.base import CheckResult, CheckRunner
+
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
@@ -14,3 +17,114 @@ def valid_envelope_data():
 @pytest.fixture
 def minimal_envelope_data():
     return json.loads((FIXTURES_DIR / "minimal_envelope.json").read_text())
+
+
+@pytest.fixture
+def signing_key():
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+@pytest.fixture
+def public_key_pem(signing_key):
+    from cryptography.hazmat.primitives import serialization
+
+    return (
+        signing_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+@pytest.fixture
+def sign_envelope(signing_key):
+    """Return a function that re-hashes and signs envelope data."""
+    import base64
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    from octp.core.envelope import OCTPEnvelope
+    from octp.integrity.hasher import hash_payload
+
+    def sign(data):
+        envelope = OCTPEnvelope.model_validate(data)
+        payload_hash = hash_payload(envelope.to_signable_dict())
+        signature = signing_key.sign(
+            payload_hash.encode(), ec.ECDSA(hashes.SHA256())
+        )
+        envelope.integrity.payload_hash = payload_hash
+        envelope.integrity.developer_signature = base64.b64encode(signature).decode()
+        return envelope.model_dump(mode="json")
+
+    return sign
+
+
+@pytest.fixture
+def signed_envelope_data(valid_envelope_data, sign_envelope):
+    """The valid fixture re-hashed and signed with a throwaway key."""
+    return sign_envelope(valid_envelope_data)
+
+
+class FakeRunner(CheckRunner):
+    """A runner that records its calls instead of running a tool.
+
+    It reports ``result``: a CheckResult, a function of ``(repo_root,
+    files)`` returning one, or by default a pass. Other keyword
+    arguments set runner attributes (``file_patterns``, ``cacheable``...).
+    """
+
+    name = "fake"
+
+    def __init__(self, name="fake", result=None, crash=False, **attributes):
+        self.name = name
+        self.result = result
+        self.crash = crash
+        self.calls = []  # the files argument of each run
+        for key, value in attributes.items():
+            setattr(self, key, value)
+
+    def is_available(self):
+        return True
+
+    def run(self, repo_root, files=None):
+        self.calls.append(files)
+        if self.crash:
+            raise RuntimeError("boom")
+        if callable(self.result):
+            return self.result(repo_root, files)
+        if self.result is not None:
+            return replace(self.result)  # run_all may modify what it gets
+        return CheckResult(True, f"{self.name}@1.0", None, "ok")
+
+    def cache_inputs(self):
+        return ["1.0"]
+
+
+class FakeRunners:
+    """Builds FakeRunners and has run_all use them instead of real tools."""
+
+    def __init__(self, monkeypatch):
+        self.monkeypatch = monkeypatch
+
+    def __call__(self, name="fake", result=None, **kwargs):
+        return FakeRunner(name, result, **kwargs)
+
+    def use(self, runners):
+        """Runners for every run_all: a list, or a function of the repo root."""
+        self.monkeypatch.setattr(
+            "octp.verification.registry.get_available_runners",
+            lambda repo_root, *args, **kwargs: (
+                runners(repo_root) if callable(runners) else list(runners)
+            ),
+        )
+
+
+@pytest.fixture
+def fake_runners(monkeypatch):
+    """``fake_runners(name, ...)`` makes a FakeRunner; ``.use()`` installs them."""
+    return FakeRunners(monkeypatch)
@@ -0,0 +1,88 @@
+"""Tests for columnar provenance analytics."""
+
+import json
+
+import pytest
+
+from octp.analytics import columns as columns_module
+from octp.analytics import queries
+from octp.analytics.columns import EnvelopeColumns
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns_module, "np", None)
+        monkeypatch.setattr(queries, "np", None)
+    return request.param
+
+
+@pytest.fixture
+def columns(valid_envelope_data, backend):
+    docs = []
+    rows = [
+        # repository, developer, method, review, tests, timestamp
+        ("r/a", "dev1", "ai_generated_unreviewed", "none", True, "2026-01-05"),
+        ("r/a", "dev1", "human_only", "glance", False, "2026-01-06"),
+        ("r/a", "dev2", "ai_generated_unreviewed", "none", None, "2026-01-14"),
+        ("r/b", "dev2", "human_only", "moderate_review", True, "2026-01-07"),
+    ]
+    for repo, dev, method, review, tests, day in rows:
+        doc = json.loads(json.dumps(valid_envelope_data))
+        doc["repository"] = repo
+        doc["timestamp"] = f"{day}T12:00:00Z"
+        doc["provenance"].update(
+            developer_id=dev, method=method, human_review_level=review
+        )
+        doc["verification"]["tests_passed"] = tests
+        docs.append(json.dumps(doc).encode())
+    docs.append(b'{"not": "an envelope"}')
+    cols = EnvelopeColumns()
+    cols.extend(docs)
+    return cols
+
+
+def test_loader_skips_non_envelopes(columns):
+    assert len(columns) == 4
+    assert columns.skipped == 1
+
+
+def test_method_share_by_repo_and_week(columns):
+    rows = queries.method_share(columns, "ai_generated_unreviewed")
+    assert rows == [
+        (("r/a", "2026-01-05"), 1, 2, 0.5),
+        (("r/a", "2026-01-12"), 1, 1, 1.0),
+        (("r/b", "2026-01-05"), 0, 1, 0.0),
+    ]
+
+
+def test_review_levels_by_developer(columns):
+    assert queries.review_levels(columns) == {
+        "dev1": {"none": 1, "glance": 1},
+        "dev2": {"none": 1, "moderate_review": 1},
+    }
+
+
+def test_pass_rate_ignores_runs_without_tests(columns):
+    assert queries.pass_rate(columns) == [("r/a", 1, 2, 0.5), ("r/b", 1, 1, 1.0)]
+
+
+def test_unknown_grouping_is_rejected(columns):
+    with pytest.raises(ValueError, match="Unknown grouping"):
+        queries.pass_rate(columns, by="colour")
+
+
+def test_group_counts_with_sparse_keys(backend):
+    # Key ranges whose product would not fit in memory as a dense table
+    keys = [[0, 2**40, 0, 2**40], [-(2**40), 7, -(2**40), 8]]
+    assert queries.group_counts(keys) == {
+        (0, -(2**40)): 2,
+        (2**40, 7): 1,
+        (2**40, 8): 1,
+    }
+    assert queries.group_counts(keys, mask=[True, False, False, True]) == {
+        (0, -(2**40)): 1,
+        (2**40, 8): 1,
+    }
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import subprocess
+from unittest.mock import patch
+
+import git
+import pytest
+
+from octp import api
+from octp.core.envelope import OCTPEnvelope
+from octp.core.policy import Policy
+from octp.identity.keyring import KeyRing
+from octp.verification.base import CheckResult
+
+
+@pytest.fixture
+def passing(fake_runners):
+    runner = fake_runners(
+        "tests", CheckResult(True, "pytest@8", None, "3 passed"), cacheable=False
+    )
+    fake_runners.use([runner])
+    return runner
+
+
+@pytest.fixture
+def keyring(public_key_pem):
+    keyring = KeyRing()
+    keyring.add("github:sara-dev-92", public_key_pem)
+    return keyring
+
+
+@pytest.fixture
+def repo(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "Dev")
+    (tmp_path / "app.py").write_text("print('hi')\n")
+    git("add", "app.py")
+    git("commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def test_verify_many_keeps_order_and_reports_each(
+    tmp_path, keyring, signed_envelope_data
+):
+    good = json.dumps(signed_envelope_data).encode()
+    tampered = json.loads(good)
+    tampered["verification"]["tests_passed"] = False
+    path = tmp_path / "envelope.json"
+    path.write_bytes(good)
+
+    results = asyncio.run(
+        api.verify_many(
+            [
+                good,
+                json.dumps(tampered).encode(),
+                b"{not json",
+                path,
+                tmp_path / "missing.json",
+                OCTPEnvelope.model_validate(signed_envelope_data),
+            ],
+            keyring=keyring,
+        )
+    )
+
+    assert [r.valid for r in results] == [True, False, False, True, False, True]
+    assert results[0].signature_verified is True
+    assert "mismatch" in results[1].reason
+    assert results[2].errors and results[2].envelope is None
+    assert results[4].reason.startswith("Could not read envelope")
+
+
+def test_verify_reports_policy_violations(valid_envelope_data, sign_envelope):
+    valid_envelope_data["verification"]["tests_passed"] = False
+    envelope = OCTPEnvelope.model_validate(sign_envelope(valid_envelope_data))
+    policy = Policy(block_on_failed_tests=True).compile()
+
+    result = asyncio.run(api.verify(envelope, policy=policy))
+
+    assert result.valid and not result.accepted
+    assert [v.rule for v in result.violations] == ["block_on_failed_tests"]
+
+
+def test_sign_builds_envelope_while_provenance_is_awaited(
+    repo, tmp_path, minimal_envelope_data, passing
+):
+    started = []
+
+    async def provenance():
+        await asyncio.sleep(0)
+        return minimal_envelope_data["provenance"]
+
+    with (
+        patch("octp.api.ensure_keypair"),
+        patch("octp.core.builder.sign_payload", return_value="c2ln"),
+        patch("octp.core.builder.signature_algorithm", return_value="ES256"),
+    ):
+        result = asyncio.run(
+            api.sign(
+                repo,
+                provenance,
+                output=tmp_path / "out.json",
+                on_start=lambda info, dev: started.append(dev),
+            )
+        )
+
+    assert started == ["email:dev@example.com"]
+    assert result.results["tests"].passed
+    assert result.envelope.commit_hash == result.repo.commit_hash
+    assert result.output.exists()
+    assert asyncio.run(api.verify(result.output)).valid
+
+
+def test_sign_rejects_bad_arguments(repo):
+    with pytest.raises(ValueError, match="provenance"):
+        asyncio.run(api.sign(repo))
+    with pytest.raises(ValueError, match="Unknown format"):
+        asyncio.run(api.sign(repo, {}, format="yaml"))
+
+
+def test_sign_reports_a_failed_note_as_a_warning(repo, minimal_envelope_data, passing):
+    def sign():
+        return asyncio.run(
+            api.sign(repo, minimal_envelope_data["provenance"], notes=True)
+        )
+
+    with (
+        patch("octp.api.ensure_keypair"),
+        patch("octp.core.builder.sign_payload", return_value="c2ln"),
+        patch("octp.core.builder.signature_algorithm", return_value="ES256"),
+    ):
+        assert sign().noted
+        with patch(
+            "octp.api.add_note",
+            side_effect=git.GitCommandError(["git", "notes"], 1, b"locked"),
+        ):
+            result = sign()
+
+    assert not result.noted
+    assert any("as a note" in warning for warning in result.warnings)
+
+
+def test_sign_checked_reports_every_degraded_step(
+    repo, monkeypatch, minimal_envelope_data, passing
+):
+    monkeypatch.delenv("OCTP_CONFIG", raising=False)
+    monkeypatch.delenv("OCTP_REMOTE_CACHE", raising=False)
+    (repo / ".octp.toml").write_text(
+        '[cache]\nremote = "http://127.0.0.1:9"\n[log]\nurl = "http://127.0.0.1:9"\n'
+    )
+    prepared = api.prepare_repo(repo)
+    assert prepared.check_kwargs["cache"] is None
+
+    with (
+        patch("octp.core.builder.sign_payload", return_value="c2ln"),
+        patch("octp.core.builder.signature_algorithm", return_value="ES256"),
+    ):
+        result = api.sign_checked(
+            prepared,
+            minimal_envelope_data["provenance"],
+            {"tests": passing.run(repo)},
+            output=repo / "out.json",
+        )
+
+    assert result.output.exists() and result.log_index is None
+    assert [w.split(":")[0] for w in result.warnings] == [
+        "Result cache disabled",
+        "Transparency log append failed",
+    ]
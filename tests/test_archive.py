@@ -0,0 +1,77 @@
+"""Tests for the indexed envelope archive."""
+
+import pytest
+
+from octp.core.envelope import OCTPEnvelope
+from octp.output.archive import ArchiveError, ArchiveReader, ArchiveWriter
+
+
+def _envelopes(data, count, start=0):
+    envelopes = []
+    for i in range(start, start + count):
+        envelope = OCTPEnvelope.model_validate(data)
+        envelope.contribution_id = f"00000000-0000-0000-0000-{i:012d}"
+        envelope.commit_hash = f"{i % 7:02x}{i:038x}"
+        envelopes.append(envelope)
+    return envelopes
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_lookup_by_id_and_commit(tmp_path, valid_envelope_data, compress):
+    path = tmp_path / "envelopes.octp"
+    envelopes = _envelopes(valid_envelope_data, 100)
+    with ArchiveWriter(path, compress=compress, block_records=16) as writer:
+        for envelope in envelopes:
+            writer.add(envelope)
+
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 100
+        assert reader.get(envelopes[42].contribution_id) == envelopes[42]
+        assert reader.get("missing") is None
+        assert reader.get("ünïcödé") is None
+        assert reader.find_commit("é") == []
+        assert reader.find_commit(envelopes[5].commit_hash) == [envelopes[5]]
+        # Prefix lookups return every commit sharing the prefix
+        assert len(reader.find_commit("03")) == len(
+            [e for e in envelopes if e.commit_hash.startswith("03")]
+        )
+
+
+def test_append_keeps_existing_records(tmp_path, valid_envelope_data):
+    path = tmp_path / "envelopes.octp"
+    first, second = (
+        _envelopes(valid_envelope_data, 10),
+        _envelopes(valid_envelope_data, 10, start=10),
+    )
+    with ArchiveWriter(path) as writer:
+        for envelope in first:
+            writer.add(envelope)
+    with ArchiveWriter(path) as writer:
+        assert writer.add(first[0]) is False  # already archived
+        for envelope in second:
+            writer.add(envelope)
+
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 20
+        assert reader.get(first[3].contribution_id) == first[3]
+        assert reader.get(second[3].contribution_id) == second[3]
+
+
+def test_missing_index_is_rebuilt_on_append(tmp_path, valid_envelope_data):
+    path = tmp_path / "envelopes.octp"
+    envelopes = _envelopes(valid_envelope_data, 5)
+    with ArchiveWriter(path, block_records=2) as writer:
+        for envelope in envelopes:
+            writer.add(envelope)
+    # Simulate a crash that lost the footer
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+    with pytest.raises(ArchiveError, match="index missing"):
+        ArchiveReader(path)
+
+    with ArchiveWriter(path):
+        pass
+    with ArchiveReader(path) as reader:
+        assert [e.contribution_id for e in reader.entries()] == [
+            e.contribution_id for e in envelopes
+        ]
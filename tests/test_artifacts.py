@@ -0,0 +1,91 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from octp.core.envelope import OCTPEnvelope
+from octp.integrity.hasher import hash_payload
+from octp.verification.artifacts import ArtifactStore, gc_limits
+from octp.verification.base import CheckResult
+from octp.verification.cache import LocalCache, result_to_dict
+from octp.verification.registry import run_all
+
+REPORT = "src/app.py:1:1: F401 `os` imported but unused\n" * 500
+
+
+def test_put_get_round_trip_and_dedup(tmp_path):
+    store = ArtifactStore(tmp_path)
+    digest = store.put(REPORT)
+    assert store.put(REPORT) == digest
+    assert digest in store
+    assert store.get(digest) == REPORT
+    files = list(tmp_path.glob("*/*.z"))
+    assert len(files) == 1
+    assert files[0].stat().st_size < len(REPORT) // 10  # compressed
+
+
+def test_get_unknown_or_corrupt_digest_raises_key_error(tmp_path):
+    store = ArtifactStore(tmp_path)
+    with pytest.raises(KeyError):
+        store.get("0" * 64)
+    digest = store.put("report")
+    next(tmp_path.glob("*/*.z")).write_bytes(b"not zlib")
+    with pytest.raises(KeyError):
+        store.get(digest)
+    with pytest.raises(ValueError):
+        store.get("../../etc/passwd")
+
+
+def test_gc_by_age_then_size(tmp_path):
+    store = ArtifactStore(tmp_path)
+    digests = [store.put(f"report {i}\n" * 100) for i in range(4)]
+    now = time.time()
+    for age, digest in zip((40, 30, 20, 0), digests):
+        path = next(tmp_path.glob(f"*/{digest}.z"))
+        os.utime(path, (now - age * 86400, now - age * 86400))
+
+    removed, _ = store.gc(max_age=35 * 86400)
+    assert removed == 1 and digests[0] not in store
+
+    size = next(tmp_path.glob(f"*/{digests[3]}.z")).stat().st_size
+    removed, _ = store.gc(max_bytes=size)
+    assert removed == 2
+    assert [d in store for d in digests] == [False, False, False, True]
+
+
+def test_gc_limits_from_config():
+    assert gc_limits({}) == (30 * 86400, 256 * 1024 * 1024)
+    assert gc_limits({"artifacts": {"max_age_days": 0, "max_size_mb": 1}}) == (
+        None,
+        1024 * 1024,
+    )
+    with pytest.raises(ValueError):
+        gc_limits({"artifacts": {"max_age_days": "soon"}})
+
+
+def test_run_all_stores_report_and_keeps_digest(tmp_path, fake_runners):
+    store = ArtifactStore(tmp_path / "artifacts")
+    cache = LocalCache(tmp_path / "cache")
+    report = CheckResult(False, "ruff@0.1", None, REPORT[:200], output=REPORT)
+    fake_runners.use([fake_runners("ruff", report)])
+    with patch(
+        "octp.verification.registry._cache_keys",
+        return_value={"ruff": "a" * 64},
+    ):
+        result = run_all(tmp_path, cache=cache, artifacts=store)["ruff"]
+
+    assert result.output is None
+    assert store.get(result.report_digest) == REPORT
+    cached = cache.get("a" * 64)
+    assert cached.report_digest == result.report_digest
+    assert "output" not in result_to_dict(cached)
+
+
+def test_reports_field_only_hashed_when_set(valid_envelope_data):
+    envelope = OCTPEnvelope.model_validate(valid_envelope_data)
+    before = hash_payload(envelope.to_signable_dict())
+    assert "reports" not in envelope.to_signable_dict()["verification"]
+
+    envelope.verification.reports = {"ruff": "b" * 64}
+    assert hash_payload(envelope.to_signable_dict()) != before
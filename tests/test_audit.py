@@ -0,0 +1,80 @@
+"""Tests for history-wide envelope audits."""
+
+import json
+
+import git
+import pytest
+
+from octp.core.audit import DirectorySource, NotesSource, audit, iter_commits
+from octp.git.notes import NOTES_REF, add_note
+from octp.identity.keyring import KeyRing
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = git.Repo.init(tmp_path / "repo")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    for i in range(3):
+        repo.index.commit(f"commit {i}")
+    return repo
+
+
+def test_iter_commits_streams_range(repo):
+    commits = list(iter_commits("HEAD~2..HEAD", repo.working_dir))
+    assert commits == [c.hexsha for c in repo.iter_commits("HEAD~2..HEAD")]
+
+
+def test_iter_commits_rejects_unknown_revisions(repo):
+    for rev_range in ("nosuchrev", "HEAD~1..nosuchrev", "^nosuchrev"):
+        with pytest.raises(ValueError, match="nosuchrev"):
+            iter_commits(rev_range, repo.working_dir)
+    assert len(list(iter_commits("HEAD~1..", repo.working_dir))) == 1
+
+
+def test_audit_classifies_commits(
+    repo, signed_envelope_data, sign_envelope, public_key_pem
+):
+    newest, middle, oldest = [c.hexsha for c in repo.iter_commits()]
+    keyring = KeyRing()
+    keyring.add("github:sara-dev-92", public_key_pem)
+
+    genuine = sign_envelope(dict(signed_envelope_data, commit_hash=newest))
+    add_note(json.dumps(genuine).encode(), newest, repo.working_dir)
+    # Re-targeting a signed envelope at another commit breaks its hash
+    forged = dict(signed_envelope_data, commit_hash=middle)
+    add_note(json.dumps(forged).encode(), middle, repo.working_dir)
+
+    sources = [NotesSource(repo.working_dir, NOTES_REF)]
+    results = list(
+        audit(iter_commits("HEAD", repo.working_dir), sources, keyring, workers=2)
+    )
+    assert [r.commit for r in results] == [newest, middle, oldest]
+    assert [r.status for r in results] == ["valid", "invalid", "missing"]
+    assert results[0].signature_verified is True
+    assert "mismatch" in results[1].reason
+
+
+def test_audit_rejects_developers_without_a_trusted_key(
+    repo, signed_envelope_data, sign_envelope, public_key_pem
+):
+    head = repo.head.commit.hexsha
+    keyring = KeyRing()
+    keyring.add("github:someone-else", public_key_pem)
+    envelope = sign_envelope(dict(signed_envelope_data, commit_hash=head))
+    add_note(json.dumps(envelope).encode(), head, repo.working_dir)
+
+    sources = [NotesSource(repo.working_dir, NOTES_REF)]
+    (result,) = audit(iter_commits("HEAD~1..", repo.working_dir), sources, keyring)
+
+    assert result.status == "invalid"
+    assert result.reason == "No trusted key for developer github:sara-dev-92"
+
+
+def test_directory_source_indexes_by_commit(tmp_path, signed_envelope_data):
+    (tmp_path / "a.json").write_text(json.dumps(signed_envelope_data))
+    (tmp_path / "other.json").write_text('{"not": "an envelope"}')
+    source = DirectorySource(tmp_path)
+    assert len(source.lookup(signed_envelope_data["commit_hash"])) == 1
+    assert source.lookup("0" * 40) == []
@@ -0,0 +1,98 @@
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from octp.git.worktrees import WorktreePool
+from octp.provenance.template import load_template
+from octp.verification.backfill import backfill, list_commits
+from octp.verification.base import CheckResult
+
+
+def check_version(repo_root, files):
+    """Passes when the checked-out tree is at an even version."""
+    version = int((Path(repo_root) / "VERSION").read_text())
+    stray = (Path(repo_root) / "stray.txt").exists()
+    (Path(repo_root) / "stray.txt").write_text("left by a check")
+    return CheckResult(version % 2 == 0, "version@1", None, f"{version} {stray}")
+
+
+@pytest.fixture
+def version_runner(fake_runners):
+    fake_runners.use([fake_runners("version", check_version, cacheable=False)])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=tmp_path, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "Dev")
+    commits = []
+    for version in range(5):
+        (tmp_path / "VERSION").write_text(str(version))
+        git("add", "VERSION")
+        git("commit", "-q", "-m", f"v{version}")
+        commits.append(git("rev-parse", "HEAD"))
+    return tmp_path, commits
+
+
+def test_list_commits_oldest_first(repo):
+    root, commits = repo
+    assert list_commits(root, [f"{commits[1]}..HEAD"]) == commits[2:]
+    with pytest.raises(ValueError, match="Invalid revision range"):
+        list_commits(root, ["no-such-rev..HEAD"])
+
+
+def test_backfill_checks_each_commit_in_pooled_worktrees(repo, version_runner):
+    root, commits = repo
+    checked = {}
+
+    def on_checked(info, results):
+        checked[info.commit_hash] = (info.root, results["version"].detail)
+
+    outcomes = backfill(root, commits, jobs=2, on_checked=on_checked)
+
+    assert [outcomes[c]["version"].passed for c in commits] == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+    # Every commit saw its own tree, cleaned of the previous commit's files
+    assert [checked[c][1] for c in commits] == [f"{v} False" for v in range(5)]
+    assert len({path for path, _ in checked.values()}) == 2
+    # The pool is reused by the next run instead of being recreated
+    assert sorted(WorktreePool(root, 2).paths) == sorted(
+        {path for path, _ in checked.values()}
+    )
+
+
+def test_backfill_stop_skips_commits_not_started(repo, version_runner):
+    root, commits = repo
+    stop = threading.Event()
+
+    def on_checked(info, results):
+        stop.set()
+        raise RuntimeError("disk full")
+
+    outcomes = backfill(root, commits, jobs=1, on_checked=on_checked, stop=stop)
+
+    assert list(outcomes) == commits[:1]
+    assert str(outcomes[commits[0]]) == "disk full"
+
+
+def test_load_template(tmp_path):
+    path = tmp_path / "provenance.toml"
+    path.write_text('method = "human_only"\nhuman_review_level = "moderate_review"\n')
+    assert load_template(path)["method"] == "human_only"
+
+    path.write_text('method = "human_only"\n')
+    with pytest.raises(ValueError, match="human_review_level"):
+        load_template(path)
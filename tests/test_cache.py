@@ -0,0 +1,186 @@
+"""Tests for the verification result cache."""
+
+import base64
+import threading
+from unittest.mock import patch
+
+import git
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from octp.git.reader import state_dir, working_tree_hash
+from octp.identity.keyring import KeyRing
+from octp.server.cache import CacheStore, create_cache_server
+from octp.verification.base import CheckResult
+from octp.verification.cache import (
+    LocalCache,
+    RemoteCache,
+    cache_from_config,
+    cache_key,
+    open_entry,
+    sign_entry,
+)
+from octp.verification.registry import run_all
+
+DEV = "github:sara-dev-92"
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / "a.py").write_text("x = 1\n")
+    return repo
+
+
+@pytest.fixture
+def signer(signing_key):
+    def sign(payload_hash):
+        signature = signing_key.sign(payload_hash.encode(), ec.ECDSA(hashes.SHA256()))
+        return base64.b64encode(signature).decode()
+
+    return sign
+
+
+@pytest.fixture
+def keyring(public_key_pem):
+    keyring = KeyRing()
+    keyring.add(DEV, public_key_pem)
+    return keyring
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = create_cache_server(CacheStore(tmp_path / "remote"), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _result(**kwargs):
+    return CheckResult(
+        passed=True, tool_name="ruff@0.4", suite_hash=None, detail="ok", **kwargs
+    )
+
+
+def test_tree_hash_tracks_untracked_files_without_touching_index(repo, tmp_path):
+    before = working_tree_hash(tmp_path)
+    assert working_tree_hash(tmp_path) == before
+    (tmp_path / "b.py").write_text("y = 2\n")
+    assert working_tree_hash(tmp_path) != before
+    assert repo.git.status("--porcelain").splitlines() == ["?? a.py", "?? b.py"]
+
+
+def test_tree_hash_ignores_gitignored_files(repo, tmp_path):
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    before = working_tree_hash(tmp_path)
+    (tmp_path / "debug.log").write_text("noise")
+    assert working_tree_hash(tmp_path) == before
+
+
+def test_cache_key_depends_on_tree_and_inputs(fake_runners):
+    runner = fake_runners("counting")
+    key = cache_key("a" * 40, runner)
+    assert len(key) == 64
+    assert cache_key("b" * 40, runner) != key
+    with patch.object(runner, "cache_inputs", return_value=["2.0"]):
+        assert cache_key("a" * 40, runner) != key
+
+
+def test_local_cache_round_trip(tmp_path):
+    cache = LocalCache(tmp_path)
+    assert cache.get("0" * 64) is None
+    cache.put("0" * 64, _result())
+    hit = cache.get("0" * 64)
+    assert hit.tool_name == "ruff@0.4" and hit.cached is True
+    assert cache.clear() == 1
+    assert cache.get("0" * 64) is None
+
+
+def test_signed_entry_requires_trusted_signer(keyring, signer):
+    entry = sign_entry("0" * 64, _result(), DEV, sign=signer)
+    assert open_entry(entry, "0" * 64, keyring).passed is True
+
+    forged = dict(entry, result=dict(entry["result"], passed=False))
+    assert open_entry(forged, "0" * 64, keyring) is None
+    assert open_entry(entry, "1" * 64, keyring) is None
+
+    unsigned = sign_entry("0" * 64, _result())
+    assert open_entry(unsigned, "0" * 64, keyring) is None
+    assert open_entry(unsigned, "0" * 64) is None
+    assert open_entry(unsigned, "0" * 64, trust_unsigned=True) is not None
+
+
+def test_remote_cache_round_trip(server, keyring, signer):
+    key = "ab" * 32
+    remote = RemoteCache(server, keyring=keyring, developer_id=DEV, push=True)
+    assert remote.get(key) is None
+    with patch("octp.verification.cache.sign_payload", signer):
+        remote.put(key, _result())
+    assert remote.get(key).tool_name == "ruff@0.4"
+
+
+def test_remote_cache_rejects_unsigned_entries(server, keyring):
+    key = "ab" * 32
+    RemoteCache(server, push=True).put(key, _result())
+    assert RemoteCache(server).get(key) is None
+    assert RemoteCache(server, keyring=keyring).get(key) is None
+    assert RemoteCache(server, trust_unsigned=True).get(key).passed is True
+
+
+def test_remote_cache_needs_trusted_keys(tmp_path, monkeypatch):
+    monkeypatch.delenv("OCTP_REMOTE_CACHE", raising=False)
+    config = {"cache": {"remote": "http://cache.internal:8766"}}
+    with pytest.raises(ValueError, match="trusted_keys"):
+        cache_from_config(config, tmp_path)
+
+    config["cache"]["trust_unsigned"] = True
+    assert cache_from_config(config, tmp_path).remote.trust_unsigned is True
+
+
+def test_read_only_remote_does_not_upload(server):
+    remote = RemoteCache(server)
+    remote.put("ab" * 32, _result())
+    assert remote.get("ab" * 32) is None
+
+
+def test_unreachable_remote_is_a_miss():
+    assert RemoteCache("http://127.0.0.1:9", timeout=0.5).get("ab" * 32) is None
+
+
+def test_server_rejects_bad_keys(tmp_path):
+    store = CacheStore(tmp_path)
+    with pytest.raises(ValueError, match="Invalid cache key"):
+        store.get("../../etc/passwd")
+    with pytest.raises(ValueError, match="does not match"):
+        store.put("ab" * 32, b'{"key": "other"}')
+
+
+def test_run_all_reuses_cached_results(repo, tmp_path, fake_runners):
+    runner = fake_runners("counting")
+    fake_runners.use([runner])
+    cache = cache_from_config({}, state_dir(tmp_path))
+    first = run_all(tmp_path, cache=cache)
+    second = run_all(tmp_path, cache=cache)
+    (tmp_path / "a.py").write_text("x = 2\n")
+    run_all(tmp_path, cache=cache)
+
+    assert len(runner.calls) == 2
+    assert first["counting"].cached is False
+    assert second["counting"].cached is True
+
+
+def test_run_all_does_not_cache_timeouts(repo, tmp_path, fake_runners):
+    timeout = CheckResult(False, "counting@1.0", None, "slow", status="timeout")
+    runner = fake_runners("counting", timeout)
+    fake_runners.use([runner])
+    cache = LocalCache(tmp_path / "cache")
+    run_all(tmp_path, cache=cache)
+    run_all(tmp_path, cache=cache)
+    assert len(runner.calls) == 2
+
+
+def test_disabled_in_config(tmp_path):
+    assert cache_from_config({"cache": {"enabled": False}}, tmp_path) is None
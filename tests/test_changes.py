@@ -0,0 +1,99 @@
+"""Tests for skipping runners that no changed file concerns."""
+
+import subprocess
+
+import pytest
+
+from octp.core.envelope import OCTPEnvelope
+from octp.verification.base import NOT_APPLICABLE
+from octp.verification.changes import changed_files
+from octp.verification.pytest_runner import PytestRunner
+from octp.verification.registry import run_all
+
+
+@pytest.fixture
+def repo(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "Dev")
+    (tmp_path / "app.py").write_text("x = 1\n")
+    git("add", "app.py")
+    git("commit", "-q", "-m", "code")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n")
+    git("add", "docs")
+    git("commit", "-q", "-m", "docs")
+    return tmp_path
+
+
+@pytest.fixture
+def run_fakes(fake_runners):
+    def run(root, runners, options=None):
+        fake_runners.use(runners)
+        return run_all(root, options=options)
+
+    return run
+
+
+def test_changed_files_since_parent_and_working_tree(repo):
+    assert changed_files(repo) == ["docs/guide.md"]
+    (repo / "app.py").write_text("x = 2\n")
+    (repo / "new.txt").write_text("untracked\n")
+    assert changed_files(repo) == ["app.py", "docs/guide.md", "new.txt"]
+    assert changed_files(repo, "no-such-rev") is None
+
+
+def test_docs_only_change_skips_code_runners(repo, fake_runners, run_fakes):
+    code = fake_runners("code", change_patterns=("*.py",), cacheable=False)
+    lint = fake_runners("lint", file_patterns=("*.py",), cacheable=False)
+    secrets = fake_runners("secrets", cacheable=False)
+    results = run_fakes(repo, [code, lint, secrets])
+
+    assert results["code"].status == NOT_APPLICABLE
+    assert results["code"].passed
+    assert results["lint"].status == NOT_APPLICABLE
+    assert not code.calls and not lint.calls
+    # Without any patterns a runner concerns every change
+    assert secrets.calls and results["secrets"].status == "ok"
+
+
+def test_skip_unaffected_can_be_turned_off(repo, fake_runners, run_fakes):
+    code = fake_runners("code", change_patterns=("*.py",), cacheable=False)
+    results = run_fakes(repo, [code], {"skip_unaffected": False})
+    assert code.calls and results["code"].status == "ok"
+
+
+def test_changes_since_sets_the_base(repo, fake_runners, run_fakes):
+    code = fake_runners("code", change_patterns=("*.py",), cacheable=False)
+    results = run_fakes(repo, [code], {"changes_since": "HEAD"})
+    assert results["code"].status == NOT_APPLICABLE
+
+    (repo / "app.py").write_text("x = 2\n")
+    results = run_fakes(repo, [code], {"changes_since": "HEAD"})
+    assert code.calls
+
+
+def test_change_patterns_override_from_config():
+    runner = PytestRunner()
+    assert runner.applies_to(["src/app.py"])
+    assert not runner.applies_to(["docs/guide.md"])
+
+    runner.configure({"change_patterns": {"pytest": ["docs/*"]}})
+    assert runner.change_patterns == ("docs/*",)
+    assert runner.applies_to(["docs/guide.md"])
+    assert not runner.applies_to(["README.md"])
+
+
+def test_not_applicable_left_out_of_canonical_dict(valid_envelope_data):
+    envelope = OCTPEnvelope(**valid_envelope_data)
+    assert "not_applicable" not in envelope.to_canonical_dict()["verification"]
+
+    valid_envelope_data["verification"]["not_applicable"] = ["mypy", "pytest"]
+    envelope = OCTPEnvelope(**valid_envelope_data)
+    assert envelope.to_canonical_dict()["verification"]["not_applicable"] == [
+        "mypy",
+        "pytest",
+    ]
@@ -0,0 +1,22 @@
+"""Tests for interactive provenance collection."""
+
+from unittest.mock import patch
+
+from octp.provenance.collector import collect_interactively
+from octp.provenance.models import ProvenanceMethod
+
+
+def test_status_line_shown_between_prompts_only_when_changed():
+    statuses = iter(["checks running…"] * 4 + ["checks done: ruff ✓"] * 10)
+    with (
+        patch(
+            "octp.provenance.collector.Prompt.ask",
+            side_effect=lambda *a, **kw: kw.get("default", ""),
+        ),
+        patch("octp.provenance.collector.console.print") as printed,
+    ):
+        data = collect_interactively(status_line=lambda: next(statuses))
+
+    assert data["method"] == ProvenanceMethod.HUMAN_ONLY
+    shown = [c.args[0] for c in printed.call_args_list if "checks" in c.args[0]]
+    assert shown == ["[dim]  checks running…[/dim]", "[dim]  checks done: ruff ✓[/dim]"]
@@ -0,0 +1,60 @@
+"""Tests for deterministic CBOR and envelope encodings."""
+
+import pytest
+
+from octp.core import cbor
+from octp.core.envelope import OCTPEnvelope
+from octp.output.encoding import decode_envelope, encode_envelope, envelope_digest
+
+
+@pytest.mark.parametrize(
+    "value, encoded",
+    [  # RFC 8949 Appendix A vectors
+        (0, "00"),
+        (24, "1818"),
+        (1000000, "1a000f4240"),
+        (-1000, "3903e7"),
+        (1.5, "f93e00"),
+        (100000.0, "fa47c35000"),
+        (1.1, "fb3ff199999999999a"),
+        ("a", "6161"),
+        ([1, [2, 3]], "8201820203"),
+        ({"a": 1, "b": [2, 3]}, "a26161016162820203"),
+        (None, "f6"),
+    ],
+)
+def test_cbor_matches_rfc_vectors(value, encoded):
+    assert cbor.dumps(value).hex() == encoded
+    assert cbor.loads(bytes.fromhex(encoded)) == value
+
+
+def test_cbor_is_independent_of_key_order():
+    assert cbor.dumps({"b": 1, "aa": 2, "a": 3}) == cbor.dumps(
+        {"a": 3, "aa": 2, "b": 1}
+    )
+
+
+def test_cbor_rejects_indefinite_length():
+    with pytest.raises(cbor.CBORError):
+        cbor.loads(bytes.fromhex("9f0102ff"))
+
+
+def test_cbor_rejects_trailing_bytes():
+    with pytest.raises(cbor.CBORError):
+        cbor.loads(bytes.fromhex("0000"))
+
+
+def test_envelope_round_trips_through_cbor(valid_envelope_data):
+    envelope = OCTPEnvelope.model_validate(valid_envelope_data)
+    encoded = encode_envelope(envelope, "cbor")
+    decoded = decode_envelope(encoded)
+    assert decoded == envelope
+    assert encode_envelope(decoded, "json") == encode_envelope(envelope, "json")
+    assert len(encoded) < len(encode_envelope(envelope, "json"))
+
+
+def test_digest_is_stable_across_formats(valid_envelope_data):
+    envelope = OCTPEnvelope.model_validate(valid_envelope_data)
+    from_json = decode_envelope(encode_envelope(envelope, "json"))
+    from_cbor = decode_envelope(encode_envelope(envelope, "cbor"))
+    assert envelope_digest(from_json) == envelope_digest(from_cbor)
@@ -0,0 +1,57 @@
+"""Tests for shared file-set discovery."""
+
+import git
+import pytest
+
+from octp.verification.fileset import FileSet, command_paths
+from octp.verification.registry import run_all
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / ".gitignore").write_text(".venv/\nnode_modules/\n")
+    for rel in ["src/app.py", "src/types.pyi", "README.md", "gone.py"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x = 1\n")
+    repo.index.add([".gitignore", "src/app.py", "README.md", "gone.py"])
+    (tmp_path / "gone.py").unlink()
+    for rel in [".venv/lib/site.py", "node_modules/pkg/index.js"]:
+        (tmp_path / rel).parent.mkdir(parents=True)
+        (tmp_path / rel).write_text("")
+    return tmp_path
+
+
+def test_discover_lists_tracked_and_untracked_but_not_ignored(repo):
+    fileset = FileSet.discover(repo)
+    assert fileset.paths == (".gitignore", "README.md", "src/app.py", "src/types.pyi")
+
+
+def test_select_filters_by_glob(repo):
+    fileset = FileSet.discover(repo)
+    assert fileset.select(("*.py", "*.pyi")) == ["src/app.py", "src/types.pyi"]
+    assert fileset.select(("src/*.py",)) == ["src/app.py"]
+    assert fileset.select(("*",)) == list(fileset.paths)
+
+
+def test_discover_outside_git_raises(tmp_path):
+    with pytest.raises(RuntimeError, match="Could not list files"):
+        FileSet.discover(tmp_path)
+
+
+def test_command_paths_falls_back_to_top_level_entries():
+    paths = ["src/a.py", "src/b/c.py", "setup.py"]
+    assert command_paths(paths) == paths
+    assert command_paths(paths, budget=10) == ["setup.py", "src"]
+
+
+def test_run_all_passes_selected_files(repo, fake_runners):
+    python = fake_runners("python", file_patterns=("*.py",))
+    rust = fake_runners("rust", file_patterns=("*.rs",))
+    fake_runners.use([python, rust])
+    results = run_all(repo)
+
+    assert python.calls == [["src/app.py"]]
+    assert rust.calls == []  # nothing to check, never started
+    assert results["rust"].passed is True
+    assert "No matching files" in results["rust"].detail
@@ -0,0 +1,86 @@
+"""Tests for in-process tool execution."""
+
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from octp.verification.bandit_runner import BanditRunner
+from octp.verification.inprocess import (
+    ToolPool,
+    is_importable,
+    run_bandit,
+    run_mypy,
+    run_pytest,
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ToolPool(shared_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_shared_workers_persist_and_fresh_workers_do_not(pool):
+    assert pool.call(os.getpid) == pool.call(os.getpid) != os.getpid()
+    assert pool.call(os.getpid, fresh=True) != pool.call(os.getpid, fresh=True)
+
+
+def test_timeout_kills_only_the_hung_worker(pool):
+    before = pool.call(os.getpid)
+    with ThreadPoolExecutor(1) as executor:
+        other = executor.submit(pool.call, time.sleep, 2)
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.call(time.sleep, 30, timeout=1)
+        assert other.result() is None
+    assert pool.call(os.getpid) == before
+    assert pool.call(time.sleep, 0) is None
+
+
+def test_tool_errors_are_raised_in_the_caller(pool):
+    with pytest.raises(FileNotFoundError):
+        pool.call(os.chdir, "/no/such/dir")
+
+
+def test_unknown_tools_are_not_importable():
+    assert is_importable("pytest")
+    assert not is_importable("semgrep")
+
+
+@pytest.mark.skipif(not is_importable("mypy"), reason="mypy not installed")
+def test_run_mypy(pool, tmp_path):
+    (tmp_path / "ok.py").write_text("x: int = 1\n")
+    (tmp_path / "bad.py").write_text("x: int = 'one'\n")
+    status, _, version = pool.call(run_mypy, str(tmp_path), ["ok.py"])
+    assert status == 0 and version
+    status, out, _ = pool.call(run_mypy, str(tmp_path), ["bad.py"])
+    assert status == 1 and "Incompatible types" in out
+
+
+@pytest.mark.skipif(not is_importable("bandit"), reason="bandit not installed")
+def test_bandit_runner_in_process_matches_severity_filter(pool, tmp_path, monkeypatch):
+    (tmp_path / "low.py").write_text("import subprocess\n")
+    (tmp_path / "medium.py").write_text("eval(input())\n")
+    assert pool.call(run_bandit, str(tmp_path), ["low.py"])[0] == 0
+    status, report, _ = pool.call(run_bandit, str(tmp_path), ["medium.py"])
+    assert status == 1 and "B307" in report
+
+    monkeypatch.setattr("octp.verification.bandit_runner.get_pool", lambda: pool)
+    runner = BanditRunner()
+    runner.in_process = True
+    result = runner.run(str(tmp_path), ["medium.py"])
+    assert result.passed is False and "B307" in result.detail
+
+
+def test_run_pytest_in_fresh_worker(pool, tmp_path):
+    (tmp_path / "test_sample.py").write_text("def test_ok():\n    assert True\n")
+    code, out, version = pool.call(
+        run_pytest,
+        str(tmp_path),
+        ["--tb=no", "-q", "-p", "no:cacheprovider"],
+        fresh=True,
+    )
+    assert code == 0 and "1 passed" in out and version
@@ -0,0 +1,90 @@
+import shutil
+import subprocess
+
+import pytest
+
+from octp.verification.junit import (
+    COVERAGE_FILE,
+    JUNIT_FILE,
+    PYTEST_DIR,
+    load_durations,
+    parse_junit,
+)
+from octp.verification.pytest_runner import PytestRunner
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="1" failures="1" skipped="1" tests="5"
+    time="1.500">
+  <testcase classname="tests.test_a" name="test_ok" time="0.250"/>
+  <testcase classname="tests.test_a.TestGroup" name="test_fails" time="0.500">
+    <failure message="assert 1 == 2">assert 1 == 2</failure>
+  </testcase>
+  <testcase classname="tests.test_a" name="test_skip" time="0.000">
+    <skipped message="later"/>
+  </testcase>
+  <testcase classname="tests.test_b" name="test_param[x-1]" time="0.125"/>
+  <testcase classname="tests.test_b" name="test_fixture" time="0.010">
+    <error message="fixture failed"/>
+  </testcase>
+</testsuite></testsuites>
+"""
+
+
+def test_parse_junit_counts_outcomes_and_durations(tmp_path):
+    path = tmp_path / "junit.xml"
+    path.write_text(JUNIT)
+
+    report = parse_junit(path)
+
+    assert (report.passed, report.failed, report.skipped, report.errors) == (
+        2,
+        1,
+        1,
+        1,
+    )
+    assert report.failures == [
+        "tests/test_a.py::TestGroup::test_fails",
+        "tests/test_b.py::test_fixture",
+    ]
+    assert report.durations["tests/test_b.py::test_param[x-1]"] == 0.125
+    assert report.summary() == "1 failed, 2 passed, 1 skipped, 1 error in 1.50s"
+
+
+def test_parse_junit_rejects_truncated_report(tmp_path):
+    path = tmp_path / "junit.xml"
+    path.write_text(JUNIT[:300])
+    with pytest.raises(ValueError):
+        parse_junit(path)
+
+
+@pytest.fixture
+def test_repo(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "calc.py").write_text("def add(a, b):\n    return a + b\n")
+    (tmp_path / "tests" / "test_calc.py").write_text(
+        "from calc import add\n\n\n"
+        "def test_add():\n    assert add(1, 2) == 3\n\n\n"
+        "def test_broken():\n    assert add(1, 1) == 3\n"
+    )
+    (tmp_path / "pytest.ini").write_text("[pytest]\npythonpath = .\n")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+@pytest.mark.skipif(shutil.which("pytest") is None, reason="pytest not on PATH")
+def test_runner_records_results_durations_and_coverage(test_repo):
+    runner = PytestRunner()
+    runner.configure({"pytest_coverage": True})
+
+    result = runner.run(str(test_repo))
+
+    state = test_repo / ".git" / "octp" / PYTEST_DIR
+    assert not result.passed
+    assert result.detail.startswith("1 failed, 1 passed in ")
+    assert set(load_durations(state)) == {
+        "tests/test_calc.py::test_add",
+        "tests/test_calc.py::test_broken",
+    }
+    assert (state / JUNIT_FILE).exists()
+    assert (state / COVERAGE_FILE).exists()
+    assert [p.name for p in state.glob("junit-*.xml")] == []
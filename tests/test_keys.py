@@ -0,0 +1,106 @@
+import pickle
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+from octp.core.envelope import OCTPEnvelope
+from octp.core.validator import check_integrity
+from octp.identity.keymanager import (
+    EDDSA,
+    ES256,
+    generate_private_key,
+    load_private_key,
+    migrate_keypair,
+    sign_with_key,
+    signature_algorithm,
+    verify_with_key,
+)
+from octp.identity.keyring import KeyRing
+from octp.integrity.hasher import hash_payload
+
+DEV = "github:sara-dev-92"
+DIGEST = "a" * 64
+
+
+def _pem(private_key):
+    return (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+@pytest.mark.parametrize("algorithm", [ES256, EDDSA])
+def test_sign_and_verify_round_trip(algorithm):
+    key = generate_private_key(algorithm)
+    signature = sign_with_key(DIGEST, key)
+    assert verify_with_key(DIGEST, signature, key.public_key(), algorithm)
+    assert not verify_with_key("b" * 64, signature, key.public_key(), algorithm)
+
+
+def test_verify_rejects_algorithm_that_does_not_match_key():
+    key = generate_private_key(EDDSA)
+    signature = sign_with_key(DIGEST, key)
+    assert not verify_with_key(DIGEST, signature, key.public_key(), ES256)
+    assert not verify_with_key(DIGEST, signature, key.public_key(), "RS256")
+
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported"):
+        generate_private_key("RS256")
+
+
+def test_keyring_holds_old_and_new_keys():
+    old, new = generate_private_key(ES256), generate_private_key(EDDSA)
+    keyring = KeyRing()
+    keyring.add(DEV, _pem(old))
+    keyring.add(DEV, _pem(new))
+    keyring.add(DEV, _pem(new))  # duplicates are ignored
+    assert len(keyring) == 1
+
+    for key, algorithm in ((old, ES256), (new, EDDSA)):
+        signature = sign_with_key(DIGEST, key)
+        assert keyring.verify(DEV, DIGEST, signature, algorithm) is True
+    assert keyring.verify(DEV, DIGEST, sign_with_key(DIGEST, new), ES256) is False
+    assert keyring.verify("github:someone-else", DIGEST, "") is None
+
+    restored = pickle.loads(pickle.dumps(keyring))
+    assert restored.verify(DEV, DIGEST, sign_with_key(DIGEST, old), ES256) is True
+
+
+def test_check_integrity_dispatches_on_signature_algorithm(valid_envelope_data):
+    key = generate_private_key(EDDSA)
+    envelope = OCTPEnvelope.model_validate(valid_envelope_data)
+    payload_hash = hash_payload(envelope.to_signable_dict())
+    envelope.integrity.payload_hash = payload_hash
+    envelope.integrity.developer_signature = sign_with_key(payload_hash, key)
+    envelope.integrity.signature_algorithm = EDDSA
+    keyring = KeyRing()
+    keyring.add(envelope.provenance.developer_id, _pem(key))
+
+    assert check_integrity(envelope, keyring).signature_verified is True
+
+    envelope.integrity.signature_algorithm = "RS256"
+    result = check_integrity(envelope, keyring)
+    assert not result.valid
+    assert "Unsupported signature algorithm" in result.reason
+
+
+def test_migrate_keypair_retires_old_key(tmp_path):
+    assert migrate_keypair(ES256, tmp_path) is None
+    old_pem = (tmp_path / "public.pem").read_text()
+
+    retired = migrate_keypair(EDDSA, tmp_path)
+
+    assert signature_algorithm(tmp_path) == EDDSA
+    assert [p.name.split("-", 1)[1] for p in sorted(retired.iterdir())] == [
+        "ES256-private.pem",
+        "ES256-public.pem",
+    ]
+    assert (retired / next(retired.glob("*-public.pem")).name).read_text() == old_pem
+    assert load_private_key(tmp_path).public_key() is not None
+    with pytest.raises(ValueError, match="already uses"):
+        migrate_keypair(EDDSA, tmp_path)
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import threading
+
+import pytest
+
+from octp.log.client import LogClient
+from octp.log.merkle import (
+    empty_root,
+    leaf_hash,
+    node_hash,
+    split_point,
+    verify_consistency,
+    verify_inclusion,
+)
+from octp.log.store import ENTRIES_FILE, TransparencyLog
+from octp.server.log import create_log_server
+
+
+def _digest(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def _root(digests):
+    """Reference Merkle tree hash, straight from the RFC's definition."""
+    if not digests:
+        return empty_root()
+    if len(digests) == 1:
+        return leaf_hash(bytes.fromhex(digests[0]))
+    k = split_point(len(digests))
+    return node_hash(_root(digests[:k]), _root(digests[k:]))
+
+
+@pytest.fixture
+def log(tmp_path):
+    with TransparencyLog(tmp_path / "log") as log:
+        yield log
+
+
+def test_proofs_verify_for_every_size_and_leaf(log):
+    digests = [_digest(i) for i in range(21)]
+    for i, digest in enumerate(digests):
+        assert log.append(digest) == i
+    assert log.append(digests[3]) == 3  # already logged
+
+    for size in range(1, len(digests) + 1):
+        root = bytes.fromhex(log.head(size).root)
+        assert root == _root(digests[:size])
+        for index in range(size):
+            path = [bytes.fromhex(p) for p in log.inclusion_proof(index, size)]
+            leaf = leaf_hash(bytes.fromhex(digests[index]))
+            assert len(path) <= size.bit_length()
+            assert verify_inclusion(leaf, index, size, path, root)
+            other = _root(digests[1:size])
+            assert not verify_inclusion(leaf, index, size, path, other)
+        for first in range(1, size + 1):
+            path = [bytes.fromhex(p) for p in log.consistency_proof(first, size)]
+            old = _root(digests[:first])
+            assert verify_consistency(first, size, old, root, path)
+            if first < size:
+                forged = _root([_digest("x"), *digests[1:first]])
+                assert not verify_consistency(first, size, forged, root, path)
+
+
+def test_reopen_repairs_interrupted_append(tmp_path):
+    directory = tmp_path / "log"
+    digests = [_digest(i) for i in range(12)]
+    with TransparencyLog(directory) as log:
+        for digest in digests:
+            log.append(digest)
+    # Crash after the entry was written but before its leaf; upper level lost
+    with open(directory / ENTRIES_FILE, "ab") as f:
+        f.write(bytes.fromhex(_digest("torn")))
+    os.truncate(directory / "level-2", 32)
+
+    with TransparencyLog(directory) as log:
+        assert log.size == 12
+        assert bytes.fromhex(log.head().root) == _root(digests)
+        assert log.find(_digest("torn")) is None
+        assert log.append(_digest("next")) == 12
+        assert log.entry(12) == _digest("next")
+
+
+@pytest.fixture
+def url(log):
+    server = create_log_server(log, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_proves_inclusion_and_tracks_heads(url, tmp_path):
+    client = LogClient(url, heads_dir=tmp_path / "heads")
+    assert client.append(_digest(0)) == 0
+    first = client.prove(_digest(0))
+    for i in range(1, 6):
+        client.append(_digest(i))
+
+    proof = client.prove(_digest(4))
+
+    assert (first.head.size, proof.index, proof.head.size) == (1, 4, 6)
+    with pytest.raises(KeyError):
+        client.prove(_digest("never logged"))
+    # A fresh client picks up the saved head and still accepts the log
+    assert LogClient(url, heads_dir=tmp_path / "heads").head() == proof.head
+
+
+def test_client_rejects_a_rewritten_log(url, tmp_path):
+    client = LogClient(url, heads_dir=tmp_path / "heads")
+    for i in range(4):
+        client.append(_digest(i))
+    client.head()
+    heads_file = next((tmp_path / "heads").iterdir())
+    seen = json.loads(heads_file.read_text())
+    # Pretend the log once held different entries at size 3
+    seen.update(tree_size=3, root=_root([_digest(i) for i in (9, 1, 2)]).hex())
+    heads_file.write_text(json.dumps(seen))
+
+    with pytest.raises(ValueError, match="not an extension"):
+        LogClient(url, heads_dir=tmp_path / "heads").head()
@@ -0,0 +1,154 @@
+"""Tests for run metrics and their Prometheus export."""
+
+import asyncio
+import socket
+import threading
+import urllib.request
+
+import pytest
+
+from octp import api
+from octp.core.envelope import OCTPEnvelope
+from octp.metrics import (
+    METRICS,
+    Metrics,
+    MetricsExporter,
+    exporter_from_config,
+    parse,
+)
+from octp.server.metrics import PushStore, create_metrics_server, grouping_key
+from octp.verification.base import CheckResult
+from octp.verification.registry import run_all
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    METRICS.clear()
+    yield
+    METRICS.clear()
+
+
+@pytest.fixture
+def push_url():
+    store = PushStore()
+    server = create_metrics_server(store, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_histogram_renders_cumulative_buckets_and_parses_back():
+    metrics = Metrics()
+    metrics.observe("octp_runner_duration_seconds", 0.3, runner="ruff")
+    metrics.observe("octp_runner_duration_seconds", 42.0, runner="ruff")
+    metrics.inc("octp_runner_results_total", runner='we"ird', status="ok")
+    text = metrics.render()
+
+    assert "# TYPE octp_runner_duration_seconds histogram" in text
+    lines = text.splitlines()
+    buckets = [line for line in lines if "_bucket" in line]
+    assert buckets[0] == 'octp_runner_duration_seconds_bucket{le="0.1",runner="ruff"} 0'
+    assert 'octp_runner_duration_seconds_bucket{le="0.5",runner="ruff"} 1' in lines
+    assert (
+        buckets[-1] == 'octp_runner_duration_seconds_bucket{le="+Inf",runner="ruff"} 2'
+    )
+    assert 'octp_runner_duration_seconds_count{runner="ruff"} 2' in lines
+    assert 'octp_runner_results_total{runner="we\\"ird",status="ok"} 1' in lines
+    assert parse(text) == metrics.samples()
+
+    with pytest.raises(ValueError, match="Line 1"):
+        parse("not a sample\n")
+
+
+def test_run_all_records_durations_and_outcomes(tmp_path, fake_runners):
+    timeout = CheckResult(False, "slow@1", None, "", status="timeout")
+    fake_runners.use(
+        [
+            fake_runners("fine", cacheable=False),
+            fake_runners("slow", timeout, cacheable=False),
+            fake_runners("broken", crash=True, cacheable=False),
+        ]
+    )
+    run_all(tmp_path)
+
+    samples = METRICS.samples()
+
+    def value(name, **labels):
+        return samples.get((name, tuple(sorted(labels.items()))))
+
+    for name, status, passed in [
+        ("fine", "ok", "true"),
+        ("slow", "timeout", "false"),
+        ("broken", "crashed", "false"),
+    ]:
+        key = {"runner": name, "status": status, "passed": passed}
+        assert value("octp_runner_results_total", **key) == 1
+        assert value("octp_runner_duration_seconds_count", runner=name) == 1
+    assert value("octp_checks_duration_seconds_count") == 1
+
+
+def test_exporter_accumulates_runs_and_pushes_them(tmp_path, push_url):
+    exporter = MetricsExporter(tmp_path / "octp.prom", push_url + "/metrics/job/octp")
+    for _ in range(2):
+        METRICS.inc("octp_cache_lookups_total", runner="ruff", result="hit")
+        exporter.export(METRICS)
+
+    assert METRICS.samples() == {}
+    text = (tmp_path / "octp.prom").read_text()
+    assert 'octp_cache_lookups_total{result="hit",runner="ruff"} 2' in text
+
+    with urllib.request.urlopen(push_url + "/metrics") as response:
+        assert response.headers["Content-Type"].startswith("text/plain")
+        scraped = response.read().decode()
+    instance = socket.gethostname()
+    assert (
+        f'octp_cache_lookups_total{{instance="{instance}",job="octp",'
+        'result="hit",runner="ruff"} 2'
+    ) in scraped
+
+
+def test_exporter_leaves_a_corrupt_textfile_alone(tmp_path):
+    (tmp_path / "octp.prom").write_text("garbage\n")
+    METRICS.inc("octp_verify_envelopes_total", result="accepted")
+    with pytest.raises(ValueError):
+        MetricsExporter(tmp_path / "octp.prom").export(METRICS)
+    assert (tmp_path / "octp.prom").read_text() == "garbage\n"
+    assert METRICS.samples()
+
+
+def test_exporter_from_config(tmp_path, monkeypatch):
+    monkeypatch.delenv("OCTP_METRICS_TEXTFILE", raising=False)
+    monkeypatch.delenv("OCTP_METRICS_PUSH", raising=False)
+    assert exporter_from_config({}) is None
+
+    path = tmp_path / "octp.prom"
+    exporter = exporter_from_config({"metrics": {"textfile": str(path)}})
+    assert exporter.textfile == path and exporter.push_url is None
+
+    monkeypatch.setenv("OCTP_METRICS_PUSH", "http://gateway:9091/metrics/job/ci/")
+    exporter = exporter_from_config({})
+    assert exporter.textfile.name == "octp.prom"
+    assert exporter.push_url == "http://gateway:9091/metrics/job/ci"
+
+
+def test_grouping_key():
+    assert grouping_key("/metrics/job/octp/instance/ci%2F7") == (
+        ("instance", "ci/7"),
+        ("job", "octp"),
+    )
+    with pytest.raises(ValueError):
+        grouping_key("/metrics/job/octp/instance")
+
+
+def test_verify_many_counts_envelopes(valid_envelope_data):
+    envelope = OCTPEnvelope(**valid_envelope_data)
+    asyncio.run(api.verify_many([envelope, b"not an envelope"]))
+
+    counts = {
+        dict(labels)["result"]: value
+        for (name, labels), value in METRICS.samples().items()
+        if name == "octp_verify_envelopes_total"
+    }
+    assert sum(counts.values()) == 2 and counts["invalid"] >= 1
+    assert METRICS.samples()[("octp_verify_duration_seconds_count", ())] == 1
@@ -0,0 +1,90 @@
+"""Tests for the dmypy-backed mypy runner."""
+
+import json
+import shutil
+
+import git
+import pytest
+
+from octp.verification.mypy_daemon import MypyDaemon
+from octp.verification.mypy_runner import MypyRunner
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("dmypy") is None, reason="dmypy not installed"
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git.Repo.init(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("x: int = 1\n")
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(repo):
+    daemon = MypyDaemon(repo, repo / ".git" / "octp" / "mypy")
+    yield daemon
+    daemon.stop()
+
+
+def _pid(daemon):
+    return json.loads(daemon.status_file.read_text())["pid"]
+
+
+def test_daemon_is_reused_between_checks(daemon, repo):
+    assert daemon.check(["src/app.py"], timeout=60) == (
+        0,
+        "Success: no issues found in 1 source file",
+    )
+    pid = _pid(daemon)
+    assert daemon.cache_dir.is_dir()
+    assert not (repo / ".mypy_cache").exists()
+
+    (repo / "src" / "app.py").write_text("x: int = 'one'\n")
+    status, output = daemon.check(["src/app.py"], timeout=60)
+    assert status == 1 and "Incompatible types" in output
+    assert _pid(daemon) == pid
+
+
+def test_daemon_restarts_when_config_changes(daemon, repo):
+    daemon.check(["src/app.py"], timeout=60)
+    pid = _pid(daemon)
+    daemon.check(["src/app.py"], timeout=60)
+    assert _pid(daemon) == pid
+
+    (repo / "mypy.ini").write_text("[mypy]\ndisallow_untyped_defs = True\n")
+    (repo / "src" / "app.py").write_text("def f(a):\n    return a\n")
+    status, output = daemon.check(["src/app.py"], timeout=60)
+    assert _pid(daemon) != pid
+    assert status == 1 and "missing a type annotation" in output
+
+
+def test_runner_uses_daemon_state_dir(repo):
+    runner = MypyRunner(daemon=True)
+    try:
+        result = runner.run(str(repo), ["src/app.py"])
+        assert result.passed is True
+        assert (repo / ".git" / "octp" / "mypy" / "status.json").exists()
+    finally:
+        runner._daemon_for(str(repo)).stop()
+
+
+def test_linked_worktrees_get_their_own_daemon(repo, tmp_path_factory):
+    main = git.Repo(repo)
+    main.index.add(["src/app.py"])
+    main.index.commit("initial")
+    linked = tmp_path_factory.mktemp("worktrees") / "linked"
+    main.git.worktree("add", "--detach", str(linked))
+    (linked / "src" / "app.py").write_text("x: int = 'one'\n")
+
+    runner = MypyRunner(daemon=True)
+    daemons = [runner._daemon_for(str(repo)), runner._daemon_for(str(linked))]
+    try:
+        assert daemons[0].directory != daemons[1].directory
+        assert runner.run(str(repo), ["src/app.py"]).passed is True
+        assert runner.run(str(linked), ["src/app.py"]).passed is False
+    finally:
+        for daemon in daemons:
+            daemon.stop()
@@ -0,0 +1,49 @@
+"""Tests for envelopes stored as git notes."""
+
+import git
+import pytest
+
+from octp.git.notes import NotesReader, add_note
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    for i in range(3):
+        repo.index.commit(f"commit {i}")
+    return repo
+
+
+def test_notes_round_trip_bytes_exactly(repo):
+    commits = [c.hexsha for c in repo.iter_commits()]
+    payloads = {
+        commits[0]: b'{"a": 1}\n\n  ',  # whitespace git cleanup would strip
+        commits[2]: bytes(range(256)),  # binary, e.g. CBOR
+    }
+    for commit, payload in payloads.items():
+        add_note(payload, commit=commit, path=repo.working_dir)
+
+    with NotesReader(repo.working_dir) as reader:
+        results = dict(reader.read_many(commits))
+    assert results == {
+        commits[0]: payloads[commits[0]],
+        commits[1]: None,
+        commits[2]: payloads[commits[2]],
+    }
+
+
+def test_add_note_replaces_existing(repo):
+    head = repo.head.commit.hexsha
+    add_note(b"first", commit=head, path=repo.working_dir)
+    add_note(b"second", commit=head, path=repo.working_dir)
+    with NotesReader(repo.working_dir) as reader:
+        assert reader.get(head) == b"second"
+
+
+def test_missing_ref_reads_as_empty(repo):
+    with NotesReader(repo.working_dir, ref="refs/notes/none") as reader:
+        assert reader.index == {}
+        assert reader.get(repo.head.commit.hexsha) is None
@@ -0,0 +1,89 @@
+"""Tests for the .octp.toml policy engine."""
+
+import json
+
+import pytest
+
+from octp.core.audit import verify_commit
+from octp.core.envelope import OCTPEnvelope, ReviewLevel
+from octp.core.policy import Policy
+
+STRICT = {
+    "policy": {
+        "require_envelope": True,
+        "minimum_review_level": "moderate_review",
+        "block_on_failed_tests": True,
+        "allow_unreviewed_ai": False,
+    },
+    "identity": {"require_signed_envelope": True},
+}
+
+
+def _envelope(data, **provenance):
+    data = json.loads(json.dumps(data))
+    data["provenance"].update(provenance)
+    return OCTPEnvelope.model_validate(data)
+
+
+def test_policy_reads_policy_and_identity_sections():
+    policy = Policy.from_config(STRICT)
+    assert policy.minimum_review_level is ReviewLevel.MODERATE
+    assert policy.require_signed_envelope is True
+    assert Policy.from_config({}) == Policy()
+
+
+def test_policy_rejects_unknown_review_level():
+    with pytest.raises(ValueError, match="minimum_review_level"):
+        Policy.from_config({"policy": {"minimum_review_level": "skimmed"}})
+
+
+def test_policy_loads_toml_file(tmp_path):
+    path = tmp_path / ".octp.toml"
+    path.write_text('[policy]\nallow_unreviewed_ai = false\n')
+    assert Policy.load(path).allow_unreviewed_ai is False
+
+
+def test_compliant_envelope_passes(valid_envelope_data):
+    policy = Policy.from_config(STRICT).compile()
+    envelope = OCTPEnvelope.model_validate(valid_envelope_data)
+    assert policy.evaluate(envelope) == []
+    assert policy.allows(envelope)
+
+
+def test_violations_are_reported_per_rule(valid_envelope_data):
+    policy = Policy.from_config(STRICT).compile()
+    envelope = _envelope(
+        valid_envelope_data,
+        method="ai_generated_unreviewed",
+        human_review_level="glance",
+    )
+    envelope.verification.tests_passed = False
+    envelope.integrity = None
+    assert [v.rule for v in policy.evaluate(envelope)] == [
+        "allow_unreviewed_ai",
+        "minimum_review_level",
+        "block_on_failed_tests",
+        "require_signed_envelope",
+    ]
+    assert not policy.allows(envelope)
+
+
+def test_review_level_does_not_apply_to_human_only(valid_envelope_data):
+    policy = Policy.from_config(STRICT).compile()
+    envelope = _envelope(
+        valid_envelope_data, method="human_only", human_review_level="none"
+    )
+    assert policy.evaluate(envelope) == []
+
+
+def test_audit_reports_policy_violations(signed_envelope_data, sign_envelope):
+    data = json.loads(json.dumps(signed_envelope_data))
+    data["provenance"]["human_review_level"] = "glance"
+    data = sign_envelope(data)
+    result = verify_commit(
+        data["commit_hash"],
+        [json.dumps(data).encode()],
+        policy=Policy.from_config(STRICT).compile(),
+    )
+    assert result.status == "policy_violation"
+    assert "minimum_review_level" in result.reason
@@ -1,13 +1,16 @@
 """Tests for parallel runner execution and profiles."""
 
+import threading
 from unittest.mock import patch
 
 import pytest
 from octp.verification.base import CheckResult, CheckRunner
 from octp.verification.registry import (
+    CheckProgress,
     get_available_runners,
     get_runners_for_profile,
     run_all,
+    start_all,
 )
 
 
@@ -132,3 +135,44 @@ class TestAvailableRunners:
             get_available_runners(tmp_path, profile="fast", runner_names=["ruff"])
         except Exception:
             pass  # Expected if runners aren't available
+
+
+class BlockingRunner(MockRunner):
+    """Mock runner that waits for the test to release it."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def run(self, repo_root):
+        self.release.wait(5)
+        return super().run(repo_root)
+
+
+class TestBackgroundExecution:
+    """Test running checks alongside other work."""
+
+    def test_start_all_returns_before_checks_finish(self, tmp_path):
+        runner = BlockingRunner()
+        with patch(
+            "octp.verification.registry.get_available_runners",
+            return_value=[runner],
+        ):
+            future = start_all(tmp_path)
+            assert not future.done()
+            runner.release.set()
+            assert future.result(5)["mock"].passed is True
+
+    def test_start_all_propagates_errors(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown profile"):
+            start_all(tmp_path, profile="invalid").result(5)
+
+    def test_progress_reports_each_result(self, tmp_path):
+        progress = CheckProgress()
+        assert progress.status_line() == "checks running…"
+        with patch(
+            "octp.verification.registry.get_available_runners",
+            return_value=[MockRunner(name="a"), MockRunner(name="b", should_fail=True)],
+        ):
+            run_all(tmp_path, on_result=progress)
+        assert progress.status_line() == "checks done: a ✓ b ✗"
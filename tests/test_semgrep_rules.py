@@ -0,0 +1,103 @@
+"""Tests for pinned semgrep rule packs."""
+
+import subprocess
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from octp.verification.semgrep_rules import (
+    fetch_rules,
+    import_rules,
+    list_packs,
+    pack_path,
+)
+from octp.verification.semgrep_runner import SemgrepRunner
+
+RULE = b"""rules:
+  - id: no-eval
+    pattern: eval(...)
+    message: eval
+    languages: [python]
+    severity: ERROR
+"""
+
+
+@pytest.fixture
+def rules_dir(tmp_path):
+    return tmp_path / "store"
+
+
+def test_import_is_content_addressed(tmp_path, rules_dir):
+    source = tmp_path / "rules"
+    source.mkdir()
+    (source / "python.yml").write_bytes(RULE)
+    (source / "README.md").write_text("not a rule")
+
+    digest = import_rules(source, rules_dir)
+    assert import_rules(source, rules_dir) == digest
+    assert sorted(p.name for p in pack_path(digest, rules_dir).iterdir()) == [
+        "python.yml"
+    ]
+
+    (source / "python.yml").write_bytes(RULE.replace(b"ERROR", b"WARNING"))
+    assert import_rules(source, rules_dir) != digest
+    assert len(list_packs(rules_dir)) == 2
+
+
+def test_missing_or_modified_pack_is_rejected(tmp_path, rules_dir):
+    with pytest.raises(RuntimeError, match="not cached"):
+        pack_path("0" * 64, rules_dir)
+
+    (tmp_path / "r.yaml").write_bytes(RULE)
+    digest = import_rules(tmp_path / "r.yaml", rules_dir)
+    (pack_path(digest, rules_dir) / "r.yaml").write_bytes(b"rules: []\n")
+    with pytest.raises(RuntimeError, match="modified"):
+        pack_path(digest, rules_dir)
+
+
+def test_fetch_downloads_registry_configs_once(tmp_path, rules_dir):
+    (tmp_path / "p").mkdir()
+    (tmp_path / "p" / "python").write_bytes(RULE)
+    handler = partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        digest = fetch_rules(["p/python"], rules_dir, registry_url=url)
+        with pytest.raises(RuntimeError, match="Could not fetch"):
+            fetch_rules(["p/missing"], rules_dir, registry_url=url)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert (pack_path(digest, rules_dir) / "p_python.yaml").read_bytes() == RULE
+
+
+def test_pinned_runner_uses_pack_offline_and_records_hash(tmp_path, rules_dir):
+    (tmp_path / "r.yaml").write_bytes(RULE)
+    digest = import_rules(tmp_path / "r.yaml", rules_dir)
+
+    runner = SemgrepRunner()
+    assert runner.cacheable is False
+    runner.configure({"semgrep_rules": f"sha256:{digest}"})
+    assert runner.cacheable is True
+    assert f"rules:{digest}" in runner.cache_inputs()
+
+    completed = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+    with (
+        patch(
+            "octp.verification.semgrep_runner.pack_path",
+            lambda d: pack_path(d, rules_dir),
+        ),
+        patch("subprocess.run", return_value=completed) as run,
+    ):
+        result = runner.run(str(tmp_path), ["app.py"])
+
+    command = run.call_args_list[0].args[0]
+    assert command[command.index("--config") + 1] == str(pack_path(digest, rules_dir))
+    assert "--config=auto" not in command
+    assert result.suite_hash == digest
+    assert result.tool_name.endswith(f"+rules.{digest[:16]}")
@@ -0,0 +1,125 @@
+"""Tests for the local verification server."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from octp.identity.keyring import KeyRing
+from octp.server.base import MAX_BODY_BYTES
+from octp.server.verify import VerifyService, create_verify_server
+
+
+@pytest.fixture
+def keyring(public_key_pem):
+    keyring = KeyRing()
+    keyring.add("github:sara-dev-92", public_key_pem)
+    return keyring
+
+
+@pytest.fixture
+def server(keyring):
+    server = create_verify_server(VerifyService(keyring), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(conn, path, payload):
+    conn.request("POST", path, body=json.dumps(payload))
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_service_verifies_signature(keyring, signed_envelope_data):
+    result = VerifyService(keyring).verify_data(signed_envelope_data)
+    assert result["valid"] is True
+    assert result["signature_verified"] is True
+
+
+def test_service_rejects_tampered_envelope(keyring, signed_envelope_data):
+    signed_envelope_data["verification"]["tests_passed"] = False
+    result = VerifyService(keyring).verify_data(signed_envelope_data)
+    assert result["valid"] is False
+    assert "mismatch" in result["reason"]
+
+
+def test_service_rejects_forged_signature(signed_envelope_data):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    other = ec.generate_private_key(ec.SECP256R1()).public_key()
+    keyring = KeyRing()
+    keyring.add(
+        "github:sara-dev-92",
+        other.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode(),
+    )
+    result = VerifyService(keyring).verify_data(signed_envelope_data)
+    assert result["valid"] is False
+    assert result["signature_verified"] is False
+
+
+def test_single_and_batch_over_one_connection(server, signed_envelope_data):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    try:
+        status, body = _post(conn, "/verify", signed_envelope_data)
+        assert status == 200
+        assert body["valid"] is True
+
+        # Same keep-alive connection serves the batch request
+        status, body = _post(conn, "/verify/batch", [signed_envelope_data, {}])
+        assert status == 200
+        assert [r["valid"] for r in body["results"]] == [True, False]
+    finally:
+        conn.close()
+
+
+def test_batch_requires_array(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    try:
+        status, body = _post(conn, "/verify/batch", {"not": "a list"})
+        assert status == 400
+        assert "array" in body["error"]
+    finally:
+        conn.close()
+
+
+def _post_with_length(server, length):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    try:
+        conn.putrequest("POST", "/verify")
+        conn.putheader("Content-Length", length)
+        conn.endheaders()
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+
+def test_rejects_malformed_content_length(server):
+    status, body = _post_with_length(server, "twelve")
+    assert status == 400
+    assert "Invalid Content-Length" in body["error"]
+
+
+def test_rejects_negative_content_length(server):
+    status, body = _post_with_length(server, "-1")
+    assert status == 400
+    assert "Invalid Content-Length" in body["error"]
+
+
+def test_rejects_content_length_over_limit(server):
+    status, body = _post_with_length(server, str(MAX_BODY_BYTES + 1))
+    assert status == 400
+    assert "too large" in body["error"]
+
+
+def test_keyring_rejects_bad_spec():
+    with pytest.raises(ValueError, match="developer_id=path.pem"):
+        KeyRing.from_specs(["no-equals-sign"])
@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from octp.verification.base import CheckResult
+from octp.verification.detect_secrets_runner import DetectSecretsRunner
+from octp.verification.sharding import (
+    MIN_FILES_PER_SHARD,
+    ShardCosts,
+    merge_results,
+    run_sharded,
+    split,
+)
+
+
+@pytest.fixture
+def counting(fake_runners):
+    """A shardable runner that fails on the files in ``bad``."""
+
+    def make(bad=()):
+        def check(repo_root, files):
+            hits = sorted(set(bad).intersection(files))
+            return CheckResult(
+                passed=not hits,
+                tool_name="counting@1",
+                suite_hash=None,
+                detail=f"bad: {hits[0]}" if hits else "clean",
+                output="".join(f"{h}\n" for h in hits),
+            )
+
+        return fake_runners("counting", check, shardable=True)
+
+    return make
+
+
+def _tree(root, count):
+    files = []
+    for i in range(count):
+        name = f"f{i:03}.py"
+        (root / name).write_text("x" * (i + 1))
+        files.append(name)
+    return files
+
+
+def test_split_balances_by_weight():
+    weights = {"a": 8.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0, "f": 2.0}
+    shards = split(weights, 3)
+    loads = sorted(sum(weights[f] for f in s) for s in shards)
+    assert loads == [10.0, 11.0, 11.0]
+    assert sorted(f for s in shards for f in s) == sorted(weights)
+
+
+def test_small_file_lists_are_not_sharded(tmp_path, counting):
+    runner = counting()
+    files = _tree(tmp_path, MIN_FILES_PER_SHARD)
+    run_sharded(runner, tmp_path, files, shards=8)
+    assert runner.calls == [files]
+
+
+def test_run_sharded_covers_every_file_once_and_merges(tmp_path, counting):
+    runner = counting(bad={"f010.py", "f090.py"})
+    files = _tree(tmp_path, 4 * MIN_FILES_PER_SHARD)
+
+    result = run_sharded(runner, tmp_path, files, shards=4, costs_dir=tmp_path)
+
+    assert len(runner.calls) == 4
+    assert sorted(f for call in runner.calls for f in call) == files
+    assert not result.passed
+    assert result.detail == "bad: f010.py"
+    assert sorted(result.output.split()) == ["f010.py", "f090.py"]
+    costs = json.loads((tmp_path / "counting.json").read_text())
+    assert set(costs) == set(files)
+
+
+def test_past_costs_outweigh_file_size(tmp_path):
+    files = _tree(tmp_path, 4)  # sizes 1, 2, 3, 4 bytes
+    costs = ShardCosts(None)
+    costs.costs = {"f000.py": 5.0, "f001.py": 10.0}
+    weights = costs.weights(tmp_path, files)
+    # Seen files use their cost; unseen ones the median rate (5 s/byte)
+    assert weights == {
+        "f000.py": 5.0,
+        "f001.py": 10.0,
+        "f002.py": 15.0,
+        "f003.py": 20.0,
+    }
+    assert sorted(split(weights, 2)) == [["f000.py", "f003.py"], ["f001.py", "f002.py"]]
+
+
+def test_merge_keeps_worst_status():
+    ok = CheckResult(True, "t", None, "fine")
+    timeout = CheckResult(False, "t", None, "timed out", status="timeout")
+    merged = merge_results([ok, timeout])
+    assert merged.status == "timeout" and merged.detail == "timed out"
+
+
+def test_detect_secrets_merge_combines_json_reports():
+    def shard(results):
+        return CheckResult(
+            passed=not results,
+            tool_name="detect-secrets",
+            suite_hash=None,
+            detail="",
+            output=json.dumps({"version": "1.5.0", "results": results}),
+        )
+
+    merged = DetectSecretsRunner().merge(
+        [shard({"a.py": [{"type": "Secret Keyword"}]}), shard({}), shard({"b.env": []})]
+    )
+    assert not merged.passed
+    assert merged.detail == "Secrets found: 2"
+    assert set(json.loads(merged.output)["results"]) == {"a.py", "b.env"}
+
+
+def test_configure_sets_shard_count(counting):
+    runner = counting()
+    runner.configure({"shards": 3})
+    assert runner.shards == 3
+    runner.configure({})
+    assert runner.shards >= 1
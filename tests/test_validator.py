@@ -0,0 +1,53 @@
+"""Tests for the byte-level validation layer."""
+
+import json
+
+import pytest
+
+from octp.core.validator import (
+    envelope_adapter,
+    validate_envelope_array,
+    validate_envelope_bytes,
+    validate_envelope_file,
+    validate_envelope_json,
+)
+
+
+def test_valid_bytes(valid_envelope_data):
+    result = validate_envelope_bytes(json.dumps(valid_envelope_data).encode())
+    assert result.valid
+    assert result.envelope.contribution_id == valid_envelope_data["contribution_id"]
+
+
+def test_errors_are_structured(valid_envelope_data):
+    valid_envelope_data["provenance"]["method"] = "vibes"
+    result = validate_envelope_bytes(json.dumps(valid_envelope_data).encode())
+    assert not result.valid
+    assert [(e.loc, e.type) for e in result.errors] == [("provenance.method", "enum")]
+    assert validate_envelope_json(valid_envelope_data) is False
+
+
+def test_invalid_json_is_reported(tmp_path):
+    path = tmp_path / "envelope.json"
+    path.write_text("{not json")
+    valid, message = validate_envelope_file(path)
+    assert not valid
+    assert message.startswith("Invalid JSON")
+
+
+def test_array_attributes_errors_to_elements(valid_envelope_data):
+    broken = dict(valid_envelope_data, commit_hash=None)
+    results = validate_envelope_array(
+        json.dumps([valid_envelope_data, broken, valid_envelope_data]).encode()
+    )
+    assert [r.valid for r in results] == [True, False, True]
+    assert results[1].errors[0].loc == "commit_hash"
+
+
+def test_array_rejects_non_array():
+    with pytest.raises(ValueError, match="array"):
+        validate_envelope_array(b'{"a": 1}')
+
+
+def test_adapter_is_cached():
+    assert envelope_adapter() is envelope_adapter()
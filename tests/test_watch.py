@@ -0,0 +1,104 @@
+"""Tests for watch mode."""
+
+import sys
+import threading
+import time
+
+import git
+import pytest
+
+from octp.verification.cache import LocalCache
+from octp.verification.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    wait_for_changes,
+    watch,
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git.Repo.init(tmp_path)
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("x = 1\n")
+    (tmp_path / "build").mkdir()
+    return tmp_path
+
+
+def _wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.05)
+
+
+def test_polling_watcher_reports_changes(repo):
+    watcher = PollingWatcher(repo, interval=0.05)
+    assert watcher.wait(0.1) == set()
+    (repo / "src" / "b.py").write_text("y = 2\n")
+    (repo / "build" / "out.o").write_text("ignored")
+    assert watcher.wait(2) == {"src/b.py"}
+    (repo / "src" / "a.py").unlink()
+    assert watcher.wait(2) == {"src/a.py"}
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only")
+def test_inotify_watcher_follows_new_directories(repo):
+    watcher = InotifyWatcher(repo)
+    try:
+        (repo / "pkg").mkdir()
+        assert "pkg" in watcher.wait(2)
+        (repo / "pkg" / "mod.py").write_text("z = 3\n")
+        assert "pkg/mod.py" in watcher.wait(2)
+        (repo / "build" / "out.o").write_text("ignored")
+        assert watcher.wait(0.2) == set()
+    finally:
+        watcher.close()
+
+
+def test_wait_for_changes_debounces(repo):
+    watcher = PollingWatcher(repo, interval=0.02)
+
+    def edit():
+        for i in range(3):
+            (repo / "src" / f"f{i}.py").write_text("")
+            time.sleep(0.05)
+
+    thread = threading.Thread(target=edit)
+    thread.start()
+    changed = wait_for_changes(watcher, quiet=0.3)
+    thread.join()
+    assert changed == {"src/f0.py", "src/f1.py", "src/f2.py"}
+
+
+def test_watch_reruns_only_when_tree_changes(repo, fake_runners):
+    runner = fake_runners("counting")
+    fake_runners.use([runner])
+    stop = threading.Event()
+    runs = []
+    watcher = PollingWatcher(repo, interval=0.02)
+
+    thread = threading.Thread(
+        target=watch,
+        args=(repo, LocalCache(repo / ".git" / "octp" / "cache")),
+        kwargs={
+            "debounce": 0.1,
+            "watcher": watcher,
+            "on_run": lambda tree, results: runs.append(tree),
+            "stop": stop,
+        },
+    )
+    thread.start()
+    try:
+        _wait_until(lambda: len(runs) == 1)
+        (repo / "src" / "a.py").write_text("x = 2\n")
+        _wait_until(lambda: len(runs) == 2)
+        (repo / "src" / "a.py").write_text("x = 1\n")  # back to a cached tree
+        _wait_until(lambda: len(runs) == 3)
+    finally:
+        stop.set()
+        thread.join(5)
+
+    assert len(runner.calls) == 2
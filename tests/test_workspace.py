@@ -0,0 +1,77 @@
+import threading
+import time
+
+from octp.verification.base import CheckResult
+from octp.verification.workspace import discover_repos, run_workspace
+
+
+class Concurrency:
+    """A check that sleeps briefly and records how many ran at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, repo_root, files):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return CheckResult(True, "slow@1", None, repo_root)
+
+
+def _repo(path, git_file=False):
+    path.mkdir(parents=True)
+    if git_file:
+        (path / ".git").write_text("gitdir: elsewhere\n")
+    else:
+        (path / ".git").mkdir()
+    return path
+
+
+def test_discover_repos_stops_at_repositories(tmp_path):
+    a = _repo(tmp_path / "a")
+    _repo(tmp_path / "a" / "vendored")  # inside a: signed with it
+    b = _repo(tmp_path / "group" / "b", git_file=True)  # a linked worktree
+    _repo(tmp_path / ".cache" / "c")
+    _repo(tmp_path / "node_modules" / "d")
+    (tmp_path / "plain").mkdir()
+
+    assert discover_repos(tmp_path) == [a, b]
+    assert discover_repos(a) == [a]
+
+
+def test_run_workspace_bounds_runners_across_repos(tmp_path, fake_runners):
+    repos = [tmp_path / f"r{i}" for i in range(4)]
+    slow = Concurrency()
+    done = []
+
+    fake_runners.use(
+        lambda root: [
+            fake_runners(f"check{i}", slow, cacheable=False) for i in range(3)
+        ]
+    )
+    results = run_workspace(
+        repos, jobs=2, on_repo=lambda repo, outcome: done.append(repo)
+    )
+
+    assert slow.peak == 2
+    assert sorted(done) == repos
+    for repo in repos:
+        assert {r.detail for r in results[repo].values()} == {str(repo)}
+
+
+def test_run_workspace_reports_per_repo_errors(tmp_path, fake_runners):
+    def runners(repo_root):
+        if repo_root.name == "bad":
+            raise ValueError("Unknown profile: nope")
+        return [fake_runners("check", cacheable=False)]
+
+    fake_runners.use(runners)
+    results = run_workspace([tmp_path / "bad", tmp_path / "good"], jobs=2)
+
+    assert isinstance(results[tmp_path / "bad"], ValueError)
+    assert results[tmp_path / "good"]["check"].passed